@@ -1,6 +1,6 @@
 import React, {useEffect, useRef, useState} from 'react';
 import styles from './Agents.module.css';
-import {getExecutionFeeds, getDateTime} from "@/pages/api/DashboardService";
+import {getExecutionFeeds, getDateTime, subscribeToAgentExecutionEvents} from "@/pages/api/DashboardService";
 import Image from "next/image";
 import {loadingTextEffect, formatTimeDifference, convertWaitingPeriod, updateDateBasedOnValue} from "@/utils/utils";
 import {EventBus} from "@/utils/eventBus";
@@ -17,16 +17,30 @@ export default function ActivityFeed({selectedRunId, selectedView, setFetchedDat
   const [isLoading, setIsLoading] = useState(true);
   const [waitingPeriod, setWaitingPeriod] = useState(null);
   const [errorMsg, setErrorMsg] = useState('');
+  const [eventsConnected, setEventsConnected] = useState(false);
 
   useEffect(() => {
+    if (!agent?.id) {
+      return;
+    }
+    setEventsConnected(true);
+    return subscribeToAgentExecutionEvents(agent.id, (event) => {
+      if (event.agent_execution_id === selectedRunId) {
+        fetchFeeds();
+      }
+    }, () => setEventsConnected(false));
+  }, [agent?.id, selectedRunId]);
+
+  useEffect(() => {
+    // while the events are streamed, polling only catches up on anything missed
     const interval = window.setInterval(function () {
       if (selectedRunStatus !== "ERROR_PAUSED") {
         fetchFeeds();
       }
-    }, 5000);
+    }, eventsConnected ? 30000 : 5000);
 
     return () => clearInterval(interval);
-  }, [selectedRunId, selectedRunStatus]);
+  }, [selectedRunId, selectedRunStatus, eventsConnected]);
 
   function fetchDateTime() {
     getDateTime(agent.id)
@@ -11,6 +11,7 @@ import axios from 'axios';
 import {
   deleteMarketplaceKnowledge,
   fetchKnowledgeTemplateOverview,
+  getKnowledgeInstallationStatus,
   getValidMarketplaceIndices,
   installKnowledgeTemplate
 } from "@/pages/api/DashboardService";
@@ -116,13 +117,32 @@ export default function KnowledgeTemplate({template, env}) {
 
     installKnowledgeTemplate(template.name, indexId)
       .then((response) => {
+        waitForInstallation(response.data.id);
+      })
+      .catch((error) => {
+        toast.error("Error installing Knowledge: ", {autoClose: 1800});
+        console.error('Error installing Knowledge:', error);
+        setInstalled('Install');
+      });
+  }
+
+  function waitForInstallation(installationId) {
+    getKnowledgeInstallationStatus(installationId)
+      .then((response) => {
+        if (response.data.status === 'COMPLETED') {
           toast.success("Knowledge installed", {autoClose: 1800});
           setInstalled('Installed');
           EventBus.emit('reFetchKnowledge', {});
+        } else if (response.data.status === 'FAILED') {
+          toast.error("Error installing Knowledge: ", {autoClose: 1800});
+          console.error('Error installing Knowledge:', response.data.error);
+          setInstalled('Install');
+        } else {
+          setTimeout(() => waitForInstallation(installationId), 3000);
+        }
       })
       .catch((error) => {
-        toast.error("Error installing Knowledge: ", {autoClose: 1800});
-        console.error('Error installing Knowledge:', error);
+        console.error('Error fetching Knowledge installation status:', error);
         setInstalled('Install');
       });
   }
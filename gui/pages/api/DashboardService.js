@@ -1,4 +1,5 @@
-import api from './apiConfig';
+import api, {baseUrl} from './apiConfig';
+import Cookies from "js-cookie";
 
 export const getOrganisation = (userId) => {
   return api.get(`/organisations/get/user/${userId}`);
@@ -40,6 +41,52 @@ export const getExecutionFeeds = (executionId) => {
   return api.get(`/agentexecutionfeeds/get/execution/${executionId}`);
 };
 
+export const subscribeToAgentExecutionEvents = (agentId, onEvent, onClose) => {
+  // EventSource can't send the Authorization header, so the server-sent events are read through fetch
+  const controller = new AbortController();
+  const headers = {};
+  const accessToken = Cookies.get("accessToken");
+  if (accessToken) {
+    headers['Authorization'] = `Bearer ${accessToken}`;
+  }
+
+  fetch(`${baseUrl()}/agent-execution-events?agent_id=${agentId}`, {headers, signal: controller.signal})
+    .then(async (response) => {
+      if (!response.ok) {
+        throw new Error(`Agent execution events unavailable: ${response.status}`);
+      }
+      const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+      let buffer = '';
+      while (true) {
+        const {value, done} = await reader.read();
+        if (done) {
+          break;
+        }
+        buffer += value;
+        const messages = buffer.split('\n\n');
+        buffer = messages.pop();
+        messages.forEach((message) => {
+          const data = message.split('\n').find((line) => line.startsWith('data: '));
+          if (data) {
+            onEvent(JSON.parse(data.slice('data: '.length)));
+          }
+        });
+      }
+    })
+    .catch((error) => {
+      if (error.name !== 'AbortError') {
+        console.error('Error reading agent execution events:', error);
+      }
+    })
+    .finally(() => {
+      if (!controller.signal.aborted) {
+        onClose();
+      }
+    });
+
+  return () => controller.abort();
+};
+
 export const getExecutionTasks = (executionId) => {
   return api.get(`/agentexecutionfeeds/get/tasks/${executionId}`);
 };
@@ -308,6 +355,10 @@ export const installKnowledgeTemplate = (knowledgeName, indexId) => {
   return api.get(`/knowledges/install/${knowledgeName}/index/${indexId}`);
 };
 
+export const getKnowledgeInstallationStatus = (installationId) => {
+  return api.get(`/knowledges/install/status/${installationId}`);
+};
+
 export const createApiKey = (apiName) => {
   return api.post(`/api-keys`, apiName);
 };
@@ -1,8 +1,11 @@
+from typing import Optional
+
 import requests
 from fastapi import FastAPI, HTTPException, Depends, Request, status, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.responses import RedirectResponse
+from fastapi.responses import StreamingResponse
 from fastapi_jwt_auth import AuthJWT
 from fastapi_jwt_auth.exceptions import AuthJWTException
 from fastapi_sqlalchemy import DBSessionMiddleware, db
@@ -43,15 +46,20 @@ from superagi.controllers.api_key import router as api_key_router
 from superagi.controllers.api.agent import router as api_agent_router
 from superagi.controllers.webhook import router as web_hook_router
 from superagi.helper.tool_helper import register_toolkits, register_marketplace_toolkits
+from superagi.helper.auth import get_user_organisation
+from superagi.lib.execution_event_channel import ExecutionEventChannel
 from superagi.lib.logger import logger
+from superagi.lib.redis_pool import RedisPool
 from superagi.llms.google_palm import GooglePalm
 from superagi.llms.llm_model_factory import build_model_with_api_key
 from superagi.llms.openai import OpenAi
 from superagi.llms.replicate import Replicate
 from superagi.llms.hugging_face import HuggingFace
+from superagi.models.agent import Agent
 from superagi.models.agent_template import AgentTemplate
 from superagi.models.models_config import ModelsConfig
 from superagi.models.organisation import Organisation
+from superagi.models.project import Project
 from superagi.models.types.login_request import LoginRequest
 from superagi.models.types.validate_llm_api_key_request import ValidateAPIKeyRequest
 from superagi.models.user import User
@@ -377,6 +385,26 @@ async def say_hello(name: str, Authorize: AuthJWT = Depends()):
     Authorize.jwt_required()
     return {"message": f"Hello {name}"}
 
+@app.get("/redis-pool-metrics")
+def redis_pool_metrics(Authorize: AuthJWT = Depends()):
+    """Get the usage of the Redis connection pool of this process"""
+
+    Authorize.jwt_required()
+    return RedisPool.get_metrics()
+
+@app.get("/agent-execution-events")
+def agent_execution_events(request: Request, agent_id: Optional[int] = None,
+                           organisation=Depends(get_user_organisation)):
+    """Stream the status changes and new feeds of the organisation's agent executions as server-sent events"""
+
+    if agent_id is not None:
+        agent = Agent.get_active_agent_by_id(db.session, agent_id)
+        if agent is None or Project.find_by_id(db.session, agent.project_id).organisation_id != organisation.id:
+            raise HTTPException(status_code=404, detail="Agent not found")
+    return StreamingResponse(ExecutionEventChannel.server_sent_events(request, organisation.id, agent_id),
+                             media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
 @app.get('/get/github_client_id')
 def github_client_id():
     """Get GitHub Client ID"""
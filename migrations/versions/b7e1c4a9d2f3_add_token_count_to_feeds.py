@@ -0,0 +1,54 @@
+"""add token count to agent execution feeds
+
+Revision ID: b7e1c4a9d2f3
+Revises: 9270eb5a8475
+Create Date: 2026-10-18 10:12:41.518305
+
+"""
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e1c4a9d2f3'
+down_revision = '9270eb5a8475'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+logger = logging.getLogger("alembic")
+
+
+def upgrade() -> None:
+    op.add_column('agent_execution_feeds', sa.Column('token_count', sa.Integer(), nullable=True))
+    _backfill_token_counts()
+
+
+def downgrade() -> None:
+    op.drop_column('agent_execution_feeds', 'token_count')
+
+
+def _backfill_token_counts():
+    # Rows left NULL are tokenized on read, so the backfill is skipped if the encoding can't be loaded
+    try:
+        import tiktoken
+        encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"Skipping agent_execution_feeds token_count backfill: {e}")
+        return
+
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        rows = conn.execute(sa.text("SELECT id, feed FROM agent_execution_feeds "
+                                    "WHERE id > :last_id AND token_count IS NULL ORDER BY id LIMIT :limit"),
+                            {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE}).fetchall()
+        if not rows:
+            break
+        token_counts = encoding.encode_batch([row.feed or "" for row in rows])
+        conn.execute(sa.text("UPDATE agent_execution_feeds SET token_count = :token_count WHERE id = :id"),
+                     [{"id": row.id, "token_count": len(tokens)} for row, tokens in zip(rows, token_counts)])
+        last_id = rows[-1].id
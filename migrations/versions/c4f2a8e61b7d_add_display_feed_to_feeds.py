@@ -0,0 +1,80 @@
+"""add display feed to agent execution feeds
+
+Revision ID: c4f2a8e61b7d
+Revises: b7e1c4a9d2f3
+Create Date: 2026-10-18 14:36:09.207114
+
+"""
+import json
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4f2a8e61b7d'
+down_revision = 'b7e1c4a9d2f3'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+CURRENT_TIME_FEED_PATTERN = re.compile(
+    r"The current time and date is\s(\w{3}\s\w{3}\s\s?\d{1,2}\s\d{2}:\d{2}:\d{2}\s\d{4})")
+
+
+def upgrade() -> None:
+    op.add_column('agent_execution_feeds', sa.Column('display_feed', sa.Text(), nullable=True))
+    op.add_column('agent_execution_feeds', sa.Column('is_visible', sa.Boolean(), nullable=True))
+    _backfill_display_feeds()
+
+
+def downgrade() -> None:
+    op.drop_column('agent_execution_feeds', 'is_visible')
+    op.drop_column('agent_execution_feeds', 'display_feed')
+
+
+def _backfill_display_feeds():
+    # Same rendering as superagi.helper.feed_parser at the time of this revision
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        rows = conn.execute(sa.text("SELECT id, role, feed FROM agent_execution_feeds "
+                                    "WHERE id > :last_id ORDER BY id LIMIT :limit"),
+                            {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE}).fetchall()
+        if not rows:
+            break
+        conn.execute(sa.text("UPDATE agent_execution_feeds SET display_feed = :display_feed, is_visible = :is_visible "
+                             "WHERE id = :id"),
+                     [{"id": row.id, "display_feed": _render_display(row.role, row.feed),
+                       "is_visible": bool(row.feed) and CURRENT_TIME_FEED_PATTERN.search(row.feed) is None}
+                      for row in rows])
+        last_id = rows[-1].id
+
+
+def _render_display(role, feed):
+    if role == "assistant":
+        try:
+            parsed = json.loads(feed, strict=False)
+            display = ""
+            if "reasoning" in parsed["thoughts"]:
+                display = "Thoughts: " + parsed["thoughts"]["reasoning"] + "\n"
+            if "plan" in parsed["thoughts"]:
+                display += "Plan: " + str(parsed["thoughts"]["plan"]) + "\n"
+            if "criticism" in parsed["thoughts"]:
+                display += "Criticism: " + parsed["thoughts"]["criticism"] + "\n"
+            if "tool" in parsed:
+                display += "Tool: " + parsed["tool"]["name"] + "\n"
+            if "command" in parsed:
+                display += "Tool: " + parsed["command"]["name"] + "\n"
+            return display
+        except Exception:
+            return feed
+    if role == "system":
+        if feed and "json-schema.org" in feed:
+            return feed.split("TOOLS:")[0]
+        return feed
+    if role == "user":
+        return feed
+    return None
@@ -0,0 +1,38 @@
+"""add knowledge installations
+
+Revision ID: e5a9d3c71f20
+Revises: c4f2a8e61b7d
+Create Date: 2026-10-18 17:02:44.518230
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a9d3c71f20'
+down_revision = 'c4f2a8e61b7d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('knowledge_installations',
+                    sa.Column('id', sa.Integer(), nullable=False),
+                    sa.Column('knowledge_name', sa.String(), nullable=True),
+                    sa.Column('vector_db_index_id', sa.Integer(), nullable=True),
+                    sa.Column('organisation_id', sa.Integer(), nullable=True),
+                    sa.Column('status', sa.String(), nullable=True),
+                    sa.Column('installed_chunks', sa.Integer(), nullable=True),
+                    sa.Column('error', sa.Text(), nullable=True),
+                    sa.Column('created_at', sa.DateTime(), nullable=True),
+                    sa.Column('updated_at', sa.DateTime(), nullable=True),
+                    sa.PrimaryKeyConstraint('id')
+                    )
+    op.create_index(op.f('ix_knowledge_installations_organisation_id'), 'knowledge_installations',
+                    ['organisation_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_knowledge_installations_organisation_id'), table_name='knowledge_installations')
+    op.drop_table('knowledge_installations')
@@ -0,0 +1,67 @@
+"""add analytics rollups
+
+Revision ID: f3b7c91d2e48
+Revises: e5a9d3c71f20
+Create Date: 2026-10-18 19:41:08.302117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b7c91d2e48'
+down_revision = 'e5a9d3c71f20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('agent_analytics_rollups',
+                    sa.Column('id', sa.Integer(), nullable=False),
+                    sa.Column('org_id', sa.Integer(), nullable=True),
+                    sa.Column('agent_id', sa.Integer(), nullable=True),
+                    sa.Column('day', sa.Date(), nullable=True),
+                    sa.Column('agent_name', sa.String(), nullable=True),
+                    sa.Column('model', sa.String(), nullable=True),
+                    sa.Column('agents_created', sa.Integer(), nullable=True),
+                    sa.Column('runs_completed', sa.Integer(), nullable=True),
+                    sa.Column('tokens_consumed', sa.Integer(), nullable=True),
+                    sa.Column('calls', sa.Integer(), nullable=True),
+                    sa.Column('run_time_total', sa.Float(), nullable=True),
+                    sa.Column('timed_runs', sa.Integer(), nullable=True),
+                    sa.Column('created_at', sa.DateTime(), nullable=True),
+                    sa.Column('updated_at', sa.DateTime(), nullable=True),
+                    sa.PrimaryKeyConstraint('id')
+                    )
+    op.create_index('ix_aar_org_id_agent_id_day', 'agent_analytics_rollups', ['org_id', 'agent_id', 'day'],
+                    unique=True)
+    op.create_index('ix_aar_day', 'agent_analytics_rollups', ['day'], unique=False)
+
+    op.create_table('tool_analytics_rollups',
+                    sa.Column('id', sa.Integer(), nullable=False),
+                    sa.Column('org_id', sa.Integer(), nullable=True),
+                    sa.Column('agent_id', sa.Integer(), nullable=True),
+                    sa.Column('tool_name', sa.String(), nullable=True),
+                    sa.Column('day', sa.Date(), nullable=True),
+                    sa.Column('calls', sa.Integer(), nullable=True),
+                    sa.Column('created_at', sa.DateTime(), nullable=True),
+                    sa.Column('updated_at', sa.DateTime(), nullable=True),
+                    sa.PrimaryKeyConstraint('id')
+                    )
+    op.create_index('ix_tar_org_id_tool_name_agent_id_day', 'tool_analytics_rollups',
+                    ['org_id', 'tool_name', 'agent_id', 'day'], unique=True)
+    op.create_index('ix_tar_day', 'tool_analytics_rollups', ['day'], unique=False)
+
+    # the rollup job reads the events of the last days
+    op.create_index(op.f('ix_events_created_at'), 'events', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_events_created_at'), table_name='events')
+    op.drop_index('ix_tar_day', table_name='tool_analytics_rollups')
+    op.drop_index('ix_tar_org_id_tool_name_agent_id_day', table_name='tool_analytics_rollups')
+    op.drop_table('tool_analytics_rollups')
+    op.drop_index('ix_aar_day', table_name='agent_analytics_rollups')
+    op.drop_index('ix_aar_org_id_agent_id_day', table_name='agent_analytics_rollups')
+    op.drop_table('agent_analytics_rollups')
@@ -1,4 +1,5 @@
 from datetime import datetime
+import hashlib
 import json
 from sqlalchemy import asc
 from sqlalchemy.sql.operators import and_
@@ -6,9 +7,10 @@ import logging
 import superagi
 from superagi.agent.agent_message_builder import AgentLlmMessageBuilder
 from superagi.agent.agent_prompt_builder import AgentPromptBuilder
+from superagi.agent.agent_step_context import AgentStepContext
 from superagi.agent.output_handler import ToolOutputHandler, get_output_handler
 from superagi.agent.task_queue import TaskQueue
-from superagi.agent.tool_builder import ToolBuilder
+from superagi.agent.tool_builder import ToolBuilder, ExecutionToolCache
 from superagi.apm.event_handler import EventHandler
 from superagi.config.config import get_config
 from superagi.helper.error_handler import ErrorHandler
@@ -34,29 +36,41 @@ from superagi.apm.call_log_helper import CallLogHelper
 
 class AgentIterationStepHandler:
     """ Handles iteration workflow steps in the agent workflow."""
-    def __init__(self, session, llm, agent_id: int, agent_execution_id: int, memory=None):
+    def __init__(self, session, llm, agent_id: int, agent_execution_id: int, memory=None,
+                 step_context: AgentStepContext = None):
         self.session = session
         self.llm = llm
         self.agent_execution_id = agent_execution_id
         self.agent_id = agent_id
         self.memory = memory
-        self.organisation = Agent.find_org_by_agent_id(self.session, agent_id=self.agent_id)
+        self.step_context = step_context
+        if step_context is not None:
+            self.organisation = step_context.organisation
+        else:
+            self.organisation = Agent.find_org_by_agent_id(self.session, agent_id=self.agent_id)
         self.task_queue = TaskQueue(str(self.agent_execution_id))
 
     def execute_step(self):
-        agent_config = Agent.fetch_configuration(self.session, self.agent_id)
+        if self.step_context is not None:
+            agent_config = self.step_context.agent_config
+            agent_execution_config = self.step_context.agent_execution_config
+        else:
+            agent_config = Agent.fetch_configuration(self.session, self.agent_id)
+            agent_execution_config = AgentExecutionConfiguration.fetch_configuration(self.session,
+                                                                                     self.agent_execution_id)
         execution = AgentExecution.get_agent_execution_from_id(self.session, self.agent_execution_id)
         iteration_workflow_step = IterationWorkflowStep.find_by_id(self.session, execution.iteration_workflow_step_id)
-        agent_execution_config = AgentExecutionConfiguration.fetch_configuration(self.session, self.agent_execution_id)
         if not self._handle_wait_for_permission(execution, agent_config, agent_execution_config,
                                                 iteration_workflow_step):
             return
 
         workflow_step = AgentWorkflowStep.find_by_id(self.session, execution.current_agent_step_id)
-        organisation = Agent.find_org_by_agent_id(self.session, agent_id=self.agent_id)
+        organisation = self.organisation
         iteration_workflow = IterationWorkflow.find_by_id(self.session, workflow_step.action_reference_id)
-        agent_feeds = AgentExecutionFeed.fetch_agent_execution_feeds(self.session, self.agent_execution_id)
-        if not agent_feeds:
+        message_builder = AgentLlmMessageBuilder(self.session, self.llm, self.llm.get_model(), self.agent_id,
+                                                 self.agent_execution_id)
+        agent_feeds = message_builder.fetch_agent_feeds()
+        if not message_builder.has_agent_feeds:
             self.task_queue.clear_tasks()
 
         agent_tools = self._build_tools(agent_config, agent_execution_config)
@@ -66,9 +80,9 @@ class AgentIterationStepHandler:
                                           prompt=iteration_workflow_step.prompt,
                                           agent_tools=agent_tools)
 
-        messages = AgentLlmMessageBuilder(self.session, self.llm, self.llm.get_model(), self.agent_id, self.agent_execution_id) \
-            .build_agent_messages(prompt, agent_feeds, history_enabled=iteration_workflow_step.history_enabled,
-                                  completion_prompt=iteration_workflow_step.completion_prompt)
+        messages = message_builder.build_agent_messages(prompt, agent_feeds,
+                                                        history_enabled=iteration_workflow_step.history_enabled,
+                                                        completion_prompt=iteration_workflow_step.completion_prompt)
 
         logger.debug("Prompt messages:", messages)
         current_tokens = TokenCounter.count_message_tokens(messages = messages, model = self.llm.get_model())
@@ -91,7 +105,8 @@ class AgentIterationStepHandler:
             tool_name = ''
 
         CallLogHelper(session=self.session, organisation_id=organisation.id).create_call_log(execution.name,
-                                                                                             agent_config['agent_id'], total_tokens, tool_name, agent_config['model'])
+                                                                                             agent_config['agent_id'], total_tokens, tool_name, agent_config['model'],
+                                                                                             buffered=True)
 
         assistant_reply = response['content']
         output_handler = get_output_handler(iteration_workflow_step.output_type,
@@ -136,35 +151,53 @@ class AgentIterationStepHandler:
                             agent_execution_config: dict,
                             prompt: str, agent_tools: list):
         max_token_limit = int(get_config("MAX_TOOL_TOKEN_LIMIT", 600))
+        tools_string = ExecutionToolCache.get_tools_prompt(self.agent_execution_id, agent_tools,
+                                                           not iteration_workflow.has_task_queue,
+                                                           AgentPromptBuilder.add_tools_to_prompt)
         prompt = AgentPromptBuilder.replace_main_variables(prompt, agent_execution_config["goal"],
                                                            agent_execution_config["instruction"],
                                                            agent_config["constraints"], agent_tools,
-                                                           (not iteration_workflow.has_task_queue))
+                                                           (not iteration_workflow.has_task_queue),
+                                                           tools_string=tools_string)
         if iteration_workflow.has_task_queue:
-            response = self.task_queue.get_last_task_details()
+            task_details = self.task_queue.get_task_details()
+            response = task_details["last_task_details"]
             last_task, last_task_result = (response["task"], response["response"]) if response is not None else ("", "")
-            current_task = self.task_queue.get_first_task() or ""
+            current_task = task_details["current_task"] or ""
             token_limit = TokenCounter(session=self.session, organisation_id=self.organisation.id).token_limit() - max_token_limit
             prompt = AgentPromptBuilder.replace_task_based_variables(prompt, current_task, last_task, last_task_result,
-                                                                     self.task_queue.get_tasks(),
-                                                                     self.task_queue.get_completed_tasks(), token_limit)
+                                                                     task_details["tasks"],
+                                                                     task_details["completed_tasks"], token_limit)
         return prompt
 
     def _build_tools(self, agent_config: dict, agent_execution_config: dict):
         agent_tools = [ThinkingTool()]
 
-        config_data = AgentConfiguration.get_model_api_key(self.session, self.agent_id, agent_config["model"])
-        model_api_key = config_data['api_key']
+        if self.step_context is not None:
+            model_api_key = self.step_context.model_api_key
+        else:
+            config_data = AgentConfiguration.get_model_api_key(self.session, self.agent_id, agent_config["model"])
+            model_api_key = config_data['api_key']
         tool_builder = ToolBuilder(self.session, self.agent_id, self.agent_execution_id)
         resource_summary = ResourceSummarizer(session=self.session, agent_id=self.agent_id, model=agent_config['model']).fetch_or_create_agent_resource_summary(default_summary=agent_config.get("resource_summary"))
+        fingerprint = (json.dumps(sorted(agent_execution_config["tools"])), agent_config["model"],
+                       hashlib.sha256(str(model_api_key).encode("utf-8")).hexdigest(), resource_summary,
+                       json.dumps([agent_execution_config["goal"], agent_execution_config["instruction"]]))
+        cached_tools = ExecutionToolCache.get(self.agent_execution_id, fingerprint)
+        if cached_tools is not None:
+            return tool_builder.bind_tools(cached_tools, self.memory)
+
         if resource_summary is not None:
             agent_tools.append(QueryResourceTool())
         user_tools = self.session.query(Tool).filter(
             and_(Tool.id.in_(agent_execution_config["tools"]), Tool.file_name is not None)).all()
+        toolkit_keys, toolkit_version = ExecutionToolCache.fetch_version([tool.toolkit_id for tool in user_tools])
         for tool in user_tools:
             agent_tools.append(tool_builder.build_tool(tool))
         agent_tools = [tool_builder.set_default_params_tool(tool, agent_config, agent_execution_config,
-                                                            model_api_key, resource_summary,self.memory) for tool in agent_tools]
+                                                            model_api_key, resource_summary,self.memory,
+                                                            organisation=self.organisation) for tool in agent_tools]
+        ExecutionToolCache.put(self.agent_execution_id, fingerprint, agent_tools, toolkit_keys, toolkit_version)
         return agent_tools
 
     def _handle_wait_for_permission(self, agent_execution, agent_config: dict, agent_execution_config: dict,
@@ -202,12 +235,15 @@ class AgentIterationStepHandler:
                                                   agent_id=agent_execution_permission.agent_id,
                                                   feed=agent_execution_permission.assistant_reply,
                                                   role="assistant",
-                                                  feed_group_id=agent_execution.current_feed_group_id)
+                                                  feed_group_id=agent_execution.current_feed_group_id,
+                                                  token_count=TokenCounter.count_content_tokens(
+                                                      agent_execution_permission.assistant_reply))
         self.session.add(agent_execution_feed)
         agent_execution_feed1 = AgentExecutionFeed(agent_execution_id=agent_execution_permission.agent_execution_id,
                                                   agent_id=agent_execution_permission.agent_id,
                                                   feed=result, role="user",
-                                                  feed_group_id=agent_execution.current_feed_group_id)
+                                                  feed_group_id=agent_execution.current_feed_group_id,
+                                                  token_count=TokenCounter.count_content_tokens(result))
         self.session.add(agent_execution_feed1)
         agent_execution.status = "RUNNING"
         execution = AgentExecution.find_by_id(self.session, agent_execution_permission.agent_execution_id)
@@ -1,17 +1,27 @@
 import time
 from typing import Tuple, List
+
+import redis
 from sqlalchemy import asc
 
 from superagi.config.config import get_config
 from superagi.helper.error_handler import ErrorHandler
 from superagi.helper.prompt_reader import PromptReader
 from superagi.helper.token_counter import TokenCounter
+from superagi.lib.logger import logger
+from superagi.lib.redis_pool import RedisPool
 from superagi.models.agent_execution import AgentExecution
 from superagi.models.agent_execution_feed import AgentExecutionFeed
 from superagi.types.common import BaseMessage
 from superagi.models.agent_execution_config import AgentExecutionConfiguration
 from superagi.models.agent import Agent
 
+# Share of the history window after which the LTM summary is recomputed in the background,
+# and the share of newest history that is left out of it.
+LTM_SUMMARY_HIGH_WATER_MARK = 0.8
+LTM_SUMMARY_LOW_WATER_MARK = 0.5
+LTM_SUMMARY_LOCK_SECONDS = 300
+
 
 class AgentLlmMessageBuilder:
     """Agent message builder for LLM agent."""
@@ -22,6 +32,29 @@ class AgentLlmMessageBuilder:
         self.agent_id = agent_id
         self.agent_execution_id = agent_execution_id
         self.organisation = Agent.find_org_by_agent_id(self.session, self.agent_id)
+        self.last_agent_feed_ltm_summary_id = None
+        self.has_agent_feeds = False
+
+    def fetch_agent_feeds(self):
+        """ Fetch the agent feeds that can make it into the messages for LLM agent.
+
+        Only the newest feeds filling the history window, plus the older ones that fit in an LTM summary
+        prompt, are read. Feeds already covered by the LTM summary are skipped, so an empty result does not
+        mean the execution has no feeds yet, has_agent_feeds tells that.
+
+        Returns:
+            list: The agent feeds in chronological order.
+        """
+        token_limit = TokenCounter(session=self.session, organisation_id=self.organisation.id).token_limit(self.llm_model)
+        max_output_token_limit = int(get_config("MAX_TOOL_TOKEN_LIMIT", 800))
+        history_token_limit = ((token_limit - max_output_token_limit) // 4) * 3
+        self.last_agent_feed_ltm_summary_id = self._fetch_last_agent_feed_ltm_summary_id()
+        agent_feeds = AgentExecutionFeed.fetch_agent_execution_feeds_window(
+            self.session, self.agent_execution_id, history_token_limit + token_limit,
+            after_feed_id=self.last_agent_feed_ltm_summary_id)
+        self.has_agent_feeds = bool(agent_feeds) or AgentExecutionFeed.has_agent_feeds(self.session,
+                                                                                       self.agent_execution_id)
+        return agent_feeds
 
     def build_agent_messages(self, prompt: str, agent_feeds: list, history_enabled=False,
                              completion_prompt: str = None):
@@ -39,14 +72,17 @@ class AgentLlmMessageBuilder:
         if history_enabled:
             messages.append({"role": "system", "content": f"The current time and date is {time.strftime('%c')}"})
             base_token_limit = TokenCounter.count_message_tokens(messages, self.llm_model)
-            full_message_history = [{'role': agent_feed.role, 'content': agent_feed.feed, 'chat_id': agent_feed.id}
-                                                for agent_feed in agent_feeds]
+            full_message_history = [{'role': agent_feed.role, 'content': agent_feed.feed, 'chat_id': agent_feed.id,
+                                     'token_count': agent_feed.token_count}
+                                    for agent_feed in agent_feeds]
             past_messages, current_messages = self._split_history(full_message_history,
                                                               ((token_limit - base_token_limit - max_output_token_limit) // 4) * 3)
-            if past_messages:
-                ltm_summary = self._build_ltm_summary(past_messages=past_messages,
-                                                                   output_token_limit=(token_limit - base_token_limit - max_output_token_limit) // 4)
-                messages.append({"role": "assistant", "content": ltm_summary})
+            if past_messages or self.last_agent_feed_ltm_summary_id:
+                # the summary is computed by the summarize_agent_history task, the step only reads it
+                ltm_summary = AgentExecutionConfiguration.fetch_value(self.session, self.agent_execution_id,
+                                                                      "ltm_summary")
+                if ltm_summary is not None and ltm_summary.value:
+                    messages.append({"role": "assistant", "content": ltm_summary.value})
 
             for history in current_messages:
                 messages.append({"role": history["role"], "content": history["content"]})
@@ -57,27 +93,98 @@ class AgentLlmMessageBuilder:
         return messages
 
     def _split_history(self, history: List, pending_token_limit: int) -> Tuple[List[BaseMessage], List[BaseMessage]]:
-        hist_token_count = 0
+        # the stored token counts are summed up instead of tokenizing the messages again, every message is
+        # budgeted as if it were sent on its own, including the reply priming tokens
+        message_token_counts = TokenCounter.count_batch(history, self.llm_model)
+        if history and sum(message_token_counts) + 3 * len(history) >= pending_token_limit * LTM_SUMMARY_HIGH_WATER_MARK:
+            self._request_ltm_summary()
         i = len(history)
-        for message in reversed(history):
-            token_count = TokenCounter.count_message_tokens([{"role": message["role"], "content": message["content"]}],
-                                                            self.llm_model)
-            hist_token_count += token_count
-            if hist_token_count > pending_token_limit:
-                self._add_or_update_last_agent_feed_ltm_summary_id(str(history[i-1]['chat_id']))
-                return history[:i], history[i:]
+        token_total = 0
+        for token_count in reversed(message_token_counts):
+            token_total += token_count + 3
+            if token_total > pending_token_limit:
+                break
             i -= 1
-        return [], history
+        return history[:i], history[i:]
+
+    def update_ltm_summary(self):
+        """ Fold the older feeds of the execution into the stored LTM summary.
+
+        Runs in the summarize_agent_history task, off the step path. The oldest feeds after the
+        last_agent_feed_ltm_summary_id boundary, up to the newest LTM_SUMMARY_LOW_WATER_MARK share of the
+        history window, are summarized and the boundary is moved past the last of them, so later steps no
+        longer read those feeds. At most a history window of feeds is summarized per run, a longer backlog
+        is summarized by the runs the next steps request.
+
+        Returns:
+            str: The new LTM summary, None if there was nothing to summarize.
+        """
+        token_limit = TokenCounter(session=self.session, organisation_id=self.organisation.id).token_limit(self.llm_model)
+        max_output_token_limit = int(get_config("MAX_TOOL_TOKEN_LIMIT", 800))
+        history_token_limit = ((token_limit - max_output_token_limit) // 4) * 3
+        history = [{'role': agent_feed.role, 'content': agent_feed.feed, 'chat_id': agent_feed.id,
+                    'token_count': agent_feed.token_count}
+                   for agent_feed in self.fetch_agent_feeds()]
+
+        message_token_counts = TokenCounter.count_batch(history, self.llm_model)
+        kept_messages = 0
+        kept_token_count = 0
+        for token_count in reversed(message_token_counts):
+            kept_token_count += token_count + 3
+            if kept_token_count > history_token_limit * LTM_SUMMARY_LOW_WATER_MARK:
+                break
+            kept_messages += 1
+        if kept_messages == len(history):
+            return None
+
+        # the window may start well after the boundary, the feeds in between are read oldest first
+        before_feed_id = history[len(history) - kept_messages]['chat_id'] if kept_messages \
+            else history[-1]['chat_id'] + 1
+        past_feeds = AgentExecutionFeed.fetch_agent_execution_feeds_range(self.session, self.agent_execution_id,
+                                                                          self.last_agent_feed_ltm_summary_id,
+                                                                          before_feed_id, history_token_limit)
+        past_messages = [{'role': agent_feed.role, 'content': agent_feed.feed, 'chat_id': agent_feed.id}
+                         for agent_feed in past_feeds]
+        if not past_messages:
+            return None
+
+        ltm_summary = self._build_ltm_summary(past_messages=past_messages,
+                                              output_token_limit=(token_limit - max_output_token_limit) // 4)
+        self._add_or_update_last_agent_feed_ltm_summary_id(str(past_messages[-1]['chat_id']))
+        return ltm_summary
+
+    def _request_ltm_summary(self):
+        from superagi.worker import summarize_agent_history
+        try:
+            if not RedisPool.get_client().set(self.ltm_summary_lock_key(self.agent_execution_id), 1, nx=True,
+                                    ex=LTM_SUMMARY_LOCK_SECONDS):
+                return
+        except redis.RedisError as e:
+            logger.error(f"Unable to request LTM summary for execution {self.agent_execution_id}: {e}")
+            return
+        summarize_agent_history.delay(self.agent_id, self.agent_execution_id)
+
+    @classmethod
+    def release_ltm_summary_request(cls, agent_execution_id: int):
+        try:
+            RedisPool.get_client().delete(cls.ltm_summary_lock_key(agent_execution_id))
+        except redis.RedisError as e:
+            logger.error(f"Unable to release LTM summary request for execution {agent_execution_id}: {e}")
+
+    @classmethod
+    def ltm_summary_lock_key(cls, agent_execution_id: int) -> str:
+        return f"ltm_summary_pending:{agent_execution_id}"
 
     def _add_initial_feeds(self, agent_feeds: list, messages: list):
-        if agent_feeds:
+        if agent_feeds or self.has_agent_feeds:
             return
         for message in messages:
             agent_execution_feed = AgentExecutionFeed(agent_execution_id=self.agent_execution_id,
                                                       agent_id=self.agent_id,
                                                       feed=message["content"],
                                                       role=message["role"],
-                                                      feed_group_id="DEFAULT")
+                                                      feed_group_id="DEFAULT",
+                                                      token_count=TokenCounter.count_content_tokens(message["content"]))
             self.session.add(agent_execution_feed)
             self.session.commit()
 
@@ -88,23 +195,31 @@ class AgentLlmMessageBuilder:
                                                                          agent_execution_configs)
 
 
-    def _build_ltm_summary(self, past_messages, output_token_limit) -> str:
-        ltm_prompt = self._build_prompt_for_ltm_summary(past_messages=past_messages,
-                                                        token_limit=output_token_limit)
+    def _fetch_last_agent_feed_ltm_summary_id(self) -> int:
+        last_agent_feed_ltm_summary_id = AgentExecutionConfiguration.fetch_value(self.session,
+                                                   self.agent_execution_id, "last_agent_feed_ltm_summary_id")
+        return (
+            int(last_agent_feed_ltm_summary_id.value)
+            if last_agent_feed_ltm_summary_id is not None and last_agent_feed_ltm_summary_id.value is not None
+            else 0
+        )
 
+    def _build_ltm_summary(self, past_messages, output_token_limit) -> str:
         summary = AgentExecutionConfiguration.fetch_value(self.session, self.agent_execution_id, "ltm_summary")
         previous_ltm_summary = summary.value if summary is not None else ""
 
+        if self.last_agent_feed_ltm_summary_id and previous_ltm_summary:
+            # the feeds before the window were not fetched, fold the new past messages into the previous summary
+            ltm_prompt = self._build_prompt_for_recursive_ltm_summary_using_previous_ltm_summary(
+                previous_ltm_summary=previous_ltm_summary, past_messages=past_messages, token_limit=output_token_limit)
+        else:
+            ltm_prompt = self._build_prompt_for_ltm_summary(past_messages=past_messages,
+                                                            token_limit=output_token_limit)
+
         ltm_summary_base_token_limit = 10
         if ((TokenCounter.count_text_tokens(ltm_prompt) + ltm_summary_base_token_limit + output_token_limit)
             - TokenCounter(session=self.session, organisation_id=self.organisation.id).token_limit(self.llm_model)) > 0:
-            last_agent_feed_ltm_summary_id = AgentExecutionConfiguration.fetch_value(self.session,
-                                                       self.agent_execution_id, "last_agent_feed_ltm_summary_id")
-            last_agent_feed_ltm_summary_id = (
-                int(last_agent_feed_ltm_summary_id.value)
-                if last_agent_feed_ltm_summary_id is not None and last_agent_feed_ltm_summary_id.value is not None
-                else 0
-            )
+            last_agent_feed_ltm_summary_id = self._fetch_last_agent_feed_ltm_summary_id()
             past_messages = self.session.query(AgentExecutionFeed.role, AgentExecutionFeed.feed,
                                                AgentExecutionFeed.id) \
                 .filter(AgentExecutionFeed.agent_execution_id == self.agent_execution_id,
@@ -64,7 +64,7 @@ class AgentPromptBuilder:
 
     @classmethod
     def replace_main_variables(cls, super_agi_prompt: str, goals: List[str], instructions: List[str], constraints: List[str],
-                               tools: List[BaseTool], add_finish_tool: bool = True):
+                               tools: List[BaseTool], add_finish_tool: bool = True, tools_string: str = None):
         """Replace the main variables in the super agi prompt.
 
         Args:
@@ -74,6 +74,7 @@ class AgentPromptBuilder:
             constraints (List[str]): The list of constraints.
             tools (List[BaseTool]): The list of tools.
             add_finish_tool (bool): Whether to add finish tool or not.
+            tools_string (str): The tools section already rendered from the tools, rendered here if None.
         """
         super_agi_prompt = super_agi_prompt.replace("{goals}", AgentPromptBuilder.add_list_items_to_string(goals))
         if len(instructions) > 0 and len(instructions[0]) > 0:
@@ -88,7 +89,8 @@ class AgentPromptBuilder:
 
 
         # logger.info(tools)
-        tools_string = AgentPromptBuilder.add_tools_to_prompt(tools, add_finish_tool)
+        if tools_string is None:
+            tools_string = AgentPromptBuilder.add_tools_to_prompt(tools, add_finish_tool)
         super_agi_prompt = super_agi_prompt.replace("{tools}", tools_string)
         return super_agi_prompt
 
@@ -126,9 +128,14 @@ class AgentPromptBuilder:
         pending_tokens = token_limit - base_token_limit
         final_output = ""
         if "{task_history}" in super_agi_prompt:
+            # Count each task once and keep a running total instead of re-encoding the growing history
+            message_overhead = TokenCounter.count_message_tokens([{"role": "user", "content": ""}])
+            token_count = message_overhead
             for task in reversed(completed_tasks[-10:]):
-                final_output = f"Task: {task['task']}\nResult: {task['response']}\n" + final_output
-                token_count = TokenCounter.count_message_tokens([{"role": "user", "content": final_output}])
+                task_output = f"Task: {task['task']}\nResult: {task['response']}\n"
+                final_output = task_output + final_output
+                token_count += TokenCounter.count_message_tokens([{"role": "user", "content": task_output}]) \
+                               - message_overhead
                 # giving buffer of 100 tokens
                 if token_count > min(600, pending_tokens):
                     break
@@ -0,0 +1,152 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from superagi.helper.cache_version import CacheVersion
+from superagi.lib.logger import logger
+from superagi.llms.llm_registry import LlmRegistry
+from superagi.models.agent import Agent
+from superagi.models.agent_config import AgentConfiguration
+from superagi.models.agent_execution_config import AgentExecutionConfiguration
+from superagi.models.organisation import Organisation
+
+
+class AgentStepContext:
+    """
+    Snapshot of the rows every step of an agent execution reads: the agent configuration,
+    the execution configuration, the organisation and the model config.
+
+    The snapshot is built once per execution and kept in a process-local cache shared by
+    AgentExecutor, AgentIterationStepHandler and AgentToolStepHandler. It is rebuilt when
+    the agent, execution or organisation version stamp changes, see `invalidate`.
+
+    Attributes:
+        agent_id (int): The ID of the agent.
+        agent_execution_id (int): The ID of the agent execution.
+        organisation (Organisation): Detached copy of the agent's organisation.
+        agent_config (dict): Parsed agent configuration.
+        agent_execution_config (dict): Parsed agent execution configuration.
+        model_config (dict): Provider and api key of the agent's model, None if unavailable.
+    """
+    MAX_ENTRIES = 512
+    TTL_SECONDS = 300
+
+    _cache = OrderedDict()
+    _lock = threading.Lock()
+
+    def __init__(self, agent_id: int, agent_execution_id: int, organisation: Organisation, agent_config: dict,
+                 agent_execution_config: dict, model_config: dict = None):
+        self.agent_id = agent_id
+        self.agent_execution_id = agent_execution_id
+        self.organisation = organisation
+        self.agent_config = agent_config
+        self.agent_execution_config = agent_execution_config
+        self.model_config = model_config
+
+    @property
+    def model_api_key(self):
+        return self.model_config["api_key"] if self.model_config else None
+
+    @property
+    def model_provider(self):
+        return self.model_config["provider"] if self.model_config else None
+
+    def copy(self):
+        """Returns a copy whose config dicts can be modified without touching the cached snapshot."""
+        return AgentStepContext(self.agent_id, self.agent_execution_id, self.organisation,
+                                copy.deepcopy(self.agent_config), copy.deepcopy(self.agent_execution_config),
+                                copy.deepcopy(self.model_config))
+
+    @classmethod
+    def fetch(cls, session, agent_id: int, agent_execution_id: int):
+        """
+        Fetches the step context of an agent execution, building it if the cached one is stale.
+
+        Args:
+            session: The database session object.
+            agent_id (int): The ID of the agent.
+            agent_execution_id (int): The ID of the agent execution.
+
+        Returns:
+            AgentStepContext: The step context.
+        """
+        with cls._lock:
+            entry = cls._cache.get(agent_execution_id)
+        if entry is not None:
+            context, version, built_at = entry
+            if time.monotonic() - built_at < cls.TTL_SECONDS:
+                current_version = CacheVersion.fetch(
+                    cls._version_keys(agent_id, agent_execution_id, context.organisation.id))
+                if current_version is not None and current_version == version:
+                    with cls._lock:
+                        cls._cache.move_to_end(agent_execution_id)
+                    return context.copy()
+
+        context, version = cls._build(session, agent_id, agent_execution_id)
+        with cls._lock:
+            if version is not None and context.model_config is not None:
+                cls._cache[agent_execution_id] = (context, version, time.monotonic())
+                cls._cache.move_to_end(agent_execution_id)
+                while len(cls._cache) > cls.MAX_ENTRIES:
+                    cls._cache.popitem(last=False)
+            else:
+                cls._cache.pop(agent_execution_id, None)
+        return context.copy()
+
+    @classmethod
+    def _build(cls, session, agent_id: int, agent_execution_id: int):
+        # Versions are read before the rows, so a write racing with the build leaves a stale version behind
+        agent_version = CacheVersion.fetch(cls._version_keys(agent_id, agent_execution_id))
+        agent_config = Agent.fetch_configuration(session, agent_id)
+        agent_execution_config = AgentExecutionConfiguration.fetch_configuration(session, agent_execution_id)
+        db_organisation = Agent.find_org_by_agent_id(session, agent_id=agent_id)
+        organisation = Organisation(id=db_organisation.id, name=db_organisation.name,
+                                    description=db_organisation.description)
+        organisation_version = CacheVersion.fetch([cls._organisation_key(organisation.id)])
+        try:
+            model_config = AgentConfiguration.get_model_api_key(session, agent_id, agent_config["model"])
+        except Exception as e:
+            logger.info(f"Unable to get model config...{e}")
+            model_config = None
+
+        context = AgentStepContext(agent_id, agent_execution_id, organisation, agent_config,
+                                   agent_execution_config, model_config)
+        if agent_version is None or organisation_version is None:
+            return context, None
+        return context, agent_version + organisation_version
+
+    @classmethod
+    def invalidate(cls, agent_id: int = None, agent_execution_id: int = None, organisation_id: int = None):
+        """
+        Marks the step contexts built from the given agent, execution or organisation as stale in every process.
+
+        Args:
+            agent_id (int): The ID of the agent whose configuration was written.
+            agent_execution_id (int): The ID of the agent execution whose configuration was written.
+            organisation_id (int): The ID of the organisation whose model configs were written.
+        """
+        keys = []
+        if agent_id is not None:
+            keys.append(CacheVersion.key("agent", agent_id))
+        if agent_execution_id is not None:
+            keys.append(CacheVersion.key("agent_execution", agent_execution_id))
+        if organisation_id is not None:
+            keys.append(cls._organisation_key(organisation_id))
+        CacheVersion.bump(*keys)
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._cache.clear()
+
+    @classmethod
+    def _version_keys(cls, agent_id: int, agent_execution_id: int, organisation_id: int = None):
+        keys = [CacheVersion.key("agent", agent_id), CacheVersion.key("agent_execution", agent_execution_id)]
+        if organisation_id is not None:
+            keys.append(cls._organisation_key(organisation_id))
+        return keys
+
+    @classmethod
+    def _organisation_key(cls, organisation_id: int):
+        return LlmRegistry.version_key(organisation_id)
@@ -3,6 +3,7 @@ import json
 from superagi.agent.task_queue import TaskQueue
 from superagi.agent.agent_message_builder import AgentLlmMessageBuilder
 from superagi.agent.agent_prompt_builder import AgentPromptBuilder
+from superagi.agent.agent_step_context import AgentStepContext
 from superagi.agent.output_handler import ToolOutputHandler
 from superagi.agent.output_parser import AgentSchemaToolOutputParser
 from superagi.agent.queue_step_handler import QueueStepHandler
@@ -27,22 +28,31 @@ from sqlalchemy import and_
 
 class AgentToolStepHandler:
     """Handles the tools steps in the agent workflow"""
-    def __init__(self, session, llm, agent_id: int, agent_execution_id: int, memory=None):
+    def __init__(self, session, llm, agent_id: int, agent_execution_id: int, memory=None,
+                 step_context: AgentStepContext = None):
         self.session = session
         self.llm = llm
         self.agent_execution_id = agent_execution_id
         self.agent_id = agent_id
         self.memory = memory
+        self.step_context = step_context
         self.task_queue = TaskQueue(str(self.agent_execution_id))
-        self.organisation = Agent.find_org_by_agent_id(self.session, self.agent_id)
+        if step_context is not None:
+            self.organisation = step_context.organisation
+        else:
+            self.organisation = Agent.find_org_by_agent_id(self.session, self.agent_id)
 
     def execute_step(self):
         execution = AgentExecution.get_agent_execution_from_id(self.session, self.agent_execution_id)
         workflow_step = AgentWorkflowStep.find_by_id(self.session, execution.current_agent_step_id)
         step_tool = AgentWorkflowStepTool.find_by_id(self.session, workflow_step.action_reference_id)
-        agent_config = Agent.fetch_configuration(self.session, self.agent_id)
-        agent_execution_config = AgentExecutionConfiguration.fetch_configuration(self.session, self.agent_execution_id)
-        # print(agent_execution_config)
+        if self.step_context is not None:
+            agent_config = self.step_context.agent_config
+            agent_execution_config = self.step_context.agent_execution_config
+        else:
+            agent_config = Agent.fetch_configuration(self.session, self.agent_id)
+            agent_execution_config = AgentExecutionConfiguration.fetch_configuration(self.session,
+                                                                                     self.agent_execution_id)
 
         if not self._handle_wait_for_permission(execution, workflow_step):
             return
@@ -99,10 +109,11 @@ class AgentToolStepHandler:
         tool_obj = self._build_tool_obj(agent_config, agent_execution_config, step_tool.tool_name)
         prompt = self._build_tool_input_prompt(step_tool, tool_obj, agent_execution_config)
         logger.info("Prompt: ", prompt)
-        agent_feeds = AgentExecutionFeed.fetch_agent_execution_feeds(self.session, self.agent_execution_id)
-        messages = AgentLlmMessageBuilder(self.session, self.llm, self.llm.get_model(), self.agent_id, self.agent_execution_id) \
-            .build_agent_messages(prompt, agent_feeds, history_enabled=step_tool.history_enabled,
-                                  completion_prompt=step_tool.completion_prompt)
+        message_builder = AgentLlmMessageBuilder(self.session, self.llm, self.llm.get_model(), self.agent_id,
+                                                 self.agent_execution_id)
+        agent_feeds = message_builder.fetch_agent_feeds()
+        messages = message_builder.build_agent_messages(prompt, agent_feeds, history_enabled=step_tool.history_enabled,
+                                                        completion_prompt=step_tool.completion_prompt)
         # print(messages)
         current_tokens = TokenCounter.count_message_tokens(messages, self.llm.get_model())
         response = self.llm.chat_completion(messages, TokenCounter(session=self.session, organisation_id=self.organisation.id).token_limit(self.llm.get_model()) - current_tokens)
@@ -118,7 +129,11 @@ class AgentToolStepHandler:
         return assistant_reply
 
     def _build_tool_obj(self, agent_config, agent_execution_config, tool_name: str):
-        model_api_key = AgentConfiguration.get_model_api_key(self.session, self.agent_id, agent_config["model"])['api_key']
+        if self.step_context is not None:
+            model_api_key = self.step_context.model_api_key
+        else:
+            model_api_key = AgentConfiguration.get_model_api_key(self.session, self.agent_id,
+                                                                 agent_config["model"])['api_key']
         tool_builder = ToolBuilder(self.session, self.agent_id, self.agent_execution_id)
         resource_summary = ""
         if tool_name == "QueryResourceTool":
@@ -127,8 +142,7 @@ class AgentToolStepHandler:
                                                   model=agent_config["model"]).fetch_or_create_agent_resource_summary(
                 default_summary=agent_config.get("resource_summary"))
 
-        organisation = Agent.find_org_by_agent_id(self.session, self.agent_id)
-        tool = self.session.query(Tool).join(Toolkit, and_(Tool.toolkit_id == Toolkit.id, Toolkit.organisation_id == organisation.id, Tool.name == tool_name)).first()
+        tool = self.session.query(Tool).join(Toolkit, and_(Tool.toolkit_id == Toolkit.id, Toolkit.organisation_id == self.organisation.id, Tool.name == tool_name)).first()
         tool_obj = tool_builder.build_tool(tool)
         tool_obj = tool_builder.set_default_params_tool(tool_obj, agent_config, agent_execution_config, model_api_key,
                                                         resource_summary,self.memory)
@@ -208,7 +222,8 @@ class AgentToolStepHandler:
             agent_execution_feed = AgentExecutionFeed(agent_execution_id=agent_execution_permission.agent_execution_id,
                                                       agent_id=agent_execution_permission.agent_id,
                                                       feed=result, role="user",
-                                                      feed_group_id=agent_execution.current_feed_group_id)
+                                                      feed_group_id=agent_execution.current_feed_group_id,
+                                                      token_count=TokenCounter.count_content_tokens(result))
             self.session.add(agent_execution_feed)
 
         agent_execution.status = "RUNNING"
@@ -4,6 +4,7 @@ from superagi.agent.output_parser import AgentSchemaOutputParser
 from superagi.agent.task_queue import TaskQueue
 from superagi.agent.tool_executor import ToolExecutor
 from superagi.helper.json_cleaner import JsonCleaner
+from superagi.helper.token_counter import TokenCounter
 from superagi.lib.logger import logger
 from langchain.text_splitter import TokenTextSplitter
 from superagi.models.agent import Agent
@@ -50,13 +51,15 @@ class ToolOutputHandler:
                                                   agent_id=self.agent_config["agent_id"],
                                                   feed=assistant_reply,
                                                   role="assistant",
-                                                  feed_group_id=agent_execution.current_feed_group_id)
+                                                  feed_group_id=agent_execution.current_feed_group_id,
+                                                  token_count=TokenCounter.count_content_tokens(assistant_reply))
         session.add(agent_execution_feed)
         tool_response_feed = AgentExecutionFeed(agent_execution_id=self.agent_execution_id,
                                                 agent_id=self.agent_config["agent_id"],
                                                 feed=tool_response.result,
                                                 role="system",
-                                                feed_group_id=agent_execution.current_feed_group_id)
+                                                feed_group_id=agent_execution.current_feed_group_id,
+                                                token_count=TokenCounter.count_content_tokens(tool_response.result))
         session.add(tool_response_feed)
         session.commit()
         if not tool_response.retry:
@@ -154,11 +157,13 @@ class TaskOutputHandler:
             logger.info("Adding task to queue: " + str(tasks))
         agent_execution = AgentExecution.find_by_id(session, self.agent_execution_id)
         for task in tasks:
+            feed = "New Task Added: " + task
             agent_execution_feed = AgentExecutionFeed(agent_execution_id=self.agent_execution_id,
                                                       agent_id=self.agent_config["agent_id"],
-                                                      feed="New Task Added: " + task,
+                                                      feed=feed,
                                                       role="system",
-                                                      feed_group_id=agent_execution.current_feed_group_id)
+                                                      feed_group_id=agent_execution.current_feed_group_id,
+                                                      token_count=TokenCounter.count_content_tokens(feed))
             session.add(agent_execution_feed)
         status = "COMPLETE" if len(self.task_queue.get_tasks()) == 0 else "PENDING"
         session.commit()
@@ -64,11 +64,13 @@ class QueueStepHandler:
             # generating the new feed group id
             agent_execution.current_feed_group_id = "GROUP_" + str(int(time.time()))
             self.session.commit()
+            feed = "Input: " + task
             task_response_feed = AgentExecutionFeed(agent_execution_id=self.agent_execution_id,
                                                     agent_id=self.agent_id,
-                                                    feed="Input: " + task,
+                                                    feed=feed,
                                                     role="assistant",
-                                                    feed_group_id=agent_execution.current_feed_group_id)
+                                                    feed_group_id=agent_execution.current_feed_group_id,
+                                                    token_count=TokenCounter.count_content_tokens(feed))
             self.session.add(task_response_feed)
             self.session.commit()
             task_queue.complete_task("PROCESSED")
@@ -84,11 +86,12 @@ class QueueStepHandler:
     def _process_input_instruction(self, step_tool):
         prompt = self._build_queue_input_prompt(step_tool)
         logger.info("Prompt: ", prompt)
-        agent_feeds = AgentExecutionFeed.fetch_agent_execution_feeds(self.session, self.agent_execution_id)
+        message_builder = AgentLlmMessageBuilder(self.session, self.llm, self.llm.get_model(), self.agent_id,
+                                                 self.agent_execution_id)
+        agent_feeds = message_builder.fetch_agent_feeds()
         print(".........//////////////..........2")
-        messages = AgentLlmMessageBuilder(self.session, self.llm, self.llm.get_model(), self.agent_id, self.agent_execution_id) \
-            .build_agent_messages(prompt, agent_feeds, history_enabled=step_tool.history_enabled,
-                                  completion_prompt=step_tool.completion_prompt)
+        messages = message_builder.build_agent_messages(prompt, agent_feeds, history_enabled=step_tool.history_enabled,
+                                                        completion_prompt=step_tool.completion_prompt)
         current_tokens = TokenCounter.count_message_tokens(messages, self.llm.get_model())
         response = self.llm.chat_completion(messages, TokenCounter(session=self.session, organisation_id=self.organisation.id).token_limit(self.llm.get_model()) - current_tokens)
         
@@ -1,26 +1,34 @@
+import ast
 import json
 
-import redis
+from superagi.lib.redis_pool import RedisPool
+
+# Pops the first task and records it as completed in one atomic step.
+# KEYS[1]: task queue, KEYS[2]: completed tasks, ARGV[1]: JSON encoded response.
+COMPLETE_TASK_SCRIPT = """
+local task = redis.call('LPOP', KEYS[1])
+if not task then
+    return nil
+end
+redis.call('LPUSH', KEYS[2], '{"task": ' .. cjson.encode(task) .. ', "response": ' .. ARGV[1] .. '}')
+return task
+"""
 
-from superagi.config.config import get_config
 
-redis_url = get_config('REDIS_URL') or "localhost:6379"
 """TaskQueue manages current tasks and past tasks in Redis """
 class TaskQueue:
     def __init__(self, queue_name: str):
         self.queue_name = queue_name + "_q"
         self.completed_tasks = queue_name + "_q_completed"
-        self.db = redis.Redis.from_url("redis://" + redis_url + "/0", decode_responses=True)
+        self.db = RedisPool.get_client()
 
     def add_task(self, task: str):
         self.db.lpush(self.queue_name, task)
         # print("Added task. New tasks:", str(self.get_tasks()))
 
     def complete_task(self, response):
-        if len(self.get_tasks()) <= 0:
-            return
-        task = self.db.lpop(self.queue_name)
-        self.db.lpush(self.completed_tasks, str({"task": task, "response": response}))
+        complete_task = self.db.register_script(COMPLETE_TASK_SCRIPT)
+        complete_task(keys=[self.queue_name, self.completed_tasks], args=[json.dumps(response)])
 
     def get_first_task(self):
         return self.db.lindex(self.queue_name, 0)
@@ -30,7 +38,7 @@ class TaskQueue:
 
     def get_completed_tasks(self):
         tasks = self.db.lrange(self.completed_tasks, 0, -1)
-        return [eval(task) for task in tasks]
+        return [self._decode_completed_task(task) for task in tasks]
 
     def clear_tasks(self):
         self.db.delete(self.queue_name)
@@ -40,7 +48,27 @@ class TaskQueue:
         if response is None:
             return None
 
-        return eval(response)
+        return self._decode_completed_task(response)
+
+    def get_task_details(self):
+        """
+        Get the current, pending, last and completed tasks of the queue in a single round trip.
+
+        Returns:
+            dict: current_task (str or None), tasks (list), last_task_details (dict or None)
+                and completed_tasks (list), as returned by the individual getters.
+        """
+        pipeline = self.db.pipeline(transaction=True)
+        pipeline.lrange(self.queue_name, 0, -1)
+        pipeline.lrange(self.completed_tasks, 0, -1)
+        tasks, completed_tasks = pipeline.execute()
+        completed_tasks = [self._decode_completed_task(task) for task in completed_tasks]
+        return {
+            "current_task": tasks[0] if tasks else None,
+            "tasks": tasks,
+            "last_task_details": completed_tasks[0] if completed_tasks else None,
+            "completed_tasks": completed_tasks
+        }
 
     def set_status(self, status):
         self.db.set(self.queue_name + "_status", status)
@@ -48,3 +76,10 @@ class TaskQueue:
     def get_status(self):
         return self.db.get(self.queue_name + "_status")
 
+    @staticmethod
+    def _decode_completed_task(task: str):
+        try:
+            return json.loads(task)
+        except ValueError:
+            # completed tasks recorded before they were stored as JSON
+            return ast.literal_eval(task)
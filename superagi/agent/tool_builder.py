@@ -1,6 +1,10 @@
-import importlib
-import os
+import threading
+import time
+from collections import OrderedDict
+
 from superagi.config.config import get_config
+from superagi.helper.cache_version import CacheVersion
+from superagi.helper.tool_import_registry import ToolImportRegistry
 from superagi.llms.llm_model_factory import get_model
 from superagi.models.tool import Tool
 from superagi.models.tool_config import ToolConfig
@@ -8,25 +12,151 @@ from superagi.models.agent import Agent
 from superagi.resource_manager.file_manager import FileManager
 from superagi.tools.base_tool import BaseToolkitConfiguration
 from superagi.tools.tool_response_query_manager import ToolResponseQueryManager
-from superagi.helper.encyption_helper import decrypt_data, is_encrypted
+from superagi.helper.encyption_helper import decrypt_if_encrypted
+
 
 class DBToolkitConfiguration(BaseToolkitConfiguration):
+    """
+    Toolkit configuration stored in the tool_configs table, falling back to config.yaml.
+
+    The configs of a toolkit are loaded with a single query and decrypted once into a process-wide
+    snapshot, which is reused while the toolkit's config version is unchanged, see
+    `ToolConfig.invalidate_cache`. Without a version, i.e. without Redis, nothing is cached.
+    """
     session = None
     toolkit_id: int
 
+    TTL_SECONDS = 300
+    _snapshots = {}
+    _lock = threading.Lock()
+
     def __init__(self, session=None, toolkit_id=None):
         self.session = session
         self.toolkit_id = toolkit_id
 
     def get_tool_config(self, key: str):
-        tool_config = self.session.query(ToolConfig).filter_by(key=key, toolkit_id=self.toolkit_id).first()
-        if tool_config and tool_config.value:
-            if is_encrypted(tool_config.value):
-                return decrypt_data(tool_config.value)
-            else:
-                return tool_config.value
+        value = self.get_toolkit_configs().get(key)
+        if value:
+            return value
         return super().get_tool_config(key=key)
 
+    def get_toolkit_configs(self) -> dict:
+        """
+        Get the decrypted configs of the toolkit.
+
+        Returns:
+            dict: The config values by key, without the empty ones.
+        """
+        # the version is read before the configs, so a concurrent update can only make the snapshot stale
+        version = CacheVersion.fetch([ToolConfig.version_key(self.toolkit_id)])
+        with self._lock:
+            snapshot = self._snapshots.get(self.toolkit_id)
+        if snapshot is not None and version is not None and snapshot["version"] == version \
+                and time.monotonic() - snapshot["loaded_at"] < self.TTL_SECONDS:
+            return snapshot["configs"]
+
+        tool_configs = self.session.query(ToolConfig).filter(ToolConfig.toolkit_id == self.toolkit_id).all()
+        configs = {tool_config.key: decrypt_if_encrypted(tool_config.value)
+                   for tool_config in tool_configs if tool_config.value}
+        if version is not None:
+            with self._lock:
+                self._snapshots[self.toolkit_id] = {"configs": configs, "version": version,
+                                                    "loaded_at": time.monotonic()}
+        return configs
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._snapshots.clear()
+
+
+class ExecutionToolCache:
+    """
+    Process-local cache of the tools built for an agent execution, along with the tools section
+    of the prompt rendered from them, so a step reuses the previous step's tool objects instead
+    of importing, constructing and configuring every tool again.
+
+    An entry is only reused for the same fingerprint (tool ids, model, api key, resource summary,
+    goals and instructions) and while the configs of its toolkits are unchanged, see
+    `ToolConfig.invalidate_cache`. Tools hold the step's session and memory, which
+    `ToolBuilder.bind_tools` swaps in before every reuse.
+    """
+    MAX_ENTRIES = 256
+    TTL_SECONDS = 300
+
+    _cache = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, agent_execution_id: int, fingerprint):
+        """
+        Get the cached tools of an execution.
+
+        Args:
+            agent_execution_id (int): The ID of the agent execution.
+            fingerprint: The inputs the tools would be built from.
+
+        Returns:
+            list: The cached tools, or None if there are none for the fingerprint or they are stale.
+        """
+        with cls._lock:
+            entry = cls._cache.get(agent_execution_id)
+        if entry is None or entry["fingerprint"] != fingerprint \
+                or time.monotonic() - entry["built_at"] >= cls.TTL_SECONDS:
+            return None
+        if entry["toolkit_keys"]:
+            version = CacheVersion.fetch(entry["toolkit_keys"])
+            if version is None or version != entry["version"]:
+                return None
+        with cls._lock:
+            cls._cache.move_to_end(agent_execution_id)
+        return entry["tools"]
+
+    @classmethod
+    def fetch_version(cls, toolkit_ids: list):
+        """Returns the current config version of the toolkits, to be read before the tools are built."""
+        keys = [ToolConfig.version_key(toolkit_id) for toolkit_id in sorted(set(toolkit_ids))]
+        return keys, (CacheVersion.fetch(keys) if keys else ())
+
+    @classmethod
+    def put(cls, agent_execution_id: int, fingerprint, tools: list, toolkit_keys: list, version):
+        if version is None:
+            return
+        with cls._lock:
+            cls._cache[agent_execution_id] = {"fingerprint": fingerprint, "tools": tools, "toolkit_keys": toolkit_keys,
+                                              "version": version, "built_at": time.monotonic(), "prompts": {}}
+            cls._cache.move_to_end(agent_execution_id)
+            while len(cls._cache) > cls.MAX_ENTRIES:
+                cls._cache.popitem(last=False)
+
+    @classmethod
+    def get_tools_prompt(cls, agent_execution_id: int, tools: list, add_finish: bool, render):
+        """
+        Get the tools section of the prompt, rendering it once per cached tool list.
+
+        Args:
+            agent_execution_id (int): The ID of the agent execution.
+            tools (list): The tools of the step.
+            add_finish (bool): Whether the finish tool is listed.
+            render: Callable rendering the section from the tools and add_finish.
+
+        Returns:
+            str: The tools section of the prompt.
+        """
+        with cls._lock:
+            entry = cls._cache.get(agent_execution_id)
+        if entry is None or entry["tools"] is not tools:
+            return render(tools, add_finish)
+        if add_finish not in entry["prompts"]:
+            entry["prompts"][add_finish] = render(tools, add_finish)
+        return entry["prompts"][add_finish]
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._cache.clear()
+
+
 class ToolBuilder:
     def __init__(self, session, agent_id: int, agent_execution_id: int = None):
         self.session = session
@@ -59,30 +189,37 @@ class ToolBuilder:
         """
         file_name = self.__validate_filename(filename=tool.file_name)
 
-        tools_dir=""
-        tool_paths = ["superagi/tools", "superagi/tools/external_tools", "superagi/tools/marketplace_tools"]
-        for tool_path in tool_paths:
-            if os.path.exists(os.path.join(os.getcwd(), tool_path) + '/' + tool.folder_name):
-                tools_dir = tool_path
-                break
-        parsed_tools_dir = tools_dir.rstrip("/")
-        module_name = ".".join(parsed_tools_dir.split("/") + [tool.folder_name, file_name])
-
-        # module_name = f"superagi.tools.{folder_name}.{file_name}"
-
-        # Load the module dynamically
-        module = importlib.import_module(module_name)
-
-        # Get the class from the loaded module
-        obj_class = getattr(module, tool.class_name)
+        # Get the class from the process wide registry, imported on first use
+        obj_class = ToolImportRegistry.get_tool_class(tool.folder_name, file_name, tool.class_name)
 
         # Create an instance of the class
         new_object = obj_class()
         new_object.toolkit_config = DBToolkitConfiguration(session=self.session, toolkit_id=tool.toolkit_id)
         return new_object
 
+    def bind_tools(self, tools: list, memory=None):
+        """
+        Point cached tools at the session and memory of the current step.
+
+        Args:
+            tools (list): The tools built by an earlier step.
+            memory: The vector store of the current step.
+
+        Returns:
+            list: The same tools.
+        """
+        for tool in tools:
+            if isinstance(tool.toolkit_config, DBToolkitConfiguration):
+                tool.toolkit_config.session = self.session
+            if getattr(tool, 'resource_manager', None) is not None:
+                tool.resource_manager.session = self.session
+            if getattr(tool, 'tool_response_manager', None) is not None:
+                tool.tool_response_manager.session = self.session
+                tool.tool_response_manager.memory = memory
+        return tools
+
     def set_default_params_tool(self, tool, agent_config, agent_execution_config, model_api_key: str,
-                                resource_summary: str = "",memory=None):
+                                resource_summary: str = "",memory=None, organisation=None):
         """
         Set the default parameters for the tools.
 
@@ -92,11 +229,13 @@ class ToolBuilder:
             agent_execution_config (dict): Parsed execution configuration
             agent_id (int): The ID of the agent.
             model_api_key (str): The API key of the model
+            organisation (Organisation): The organisation of the agent, looked up if not given.
 
         Returns:
             list: The list of tools with default parameters.
         """
-        organisation = Agent.find_org_by_agent_id(self.session, agent_id=agent_config['agent_id'])
+        if organisation is None:
+            organisation = Agent.find_org_by_agent_id(self.session, agent_id=agent_config['agent_id'])
         if hasattr(tool, 'goals'):
             tool.goals = agent_execution_config["goal"]
         if hasattr(tool, 'instructions'):
@@ -33,7 +33,7 @@ class ToolExecutor:
             tool = tools[tool_name]
             retry = False
             EventHandler(session=session).create_event('tool_used', {'tool_name': tool.name, 'agent_execution_id': self.agent_execution_id}, self.agent_id,
-                                                       self.organisation_id),
+                                                       self.organisation_id, buffered=True)
             try:
                 parsed_args = self.clean_tool_args(tool_args)
                 observation = tool.execute(parsed_args)
@@ -1,8 +1,10 @@
 from typing import List, Dict, Union, Any
-from sqlalchemy import text, func, and_
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from superagi.models.agent_analytics_rollup import AgentAnalyticsRollup
 from superagi.models.events import Event
+from superagi.models.tool_analytics_rollup import ToolAnalyticsRollup
 
 
 class AnalyticsHelper:
@@ -12,30 +14,15 @@ class AnalyticsHelper:
         self.organisation_id = organisation_id
 
     def calculate_run_completed_metrics(self) -> Dict[str, Dict[str, Union[int, List[Dict[str, int]]]]]:
+        models = self.session.query(
+            AgentAnalyticsRollup.model,
+            func.sum(AgentAnalyticsRollup.agents_created).label('agents'),
+            func.sum(AgentAnalyticsRollup.runs_completed).label('runs'),
+            func.sum(AgentAnalyticsRollup.tokens_consumed).label('tokens')
+        ).filter(AgentAnalyticsRollup.org_id == self.organisation_id).group_by(AgentAnalyticsRollup.model).all()
 
-        agent_model_query = self.session.query(
-            Event.event_property['model'].label('model'),
-            Event.agent_id
-        ).filter_by(event_name="agent_created", org_id=self.organisation_id).subquery()
-
-        agent_runs_query = self.session.query(
-            agent_model_query.c.model,
-            func.count(Event.id).label('runs')
-        ).join(Event, and_(Event.agent_id == agent_model_query.c.agent_id, Event.org_id == self.organisation_id)).filter(Event.event_name.in_(['run_completed', 'run_iteration_limit_crossed'])).group_by(agent_model_query.c.model).subquery()
-
-        agent_tokens_query = self.session.query(
-            agent_model_query.c.model,
-            func.sum(text("(event_property->>'tokens_consumed')::int")).label('tokens')
-        ).join(Event, and_(Event.agent_id == agent_model_query.c.agent_id, Event.org_id == self.organisation_id)).filter(Event.event_name.in_(['run_completed', 'run_iteration_limit_crossed'])).group_by(agent_model_query.c.model).subquery()
-
-        agent_count_query = self.session.query(
-            agent_model_query.c.model,
-            func.count(agent_model_query.c.agent_id).label('agents')
-        ).group_by(agent_model_query.c.model).subquery()
-
-        agents = self.session.query(agent_count_query).all()
-        runs = self.session.query(agent_runs_query).all()
-        tokens = self.session.query(agent_tokens_query).all()
+        agents = [item for item in models if item.agents]
+        runs = [item for item in models if item.runs]
 
         metrics = {
             'agent_details': {
@@ -47,64 +34,30 @@ class AnalyticsHelper:
                 'model_metrics': [{'name': item.model, 'value': item.runs} for item in runs]
             },
             'tokens_details': {
-                'total_tokens': sum([item.tokens for item in tokens]),
-                'model_metrics': [{'name': item.model, 'value': item.tokens} for item in tokens]
+                'total_tokens': sum([item.tokens for item in runs]),
+                'model_metrics': [{'name': item.model, 'value': item.tokens} for item in runs]
             },
         }
 
         return metrics
 
     def fetch_agent_data(self) -> Dict[str, List[Dict[str, Any]]]:
-        agent_subquery = self.session.query(
-            Event.agent_id,
-            Event.event_property['agent_name'].label('agent_name'),
-            Event.event_property['model'].label('model')
-        ).filter_by(event_name="agent_created", org_id=self.organisation_id).subquery()
-
-        run_subquery = self.session.query(
-            Event.agent_id,
-            func.sum(text("(event_property->>'tokens_consumed')::int")).label('total_tokens'),
-            func.sum(text("(event_property->>'calls')::int")).label('total_calls'),
-            func.count(Event.id).label('runs_completed'),
-        ).filter(and_(Event.event_name.in_(['run_completed', 'run_iteration_limit_crossed']), Event.org_id == self.organisation_id)).group_by(Event.agent_id).subquery()
-
-        tool_subquery = self.session.query(
-            Event.agent_id,
-            func.array_agg(Event.event_property['tool_name'].distinct()).label('tools_used'),
-        ).filter_by(event_name="tool_used", org_id=self.organisation_id).group_by(Event.agent_id).subquery()
-
-        start_time_subquery = self.session.query(
-            Event.agent_id,
-            Event.event_property['agent_execution_id'].label('agent_execution_id'),
-            func.min(func.extract('epoch', Event.created_at)).label('start_time')
-        ).filter_by(event_name="run_created", org_id=self.organisation_id).group_by(Event.agent_id, Event.event_property['agent_execution_id']).subquery()
-
-        end_time_subquery = self.session.query(
-            Event.agent_id,
-            Event.event_property['agent_execution_id'].label('agent_execution_id'),
-            func.max(func.extract('epoch', Event.created_at)).label('end_time')
-        ).filter(and_(Event.event_name.in_(['run_completed', 'run_iteration_limit_crossed']), Event.org_id == self.organisation_id)).group_by(Event.agent_id, Event.event_property['agent_execution_id']).subquery()
-
-        time_diff_subquery = self.session.query(
-            start_time_subquery.c.agent_id,
-            (func.avg(end_time_subquery.c.end_time - start_time_subquery.c.start_time)).label('avg_run_time')
-        ).join(end_time_subquery, start_time_subquery.c.agent_execution_id == end_time_subquery.c.agent_execution_id). \
-            group_by(start_time_subquery.c.agent_id).subquery()
-
-        query = self.session.query(
-            agent_subquery.c.agent_id,
-            agent_subquery.c.agent_name,
-            agent_subquery.c.model,
-            run_subquery.c.total_tokens,
-            run_subquery.c.total_calls,
-            run_subquery.c.runs_completed,
-            tool_subquery.c.tools_used,
-            time_diff_subquery.c.avg_run_time
-        ).outerjoin(run_subquery, run_subquery.c.agent_id == agent_subquery.c.agent_id) \
-            .outerjoin(tool_subquery, tool_subquery.c.agent_id == agent_subquery.c.agent_id) \
-            .outerjoin(time_diff_subquery, time_diff_subquery.c.agent_id == agent_subquery.c.agent_id)
-
-        result = query.all()
+        result = self.session.query(
+            AgentAnalyticsRollup.agent_id,
+            func.max(AgentAnalyticsRollup.agent_name).label('agent_name'),
+            func.max(AgentAnalyticsRollup.model).label('model'),
+            func.sum(AgentAnalyticsRollup.tokens_consumed).label('total_tokens'),
+            func.sum(AgentAnalyticsRollup.calls).label('total_calls'),
+            func.sum(AgentAnalyticsRollup.runs_completed).label('runs_completed'),
+            func.sum(AgentAnalyticsRollup.run_time_total).label('run_time_total'),
+            func.sum(AgentAnalyticsRollup.timed_runs).label('timed_runs')
+        ).filter(AgentAnalyticsRollup.org_id == self.organisation_id).group_by(AgentAnalyticsRollup.agent_id).all()
+
+        tools_used = {}
+        tools = self.session.query(ToolAnalyticsRollup.agent_id, ToolAnalyticsRollup.tool_name).filter(
+            ToolAnalyticsRollup.org_id == self.organisation_id).distinct().all()
+        for tool in tools:
+            tools_used.setdefault(tool.agent_id, []).append(tool.tool_name)
 
         agent_details = [{
             "name": row.agent_name,
@@ -112,9 +65,9 @@ class AnalyticsHelper:
             "runs_completed": row.runs_completed if row.runs_completed else 0,
             "total_calls": row.total_calls if row.total_calls else 0,
             "total_tokens": row.total_tokens if row.total_tokens else 0,
-            "tools_used": row.tools_used,
+            "tools_used": sorted(tools_used[row.agent_id]) if row.agent_id in tools_used else None,
             "model_name": row.model,
-            "avg_run_time": row.avg_run_time if row.avg_run_time else 0,
+            "avg_run_time": row.run_time_total / row.timed_runs if row.timed_runs else 0,
         } for row in result]
 
         return {'agent_details': agent_details}
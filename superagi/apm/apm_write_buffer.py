@@ -0,0 +1,247 @@
+import atexit
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from superagi.config.config import get_config
+from superagi.lib.logger import logger
+from superagi.models.call_logs import CallLogs
+from superagi.models.db import connect_db
+from superagi.models.events import Event
+
+MODELS = {model.__tablename__: model for model in (Event, CallLogs)}
+
+
+class ApmWriteBuffer:
+    """
+    Process-local write buffer of the APM rows, the events and the call logs, written by the workers.
+
+    Rows are queued in memory and bulk inserted by a background thread, one insert per table,
+    once APM_BUFFER_SIZE rows are queued or APM_FLUSH_INTERVAL seconds after the last flush.
+    Rows of a failed flush are queued again, and the rows still queued when the process exits
+    are written to APM_BUFFER_SPILL_FILE and inserted by the next process, so delivery is at
+    least once. At most APM_BUFFER_MAX_ROWS rows are held, the oldest are dropped beyond that.
+    """
+    _lock = threading.Lock()
+    _flush_lock = threading.Lock()
+    _wake = threading.Event()
+    _rows = []
+    _thread = None
+    _pid = None
+    _stopped = False
+    _exit_hook_registered = False
+    _metrics = {}
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return str(get_config("APM_BUFFER_ENABLED", True)).lower() not in ("false", "0")
+
+    @classmethod
+    def add(cls, model, values: dict):
+        """
+        Queue a row to be inserted.
+
+        Args:
+            model: The model of the row, Event or CallLogs.
+            values (dict): The column values of the row.
+        """
+        now = datetime.utcnow()
+        # rows are stamped when they are queued, not when they are flushed
+        row = {"created_at": now, "updated_at": now, **values}
+        with cls._lock:
+            cls._ensure_started()
+            cls._rows.append((model.__tablename__, row))
+            cls._trim()
+            full = len(cls._rows) >= cls._buffer_size()
+        if full:
+            cls._wake.set()
+
+    @classmethod
+    def flush(cls) -> int:
+        """
+        Insert the queued rows, queueing them again if the insert fails.
+
+        Returns:
+            int: The number of rows inserted.
+        """
+        with cls._flush_lock:
+            with cls._lock:
+                rows, cls._rows = cls._rows, []
+            if not rows:
+                return 0
+            started = time.monotonic()
+            try:
+                cls._insert(rows)
+            except Exception as e:
+                logger.error(f"Unable to flush {len(rows)} APM rows, retrying on the next flush: {e}")
+                with cls._lock:
+                    cls._rows[:0] = rows
+                    cls._trim()
+                    cls._metrics["failed_flushes"] += 1
+                return 0
+            latency = time.monotonic() - started
+            with cls._lock:
+                metrics = cls._metrics
+                metrics["flushes"] += 1
+                metrics["flushed_rows"] += len(rows)
+                metrics["last_flush_latency"] = latency
+                metrics["max_flush_latency"] = max(metrics["max_flush_latency"], latency)
+                metrics["total_flush_latency"] += latency
+            logger.debug(f"Flushed {len(rows)} APM rows in {latency * 1000:.1f}ms")
+            return len(rows)
+
+    @classmethod
+    def get_metrics(cls) -> dict:
+        """
+        Get the flush metrics of this process.
+
+        Returns:
+            dict: The queued, flushed and dropped row counts, the flush counts and the last, max and
+                average flush latency in seconds.
+        """
+        with cls._lock:
+            metrics = dict(cls._metrics) if cls._metrics else cls._new_metrics()
+            metrics["queued_rows"] = len(cls._rows)
+        total_latency = metrics.pop("total_flush_latency")
+        metrics["avg_flush_latency"] = total_latency / metrics["flushes"] if metrics["flushes"] else 0.0
+        return metrics
+
+    @classmethod
+    def shutdown(cls):
+        """Stop the flush thread and flush the queued rows, spilling them to a file if the flush fails."""
+        with cls._lock:
+            if cls._pid != os.getpid():
+                return
+            cls._stopped = True
+            thread = cls._thread
+        cls._wake.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=cls._flush_interval())
+        cls.flush()
+        with cls._lock:
+            rows, cls._rows = cls._rows, []
+        if rows:
+            cls._spill(rows)
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._stopped = True
+            thread = cls._thread
+        cls._wake.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        with cls._lock:
+            cls._rows = []
+            cls._thread = None
+            cls._pid = None
+            cls._stopped = False
+            cls._metrics = {}
+            cls._wake.clear()
+
+    @classmethod
+    def _ensure_started(cls):
+        pid = os.getpid()
+        if cls._pid == pid:
+            return
+        # a forked worker inherits the rows of its parent, which are flushed by the parent
+        cls._pid = pid
+        cls._rows = cls._load_spill()
+        cls._metrics = cls._new_metrics()
+        cls._stopped = False
+        cls._wake = threading.Event()
+        cls._thread = threading.Thread(target=cls._run, name="apm-write-buffer", daemon=True)
+        cls._thread.start()
+        if not cls._exit_hook_registered:
+            atexit.register(cls.shutdown)
+            cls._exit_hook_registered = True
+
+    @classmethod
+    def _run(cls):
+        while not cls._stopped:
+            cls._wake.wait(cls._flush_interval())
+            cls._wake.clear()
+            if cls._stopped:
+                return
+            try:
+                cls.flush()
+            except Exception as e:
+                logger.error(f"APM write buffer flush failed: {e}")
+
+    @classmethod
+    def _insert(cls, rows: list):
+        rows_by_table = {}
+        for table_name, row in rows:
+            rows_by_table.setdefault(table_name, []).append(row)
+        Session = sessionmaker(bind=connect_db())
+        with Session() as session:
+            for table_name, table_rows in rows_by_table.items():
+                session.execute(insert(MODELS[table_name]), table_rows)
+            session.commit()
+
+    @classmethod
+    def _trim(cls):
+        overflow = len(cls._rows) - int(get_config("APM_BUFFER_MAX_ROWS", 10000))
+        if overflow > 0:
+            logger.error(f"APM write buffer is full, dropping the {overflow} oldest rows")
+            del cls._rows[:overflow]
+            cls._metrics["dropped_rows"] += overflow
+
+    @classmethod
+    def _spill_file(cls) -> str:
+        return get_config("APM_BUFFER_SPILL_FILE", "/tmp/superagi_apm_buffer.jsonl")
+
+    @classmethod
+    def _spill(cls, rows: list):
+        try:
+            with open(cls._spill_file(), "a") as file:
+                for table_name, row in rows:
+                    file.write(json.dumps({"table": table_name, "row": row}, default=datetime.isoformat) + "\n")
+            logger.info(f"Spilled {len(rows)} unflushed APM rows to {cls._spill_file()}")
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Unable to spill {len(rows)} unflushed APM rows: {e}")
+
+    @classmethod
+    def _load_spill(cls) -> list:
+        spill_file = cls._spill_file()
+        # the file is renamed first, so only one of the processes starting together claims it
+        claimed_file = f"{spill_file}.{os.getpid()}"
+        try:
+            os.replace(spill_file, claimed_file)
+        except OSError:
+            return []
+        rows = []
+        try:
+            with open(claimed_file) as file:
+                for line in file:
+                    try:
+                        spilled = json.loads(line)
+                        row = spilled["row"]
+                        for key in ("created_at", "updated_at"):
+                            row[key] = datetime.fromisoformat(row[key])
+                        if spilled["table"] in MODELS:
+                            rows.append((spilled["table"], row))
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.error(f"Skipping unreadable spilled APM row: {e}")
+            os.remove(claimed_file)
+        except OSError as e:
+            logger.error(f"Unable to read spilled APM rows: {e}")
+        return rows
+
+    @classmethod
+    def _buffer_size(cls) -> int:
+        return int(get_config("APM_BUFFER_SIZE", 100))
+
+    @classmethod
+    def _flush_interval(cls) -> float:
+        return float(get_config("APM_FLUSH_INTERVAL", 2))
+
+    @staticmethod
+    def _new_metrics() -> dict:
+        return {"flushes": 0, "failed_flushes": 0, "flushed_rows": 0, "dropped_rows": 0,
+                "last_flush_latency": 0.0, "max_flush_latency": 0.0, "total_flush_latency": 0.0}
@@ -3,6 +3,7 @@ from typing import Optional
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from sqlalchemy import func, distinct
+from superagi.apm.apm_write_buffer import ApmWriteBuffer
 from superagi.models.call_logs import CallLogs
 from superagi.models.agent import Agent
 from superagi.models.tool import Tool
@@ -14,16 +15,23 @@ class CallLogHelper:
         self.session = session
         self.organisation_id = organisation_id
 
-    def create_call_log(self, agent_execution_name: str, agent_id: int, tokens_consumed: int, tool_used: str, model: str) -> Optional[CallLogs]:
+    def create_call_log(self, agent_execution_name: str, agent_id: int, tokens_consumed: int, tool_used: str,
+                        model: str, buffered: bool = False) -> Optional[CallLogs]:
+        """
+        Create a call log.
+
+        Args:
+            buffered (bool): Queue the call log on the APM write buffer instead of committing it, for the
+                call logs written on every agent step. The returned call log is then not yet persisted.
+        """
         try:
-            call_log = CallLogs(
-                agent_execution_name=agent_execution_name,
-                agent_id=agent_id,
-                tokens_consumed=tokens_consumed,
-                tool_used=tool_used,
-                model=model,
-                org_id=self.organisation_id,
-            )
+            values = dict(agent_execution_name=agent_execution_name, agent_id=agent_id,
+                          tokens_consumed=tokens_consumed, tool_used=tool_used, model=model,
+                          org_id=self.organisation_id)
+            call_log = CallLogs(**values)
+            if buffered and ApmWriteBuffer.enabled():
+                ApmWriteBuffer.add(CallLogs, values)
+                return call_log
             self.session.add(call_log)
             self.session.commit()
             return call_log
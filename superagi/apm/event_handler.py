@@ -3,6 +3,7 @@ from typing import Optional, Dict
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from superagi.apm.apm_write_buffer import ApmWriteBuffer
 from superagi.models.events import Event
 
 class EventHandler:
@@ -11,15 +12,21 @@ class EventHandler:
         self.session = session
 
     def create_event(self, event_name: str, event_property: Dict, agent_id: int,
-                     org_id: int, event_value: int = 1) -> Optional[Event]:
+                     org_id: int, event_value: int = 1, buffered: bool = False) -> Optional[Event]:
+        """
+        Create an event.
+
+        Args:
+            buffered (bool): Queue the event on the APM write buffer instead of committing it, for the
+                events written on every agent step. The returned event is then not yet persisted.
+        """
         try:
-            event = Event(
-                event_name=event_name,
-                event_value=event_value,
-                event_property=event_property,
-                agent_id=agent_id,
-                org_id=org_id,
-            )
+            values = dict(event_name=event_name, event_value=event_value, event_property=event_property,
+                          agent_id=agent_id, org_id=org_id)
+            event = Event(**values)
+            if buffered and ApmWriteBuffer.enabled():
+                ApmWriteBuffer.add(Event, values)
+                return event
             self.session.add(event)
             self.session.commit()
             return event
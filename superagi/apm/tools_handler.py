@@ -1,9 +1,10 @@
 from typing import List, Dict, Union
 from sqlalchemy import func, distinct, and_
 from sqlalchemy.orm import Session
-from sqlalchemy import Integer, String
+from sqlalchemy import Integer
 from fastapi import HTTPException
 from superagi.models.events import Event
+from superagi.models.tool_analytics_rollup import ToolAnalyticsRollup
 from superagi.models.tool import Tool
 from superagi.models.toolkit import Toolkit
 from sqlalchemy import or_
@@ -27,26 +28,11 @@ class ToolsHandler:
 
     def calculate_tool_usage(self) -> List[Dict[str, int]]:
         tool_usage = []
-        tool_used_subquery = self.session.query(
-            Event.event_property['tool_name'].label('tool_name'),
-            Event.agent_id
-        ).filter_by(event_name="tool_used", org_id=self.organisation_id).subquery()
-
-        agent_count = self.session.query(
-            tool_used_subquery.c.tool_name,
-            func.count(func.distinct(tool_used_subquery.c.agent_id)).label('unique_agents')
-        ).group_by(tool_used_subquery.c.tool_name).subquery()
-
-        total_usage = self.session.query(
-            tool_used_subquery.c.tool_name,
-            func.count(tool_used_subquery.c.tool_name).label('total_usage')
-        ).group_by(tool_used_subquery.c.tool_name).subquery()
-
         query = self.session.query(
-            agent_count.c.tool_name,
-            agent_count.c.unique_agents,
-            total_usage.c.total_usage,
-        ).join(total_usage, total_usage.c.tool_name == agent_count.c.tool_name)
+            ToolAnalyticsRollup.tool_name,
+            func.count(distinct(ToolAnalyticsRollup.agent_id)).label('unique_agents'),
+            func.sum(ToolAnalyticsRollup.calls).label('total_usage')
+        ).filter(ToolAnalyticsRollup.org_id == self.organisation_id).group_by(ToolAnalyticsRollup.tool_name)
 
         tool_and_toolkit = self.get_tool_and_toolkit()
 
@@ -70,15 +56,14 @@ class ToolsHandler:
             raise HTTPException(status_code=404, detail="Tool not found")
 
         tool_name_event = self.session.query(
-            Event.event_property['tool_name'].cast(String).label('tool_name'), 
-            func.count(Event.id).label('tool_calls'),
-            func.count(distinct(Event.agent_id)).label('tool_unique_agents')
+            ToolAnalyticsRollup.tool_name,
+            func.sum(ToolAnalyticsRollup.calls).label('tool_calls'),
+            func.count(distinct(ToolAnalyticsRollup.agent_id)).label('tool_unique_agents')
         ).filter(
-            Event.event_name == 'tool_used',
-            Event.org_id == self.organisation_id,
-            Event.event_property['tool_name'].astext == tool_name
+            ToolAnalyticsRollup.org_id == self.organisation_id,
+            ToolAnalyticsRollup.tool_name == tool_name
         ).group_by(
-            Event.event_property['tool_name'].cast(String)
+            ToolAnalyticsRollup.tool_name
         ).first()
 
         tool_data = {}
@@ -121,13 +106,27 @@ class ToolsHandler:
             Event.event_name == 'agent_created'
         ).all()
 
+        event_runs_by_execution = {}
+        for event_run in event_runs:
+            event_runs_by_execution.setdefault(
+                (event_run.agent_id, event_run.event_property.get('agent_execution_id')), event_run)
+        agent_created_events_by_agent = {}
+        for agent_created_event in agent_created_events:
+            agent_created_events_by_agent.setdefault(agent_created_event.agent_id, agent_created_event)
+
         results = []
+        result_executions = set()
+        timezones = {}
 
         for tool_event in tool_events:
             agent_execution_id = tool_event.event_property['agent_execution_id']
+            if agent_execution_id in result_executions:
+                continue
 
-            event_run = next((er for er in event_runs if er.agent_id == tool_event.agent_id and er.event_property['agent_execution_id'] == agent_execution_id), None)
-            agent_created_event = next((ace for ace in agent_created_events if ace.agent_id == tool_event.agent_id), None)
+            event_run = event_runs_by_execution.get((tool_event.agent_id, agent_execution_id))
+            agent_created_event = agent_created_events_by_agent.get(tool_event.agent_id)
+            if not event_run or not agent_created_event:
+                continue
 
             model_query = self.session.query(AgentExecutionConfiguration).filter(
                 AgentExecutionConfiguration.agent_execution_id == agent_execution_id, 
@@ -138,44 +137,44 @@ class ToolsHandler:
                 model_value = model_query.value
             else:
                 model_value = None
-            try:
-                user_timezone = AgentConfiguration.get_agent_config_by_key_and_agent_id(session=self.session, key='user_timezone', agent_id=tool_event.agent_id)
-                if user_timezone and user_timezone.value != 'None':
-                    tz = pytz.timezone(user_timezone.value)
-                else:
-                    tz = pytz.timezone('GMT')       
-            except AttributeError:
-                tz = pytz.timezone('GMT')
-
-            if event_run and agent_created_event:
-                actual_time = tool_event.created_at.astimezone(tz).strftime("%d %B %Y %H:%M")
-                other_tools_events = self.session.query(
-                    Event
-                ).filter(
-                    Event.org_id == self.organisation_id,
-                    Event.event_name == 'tool_used',
-                    Event.event_property['tool_name'].astext != tool_name,
-                    Event.agent_id == tool_event.agent_id, 
-                    Event.id.between(tool_event.id, event_run.id)
-                ).all()
-
-                other_tools = [ote.event_property['tool_name'] for ote in other_tools_events]
-
-                result_dict = {
-                    'created_at': actual_time,
-                    'agent_execution_id': agent_execution_id,
-                    'tokens_consumed': event_run.event_property['tokens_consumed'],
-                    'calls': event_run.event_property['calls'],
-                    'agent_execution_name': event_run.event_property['name'],
-                    'other_tools': other_tools,
-                    'agent_name': agent_created_event.event_property['agent_name'],
-                    'model': model_value if model_value else agent_created_event.event_property['model']
-                }
-
-                if agent_execution_id not in [i['agent_execution_id'] for i in results]:
-                    results.append(result_dict)
+            if tool_event.agent_id not in timezones:
+                timezones[tool_event.agent_id] = self._get_agent_timezone(tool_event.agent_id)
+            tz = timezones[tool_event.agent_id]
+
+            actual_time = tool_event.created_at.astimezone(tz).strftime("%d %B %Y %H:%M")
+            other_tools_events = self.session.query(
+                Event
+            ).filter(
+                Event.org_id == self.organisation_id,
+                Event.event_name == 'tool_used',
+                Event.event_property['tool_name'].astext != tool_name,
+                Event.agent_id == tool_event.agent_id, 
+                Event.id.between(tool_event.id, event_run.id)
+            ).all()
+
+            other_tools = [ote.event_property['tool_name'] for ote in other_tools_events]
+
+            results.append({
+                'created_at': actual_time,
+                'agent_execution_id': agent_execution_id,
+                'tokens_consumed': event_run.event_property['tokens_consumed'],
+                'calls': event_run.event_property['calls'],
+                'agent_execution_name': event_run.event_property['name'],
+                'other_tools': other_tools,
+                'agent_name': agent_created_event.event_property['agent_name'],
+                'model': model_value if model_value else agent_created_event.event_property['model']
+            })
+            result_executions.add(agent_execution_id)
 
         results = sorted(results, key=lambda x: datetime.strptime(x['created_at'], '%d %B %Y %H:%M'), reverse=True)
 
         return results
-    
\ No newline at end of file
+
+    def _get_agent_timezone(self, agent_id: int):
+        try:
+            user_timezone = AgentConfiguration.get_agent_config_by_key_and_agent_id(session=self.session, key='user_timezone', agent_id=agent_id)
+            if user_timezone and user_timezone.value != 'None':
+                return pytz.timezone(user_timezone.value)
+        except AttributeError:
+            pass
+        return pytz.timezone('GMT')
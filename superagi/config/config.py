@@ -1,5 +1,8 @@
 import os
-from pydantic import BaseSettings
+from types import MappingProxyType
+from typing import Mapping
+
+from pydantic import BaseSettings, PrivateAttr
 from pathlib import Path
 import yaml
 from superagi.lib.logger import logger
@@ -8,9 +11,18 @@ CONFIG_FILE = "config.yaml"
 
 
 class Config(BaseSettings):
+    """
+    Settings merged from config.yaml and the environment, frozen when loaded.
+
+    Lookups read a read-only snapshot taken at load time instead of copying every field on each
+    call. Changes to config.yaml or the environment are only seen after `reload_config`.
+    """
+    _snapshot: Mapping = PrivateAttr()
+
     class Config:
         env_file_encoding = "utf-8"
         extra = "allow"  # Allow extra fields
+        allow_mutation = False
 
     @classmethod
     def load_config(cls, config_file: str) -> dict:
@@ -38,9 +50,14 @@ class Config(BaseSettings):
     def __init__(self, config_file: str, **kwargs):
         config_data = self.load_config(config_file)
         super().__init__(**config_data, **kwargs)
+        self._snapshot = MappingProxyType(self.dict())
+
+    @property
+    def snapshot(self) -> Mapping:
+        return self._snapshot
 
     def get_config(self, key: str, default: str = None) -> str:
-        return self.dict().get(key, default)
+        return self._snapshot.get(key, default)
 
 
 ROOT_DIR = os.path.dirname(Path(__file__).parent.parent)
@@ -48,4 +65,16 @@ _config_instance = Config(ROOT_DIR + "/" + CONFIG_FILE)
 
 
 def get_config(key: str, default: str = None) -> str:
-    return _config_instance.get_config(key, default)
\ No newline at end of file
+    return _config_instance.get_config(key, default)
+
+
+def reload_config() -> Config:
+    """
+    Reload the settings from config.yaml and the environment, replacing the frozen snapshot.
+
+    Returns:
+        Config: The reloaded settings.
+    """
+    global _config_instance
+    _config_instance = Config(ROOT_DIR + "/" + CONFIG_FILE)
+    return _config_instance
\ No newline at end of file
@@ -8,6 +8,7 @@ import ast
 
 from pytz import timezone
 from sqlalchemy import func, or_
+from superagi.agent.agent_step_context import AgentStepContext
 from superagi.models.agent import Agent
 from superagi.models.agent_execution_config import AgentExecutionConfiguration
 from superagi.models.agent_config import AgentConfiguration
@@ -417,3 +418,4 @@ def delete_agent(agent_id: int, Authorize: AuthJWT = Depends(check_auth)):
         db_agent_schedule.status = "STOPPED"
     
     db.session.commit()
+    AgentStepContext.invalidate(agent_id=agent_id)
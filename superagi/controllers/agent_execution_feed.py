@@ -3,7 +3,7 @@ from datetime import datetime
 import time
 from typing import Optional
 
-from fastapi import APIRouter, BackgroundTasks
+from fastapi import APIRouter, BackgroundTasks, Query
 from fastapi import HTTPException, Depends
 from fastapi_jwt_auth import AuthJWT
 from fastapi_sqlalchemy import db
@@ -15,7 +15,7 @@ from superagi.agent.task_queue import TaskQueue
 from superagi.helper.auth import check_auth
 from superagi.helper.time_helper import get_time_difference
 from superagi.models.agent_execution_permission import AgentExecutionPermission
-from superagi.helper.feed_parser import parse_feed
+from superagi.helper.feed_parser import parse_feed, is_feed_visible
 from superagi.models.agent_execution import AgentExecution
 from superagi.models.agent_execution_feed import AgentExecutionFeed
 from superagi.lib.logger import logger
@@ -23,7 +23,6 @@ from superagi.agent.types.agent_workflow_step_action_types import AgentWorkflowS
 from superagi.models.workflows.agent_workflow_step import AgentWorkflowStep
 from superagi.models.workflows.agent_workflow_step_wait import AgentWorkflowStepWait
 
-import re
 # from superagi.types.db import AgentExecutionFeedOut, AgentExecutionFeedIn
 
 router = APIRouter()
@@ -169,9 +168,75 @@ def get_agent_execution_feed(agent_execution_id: int,
         raise HTTPException(status_code=400, detail="Agent Run not found!")
     feeds = db.session.query(AgentExecutionFeed).filter_by(agent_execution_id=agent_execution_id).order_by(
         asc(AgentExecutionFeed.created_at)).all()
-    # # parse json
+    final_feeds, error = _parse_execution_feeds(agent_execution, feeds)
+
+    return {
+        "feeds": final_feeds,
+        "errors": error,
+        **_get_execution_details(agent_execution)
+    }
+
+
+@router.get("/get/execution/{agent_execution_id}/incremental")
+def get_agent_execution_feed_incremental(agent_execution_id: int,
+                                         since_id: int = Query(0, ge=0),
+                                         limit: int = Query(100, ge=1, le=500),
+                                         Authorize: AuthJWT = Depends(check_auth)):
+    """
+    Get the agent execution feeds added after since_id, with other execution details.
+    Pass the returned last_feed_id as since_id of the next call to only receive new feeds.
+
+    Args:
+        agent_execution_id (int): The ID of the agent execution.
+        since_id (int): Only feeds with a greater ID are returned.
+        limit (int): The maximum number of feeds to return.
+
+    Returns:
+        dict: The agent execution status, the new feeds, last_feed_id and has_more.
+
+    Raises:
+        HTTPException (Status Code=400): If the agent run is not found.
+    """
+
+    agent_execution = db.session.query(AgentExecution).filter(AgentExecution.id == agent_execution_id).first()
+    if agent_execution is None:
+        raise HTTPException(status_code=400, detail="Agent Run not found!")
+    feeds = db.session.query(AgentExecutionFeed).filter(
+        AgentExecutionFeed.agent_execution_id == agent_execution_id,
+        AgentExecutionFeed.id > since_id).order_by(asc(AgentExecutionFeed.id)).limit(limit + 1).all()
+    has_more = len(feeds) > limit
+    feeds = feeds[:limit]
+    final_feeds, error = _parse_execution_feeds(agent_execution, feeds)
+
+    if not error and agent_execution.status == "ERROR_PAUSED" and agent_execution.last_shown_error_id is not None \
+            and agent_execution.last_shown_error_id <= since_id:
+        # the error was shown in an earlier page but the run is still paused on it
+        error = db.session.query(AgentExecutionFeed.error_message).filter(
+            AgentExecutionFeed.id == agent_execution.last_shown_error_id).scalar() or ""
+
+    return {
+        "feeds": final_feeds,
+        "errors": error,
+        "last_feed_id": feeds[-1].id if feeds else since_id,
+        "has_more": has_more,
+        **_get_execution_details(agent_execution)
+    }
+
+
+def _parse_execution_feeds(agent_execution: AgentExecution, feeds: list):
+    """
+    Parse the feeds to display and pause the run on the latest error feed not shown yet.
+
+    Args:
+        agent_execution (AgentExecution): The agent execution the feeds belong to.
+        feeds (list): The feeds of the agent execution, oldest first.
+
+    Returns:
+        tuple: The parsed feeds and the error message to show, "" if none.
+    """
     final_feeds = []
     error = ""
+    new_error = False
     for feed in feeds:
         if feed.error_message:
             if (agent_execution.last_shown_error_id is None) or (feed.id > agent_execution.last_shown_error_id):
@@ -179,15 +244,21 @@ def get_agent_execution_feed(agent_execution_id: int,
                 error = feed.error_message
                 agent_execution.last_shown_error_id = feed.id
                 agent_execution.status = "ERROR_PAUSED"
-                db.session.commit()
+                new_error = True
             if feed.id == agent_execution.last_shown_error_id and agent_execution.status == "ERROR_PAUSED":
                 error = feed.error_message
-        if feed.feed != "" and re.search(r"The current time and date is\s(\w{3}\s\w{3}\s\s?\d{1,2}\s\d{2}:\d{2}:\d{2}\s\d{4})",feed.feed) == None :
+        is_visible = feed.is_visible if feed.is_visible is not None else is_feed_visible(feed.feed)
+        if is_visible:
             final_feeds.append(parse_feed(feed))
+    if new_error:
+        db.session.commit()
+    return final_feeds, error
 
-    # get all permissions
+
+def _get_execution_details(agent_execution: AgentExecution) -> dict:
+    """Get the status, permissions and waiting period of an agent execution."""
     execution_permissions = db.session.query(AgentExecutionPermission).\
-        filter_by(agent_execution_id=agent_execution_id). \
+        filter_by(agent_execution_id=agent_execution.id). \
         order_by(asc(AgentExecutionPermission.created_at)).all()
 
     permissions = [
@@ -211,10 +282,8 @@ def get_agent_execution_feed(agent_execution_id: int,
 
     return {
         "status": agent_execution.status,
-        "feeds": final_feeds,
         "permissions": permissions,
-        "waiting_period": waiting_period,
-        "errors": error
+        "waiting_period": waiting_period
     }
 
 
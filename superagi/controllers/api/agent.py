@@ -1,11 +1,14 @@
 from fastapi import APIRouter
-from fastapi import HTTPException, Depends ,Security
+from fastapi import HTTPException, Depends ,Security, Request
+from fastapi.responses import StreamingResponse
 
 from fastapi_sqlalchemy import db
 from pydantic import BaseModel
 
 from superagi.worker import execute_agent
 from superagi.helper.auth import validate_api_key,get_organisation_from_api_key
+from superagi.lib.execution_event_channel import ExecutionEventChannel
+from superagi.agent.agent_step_context import AgentStepContext
 from superagi.models.agent import Agent
 from superagi.models.agent_execution_config import AgentExecutionConfiguration
 from superagi.models.agent_config import AgentConfiguration
@@ -244,6 +247,7 @@ def update_agent(agent_id: int, agent_with_config: AgentConfigUpdateExtInput,api
     db.session.add(execution)
     db.session.commit()
     db.session.flush()
+    AgentStepContext.invalidate(agent_id=db_agent.id)
     AgentExecutionConfiguration.add_or_update_agent_execution_config(session=db.session, execution=execution,
                                                                      agent_execution_configs=agent_execution_configs)
     db.session.commit()
@@ -276,6 +280,22 @@ def get_agent_runs(agent_id:int,filter_config:RunFilterConfigIn,api_key: str = S
     return response_arr
 
 
+@router.get("/{agent_id}/events")
+def get_agent_run_events(agent_id:int,request:Request,api_key: str = Security(validate_api_key),organisation:Organisation = Depends(get_organisation_from_api_key)):
+    """Stream the status changes and new feeds of the agent's runs as server-sent events, instead of polling run-status"""
+    agent= Agent.get_active_agent_by_id(db.session, agent_id)
+    if not agent:
+        raise HTTPException(status_code=404, detail="Agent not found")
+
+    project=Project.find_by_id(db.session, agent.project_id)
+    if project.organisation_id!=organisation.id:
+        raise HTTPException(status_code=404, detail="Agent not found")
+
+    return StreamingResponse(ExecutionEventChannel.server_sent_events(request, organisation.id, agent.id),
+                             media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
 @router.post("/{agent_id}/pause",status_code=200)
 def pause_agent_runs(agent_id:int,execution_state_change_input:ExecutionStateChangeConfigIn,api_key: str = Security(validate_api_key),organisation:Organisation = Depends(get_organisation_from_api_key)):
     agent= Agent.get_active_agent_by_id(db.session, agent_id)
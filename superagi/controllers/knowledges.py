@@ -1,22 +1,24 @@
 from fastapi_sqlalchemy import db
 from fastapi import HTTPException, Depends, Query, status
 from fastapi import APIRouter
-from datetime import datetime
+from datetime import datetime, timedelta
 from superagi.config.config import get_config
 from superagi.helper.auth import get_user_organisation
 from superagi.models.knowledges import Knowledges
 from superagi.models.marketplace_stats import MarketPlaceStats
 from superagi.models.knowledge_configs import KnowledgeConfigs
+from superagi.models.knowledge_installation import KnowledgeInstallation
 from superagi.models.vector_db_indices import VectordbIndices
 from superagi.models.vector_dbs import Vectordbs
-from superagi.helper.s3_helper import S3Helper
 from superagi.models.vector_db_configs import VectordbConfigs
 from superagi.vector_store.vector_factory import VectorFactory
-from superagi.vector_embeddings.vector_embedding_factory import VectorEmbeddingFactory
 from superagi.helper.time_helper import get_time_difference
+from superagi.worker import install_knowledge
 
 router = APIRouter()
 
+STALLED_INSTALLATION_AGE = timedelta(minutes=10)
+
 @router.get("/get/list")
 def get_knowledge_list(
     page: int = Query(None, title="Page Number"),
@@ -121,34 +123,49 @@ def delete_user_knowledge(knowledge_id: int):
 
 @router.get("/install/{knowledge_name}/index/{vector_db_index_id}")
 def install_selected_knowledge(knowledge_name: str, vector_db_index_id: int, organisation = Depends(get_user_organisation)):
+    """
+    Start installing a marketplace knowledge into a vector db index in the background.
+
+    An unfinished installation of the same knowledge into the same index is resumed rather than started over.
+
+    Args:
+        knowledge_name (str): The name of the marketplace knowledge.
+        vector_db_index_id (int): The ID of the index to install the knowledge into.
+
+    Returns:
+        dict: The installation, whose progress is available from /install/status/{installation_id}.
+    """
     vector_db_index = VectordbIndices.get_vector_index_from_id(db.session, vector_db_index_id)
-    selected_knowledge = Knowledges.fetch_knowledge_details_marketplace(knowledge_name)
-    selected_knowledge_config = KnowledgeConfigs.fetch_knowledge_config_details_marketplace(selected_knowledge['id'])
-    file_chunks = S3Helper().get_json_file(selected_knowledge_config["file_path"])
-    vector = Vectordbs.get_vector_db_from_id(db.session, vector_db_index.vector_db_id)
-    db_creds = VectordbConfigs.get_vector_db_config_from_db_id(db.session, vector.id)
-    upsert_data = VectorEmbeddingFactory.build_vector_storage(vector.db_type, file_chunks).get_vector_embeddings_from_chunks()
-    try:
-        vector_db_storage = VectorFactory.build_vector_storage(vector.db_type, vector_db_index.name, **db_creds)
-        vector_db_storage.add_embeddings_to_vector_db(upsert_data)
-    except Exception as err:
-        raise HTTPException(status_code=400, detail=err)
-    selected_knowledge_data = {
-        "id": -1,
-        "name": selected_knowledge["name"],
-        "description": selected_knowledge["description"],
-        "index_id": vector_db_index_id,
-        "organisation_id": organisation.id,
-        "contributed_by": selected_knowledge["contributed_by"],
-    }
-    new_knowledge = Knowledges.add_update_knowledge(db.session, selected_knowledge_data)
-    removable_key = 'file_path'
-    selected_knowledge_config.pop(removable_key)
-    configs = selected_knowledge_config
-    KnowledgeConfigs.add_update_knowledge_config(db.session, new_knowledge.id, configs)
-    VectordbIndices.update_vector_index_state(db.session, vector_db_index_id, "Marketplace")
-    install_number = MarketPlaceStats.get_knowledge_installation_number(selected_knowledge["id"])
-    MarketPlaceStats.update_knowledge_install_number(db.session, selected_knowledge["id"], int(install_number) + 1)
+    if vector_db_index is None:
+        raise HTTPException(status_code=404, detail="Vector db index not found")
+    installation = KnowledgeInstallation.find_unfinished(db.session, knowledge_name, vector_db_index_id,
+                                                         organisation.id)
+    if installation is None:
+        installation = KnowledgeInstallation.add_installation(db.session, knowledge_name, vector_db_index_id,
+                                                              organisation.id)
+    # a running installation checkpoints every batch, one that stopped doing so lost its worker
+    elif installation.status != "FAILED" and installation.updated_at >= datetime.utcnow() - STALLED_INSTALLATION_AGE:
+        return installation.to_dict()
+    else:
+        KnowledgeInstallation.update_status(db.session, installation.id, "PENDING")
+    install_knowledge.delay(installation.id)
+    return installation.to_dict()
+
+@router.get("/install/status/{installation_id}")
+def get_knowledge_installation_status(installation_id: int, organisation = Depends(get_user_organisation)):
+    """
+    Get the progress of a knowledge installation.
+
+    Args:
+        installation_id (int): The ID of the installation.
+
+    Returns:
+        dict: The status, the number of chunks installed so far and the error of a failed installation.
+    """
+    installation = KnowledgeInstallation.get_installation(db.session, installation_id, organisation.id)
+    if installation is None:
+        raise HTTPException(status_code=404, detail="Knowledge installation not found")
+    return installation.to_dict()
 
 @router.post("/uninstall/{knowledge_name}")
 def uninstall_selected_knowledge(knowledge_name: str, organisation = Depends(get_user_organisation)):
@@ -12,6 +12,7 @@ from fastapi_sqlalchemy import db
 import logging
 from pydantic import BaseModel
 from superagi.helper.llm_loader import LLMLoader
+from superagi.llms.llm_registry import LlmRegistry
 
 router = APIRouter()
 
@@ -41,7 +42,9 @@ class ModelName (BaseModel):
 @router.post("/store_api_keys", status_code=200)
 async def store_api_keys(request: ValidateAPIKeyRequest, organisation=Depends(get_user_organisation)):
     try:
-        return ModelsConfig.store_api_key(db.session, organisation.id, request.model_provider, request.model_api_key)
+        result = ModelsConfig.store_api_key(db.session, organisation.id, request.model_provider, request.model_api_key)
+        LlmRegistry.invalidate(organisation.id)
+        return result
     except Exception as e:
         logging.error(f"Error while storing API key: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal Server Error")
@@ -63,6 +66,7 @@ async def store_lm_studio(request: StoreLMStudioRequest, organisation=Depends(ge
             ModelsConfig.storeLMStudioModelsWithEndpoint(
                 db.session, organisation.id, model_provider.id, request.api_key, request.endpoint
             )
+        LlmRegistry.invalidate(organisation.id)
 
         return {"success": True, "message": "LM Studio configured successfully"}
     except Exception as e:
@@ -103,9 +107,11 @@ async def store_model(request: StoreModelRequest, organisation=Depends(get_user_
         #context_length = 4096
         logger.info(request)
         if 'context_length' in request.dict():
-            return Models.store_model_details(db.session, organisation.id, request.model_name, request.description, request.end_point, request.model_provider_id, request.token_limit, request.type, request.version, request.context_length)
+            result = Models.store_model_details(db.session, organisation.id, request.model_name, request.description, request.end_point, request.model_provider_id, request.token_limit, request.type, request.version, request.context_length)
         else:
-            return Models.store_model_details(db.session, organisation.id, request.model_name, request.description, request.end_point, request.model_provider_id, request.token_limit, request.type, request.version, 0)
+            result = Models.store_model_details(db.session, organisation.id, request.model_name, request.description, request.end_point, request.model_provider_id, request.token_limit, request.type, request.version, 0)
+        LlmRegistry.invalidate(organisation.id)
+        return result
     except Exception as e:
         logging.error(f"Error storing the Model Details: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal Server Error")
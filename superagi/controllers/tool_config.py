@@ -65,6 +65,7 @@ def update_tool_config(toolkit_name: str, configs: list, organisation: Organisat
                     # added encryption
                     tool_config.value = encrypt_data(value)
                     db.session.commit()
+        ToolConfig.invalidate_cache(toolkit.id)
 
         return {"message": "Tool configs updated successfully"}
 
@@ -112,6 +113,7 @@ def create_or_update_tool_config(toolkit_name: str, tool_configs,
     
 
     db.session.commit()
+    ToolConfig.invalidate_cache(toolkit.id)
     db.session.refresh(toolkit)
 
     return toolkit
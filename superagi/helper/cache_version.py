@@ -0,0 +1,58 @@
+import redis
+
+from superagi.lib.logger import logger
+from superagi.lib.redis_pool import RedisPool
+
+
+class CacheVersion:
+    """
+    Version stamps kept in Redis so that process-local caches in the API and the
+    celery workers can tell when the rows they were built from have been written.
+
+    Writers bump a key, readers compare the value they saw when the cache entry was
+    built. If Redis cannot be reached, readers get None and must treat it as a miss.
+    """
+
+    @classmethod
+    def _get_db(cls):
+        return RedisPool.get_client()
+
+    @classmethod
+    def key(cls, namespace: str, identifier) -> str:
+        return f"cache_version:{namespace}:{identifier}"
+
+    @classmethod
+    def fetch(cls, keys: list):
+        """
+        Fetch the current version of every key in a single round trip.
+
+        Args:
+            keys (list): The version keys.
+
+        Returns:
+            tuple: The versions in the order of the keys, or None if Redis is unavailable.
+        """
+        try:
+            values = cls._get_db().mget(keys)
+        except redis.RedisError as e:
+            logger.error(f"Unable to fetch cache versions: {e}")
+            return None
+        return tuple(int(value or 0) for value in values)
+
+    @classmethod
+    def bump(cls, *keys):
+        """
+        Increment the version of the given keys, invalidating every cache built from them.
+
+        Args:
+            *keys: The version keys.
+        """
+        if not keys:
+            return
+        try:
+            pipeline = cls._get_db().pipeline(transaction=False)
+            for key in keys:
+                pipeline.incr(key)
+            pipeline.execute()
+        except redis.RedisError as e:
+            logger.error(f"Unable to bump cache versions {keys}: {e}")
@@ -63,3 +63,19 @@ def is_encrypted(value):
         return False
     except (ValueError, TypeError):
         return False
+
+
+def decrypt_if_encrypted(value):
+    """
+    Decrypts the given value if it was encrypted with the cipher suite, with a single decryption.
+
+    Args:
+        value (str): The possibly encrypted value.
+
+    Returns:
+        str: The decrypted value, or the value itself if it is not encrypted.
+    """
+    try:
+        return cipher_suite.decrypt(value.encode()).decode()
+    except (InvalidToken, InvalidSignature, ValueError, TypeError, AttributeError):
+        return value
@@ -1,9 +1,13 @@
 import json
+import re
 from datetime import datetime
 
 from superagi.helper.time_helper import get_time_difference
 from superagi.lib.logger import logger
 
+CURRENT_TIME_FEED_PATTERN = re.compile(
+    r"The current time and date is\s(\w{3}\s\w{3}\s\s?\d{1,2}\s\d{2}:\d{2}:\d{2}\s\d{4})")
+
 
 def parse_feed(feed):
     """
@@ -20,11 +24,30 @@ def parse_feed(feed):
     # Get the current time
     feed.time_difference = get_time_difference(feed.updated_at, str(datetime.now()))
 
-    # Check if the feed belongs to an assistant role
-    if feed.role == "assistant":
+    if feed.role not in ("assistant", "system", "user"):
+        return feed
+
+    # Feeds written before display_feed was stored are rendered on read
+    display_feed = feed.display_feed if feed.display_feed is not None else render_feed_display(feed.role, feed.feed)
+    return {"role": feed.role, "feed": display_feed, "updated_at": feed.updated_at,
+            "time_difference": feed.time_difference}
+
+
+def render_feed_display(role: str, feed: str):
+    """
+    Render the text shown for a feed, e.g. the thoughts, plan, criticism and tool of an assistant response.
+
+    Args:
+        role (str): The role of the feed.
+        feed (str): The feed content.
+
+    Returns:
+        str: The text to display, or None for roles that are not displayed as text.
+    """
+    if role == "assistant":
         try:
             # Parse the feed as JSON
-            parsed = json.loads(feed.feed, strict=False)
+            parsed = json.loads(feed, strict=False)
 
             final_output = ""
             if "reasoning" in parsed["thoughts"]:
@@ -37,22 +60,21 @@ def parse_feed(feed):
                 final_output += "Tool: " + parsed["tool"]["name"] + "\n"
             if "command" in parsed:
                 final_output += "Tool: " + parsed["command"]["name"] + "\n"
-
-            return {"role": "assistant", "feed": final_output, "updated_at": feed.updated_at,
-                    "time_difference": feed.time_difference}
+            return final_output
         except Exception:
-            return {"role": "assistant", "feed": feed.feed, "updated_at": feed.updated_at,
-                "time_difference": feed.time_difference}
-
-    if feed.role == "system":
-        final_output = feed.feed
-        if "json-schema.org" in feed.feed:
-            final_output = feed.feed.split("TOOLS:")[0]
-        return {"role": "system", "feed": final_output, "updated_at": feed.updated_at,
-                "time_difference": feed.time_difference}
-    
-    if feed.role == "user":
-        return {"role": "user", "feed": feed.feed, "updated_at": feed.updated_at,
-                "time_difference": feed.time_difference}
-    
-    return feed
+            return feed
+
+    if role == "system":
+        if feed and "json-schema.org" in feed:
+            return feed.split("TOOLS:")[0]
+        return feed
+
+    if role == "user":
+        return feed
+
+    return None
+
+
+def is_feed_visible(feed: str) -> bool:
+    """Returns whether a feed is shown in the execution feed, empty feeds and current time prompts are not."""
+    return bool(feed) and CURRENT_TIME_FEED_PATTERN.search(feed) is None
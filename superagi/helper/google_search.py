@@ -4,6 +4,10 @@ from pydantic import BaseModel
 from superagi.lib.logger import logger
 
 from superagi.helper.webpage_extractor import WebpageExtractor
+from superagi.helper.webpage_fetcher import WebpageFetcher
+
+# The search tools stop adding results once they hold this many tokens
+SEARCH_TOKEN_BUDGET = 3000
 
 
 class GoogleSearchWrap:
@@ -87,23 +91,7 @@ class GoogleSearchWrap:
             snippets, links, error_code = self.search_run(query)
 
         if links:
-            for i in range(0, self.num_extracts):
-                time.sleep(3)
-                content = ""
-                # content = self.extractor.extract_with_3k(links[i])
-                # attempts = 0
-                # while content == "" and attempts < 2:
-                #     attempts += 1
-                #     content = self.extractor.extract_with_3k(links[i])
-                content = self.extractor.extract_with_bs4(links[i])
-                max_length = len(' '.join(content.split(" ")[:500]))
-                content = content[:max_length]
-                attempts = 0
-                while content == "" and attempts < 2:
-                    attempts += 1
-                    content = self.extractor.extract_with_bs4(links[i])
-                    content = content[:max_length]
-                webpages.append(content)
+            webpages = WebpageFetcher(self.extractor).fetch(links[:self.num_extracts], token_budget=SEARCH_TOKEN_BUDGET)
         else:
             snippets = []
             links = []
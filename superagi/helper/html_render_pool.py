@@ -0,0 +1,122 @@
+import asyncio
+import atexit
+import queue
+import threading
+from contextlib import contextmanager
+
+import pyppeteer
+from requests_html import HTMLSession
+
+from superagi.config.config import get_config
+from superagi.lib.logger import logger
+
+
+class _Renderer:
+    """An HTMLSession with its own event loop and a headless browser that is launched on the first render."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.session = HTMLSession()
+        self.session.loop = self.loop
+        self.pages_rendered = 0
+
+    def render(self, response, timeout: int):
+        if not hasattr(self.session, "_browser"):
+            # requests_html launches the browser with signal handlers, which only work on the main thread
+            self.session._browser = self.loop.run_until_complete(pyppeteer.launch(
+                headless=True, args=["--no-sandbox"], handleSIGINT=False, handleSIGTERM=False, handleSIGHUP=False))
+        self.pages_rendered += 1
+        response.html.render(timeout=timeout)
+
+    def close(self):
+        try:
+            self.session.close()
+        except Exception as e:
+            logger.error(f"Error while closing headless browser: {e}")
+        finally:
+            self.loop.close()
+
+
+class HtmlRenderPool:
+    """
+    Bounded pool of headless browsers shared by the WebpageExtractor methods that render JavaScript.
+
+    At most RENDER_POOL_SIZE pages are fetched at once. Each browser is reused across pages and
+    replaced after RENDER_POOL_MAX_PAGES renders, or as soon as a render fails, so a wedged or
+    bloated Chromium does not outlive a few pages. Pages whose static HTML already yields
+    RENDER_MIN_STATIC_WORDS words are not rendered at all.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, size: int = 2, max_pages: int = 50, timeout: int = 10, min_static_words: int = 150):
+        self.size = size
+        self.max_pages = max_pages
+        self.timeout = timeout
+        self.min_static_words = min_static_words
+        self._renderers = queue.LifoQueue(maxsize=size)
+        for _ in range(size):
+            self._renderers.put(None)
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls(size=int(get_config("RENDER_POOL_SIZE", 2)),
+                                        max_pages=int(get_config("RENDER_POOL_MAX_PAGES", 50)),
+                                        timeout=int(get_config("RENDER_TIMEOUT", 10)),
+                                        min_static_words=int(get_config("RENDER_MIN_STATIC_WORDS", 150)))
+                    atexit.register(cls._instance.close)
+        return cls._instance
+
+    def fetch(self, url: str, extract, headers: dict = None):
+        """
+        Fetch a page and extract its text, rendering it only if the static HTML is not enough.
+
+        Args:
+            url (str): The URL of the page.
+            extract: Callable taking the HTML of the page and returning its text.
+            headers (dict): Extra request headers.
+
+        Returns:
+            tuple: The response and the extracted text, or None as text if the response is not a 200.
+        """
+        with self._checkout() as renderer:
+            response = renderer.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code != 200:
+                return response, None
+            content = extract(response.html.html)
+            if len(content.split()) >= self.min_static_words:
+                return response, content
+            renderer.render(response, self.timeout)
+            return response, extract(response.html.html)
+
+    def close(self):
+        """Close every idle browser of the pool."""
+        renderers = []
+        while True:
+            try:
+                renderers.append(self._renderers.get_nowait())
+            except queue.Empty:
+                break
+        for renderer in renderers:
+            if renderer is not None:
+                renderer.close()
+            self._renderers.put(None)
+
+    @contextmanager
+    def _checkout(self):
+        renderer = self._renderers.get(timeout=self.timeout * 3) or _Renderer()
+        asyncio.set_event_loop(renderer.loop)
+        try:
+            yield renderer
+        except Exception:
+            renderer.close()
+            renderer = None
+            raise
+        finally:
+            if renderer is not None and renderer.pages_rendered >= self.max_pages:
+                renderer.close()
+                renderer = None
+            self._renderers.put(renderer)
@@ -0,0 +1,98 @@
+import codecs
+import json
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+def iter_json_object_items(chunks):
+    """
+    Iterate over the items of a top-level JSON object read in chunks, holding one item in memory at a time.
+
+    Args:
+        chunks: Iterable of the bytes or str chunks of the JSON document.
+
+    Yields:
+        tuple: The key and the decoded value of each item, in document order.
+
+    Raises:
+        ValueError: If the document is not a well-formed JSON object.
+    """
+    reader = _ChunkReader(chunks)
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.advance(1)
+        return
+    while True:
+        key = reader.decode()
+        if not isinstance(key, str):
+            raise ValueError("JSON object keys must be strings")
+        reader.expect(":")
+        yield key, reader.decode()
+        separator = reader.peek()
+        reader.advance(1)
+        if separator == "}":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or '}}' in JSON object, found {separator!r}")
+
+
+class _ChunkReader:
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    def _read_more(self) -> bool:
+        if self._exhausted:
+            return False
+        # drop what was already consumed, so the buffer only ever holds the current item
+        self._buffer = self._buffer[self._position:]
+        self._position = 0
+        for chunk in self._chunks:
+            if isinstance(chunk, bytes):
+                chunk = self._text_decoder.decode(chunk)
+            if chunk:
+                self._buffer += chunk
+                return True
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        self._exhausted = True
+        return True
+
+    def _skip_whitespace(self):
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in _WHITESPACE:
+                self._position += 1
+            if self._position < len(self._buffer) or not self._read_more():
+                return
+
+    def peek(self) -> str:
+        self._skip_whitespace()
+        if self._position >= len(self._buffer):
+            raise ValueError("Unexpected end of JSON document")
+        return self._buffer[self._position]
+
+    def advance(self, length: int):
+        self._position += length
+
+    def expect(self, character: str):
+        found = self.peek()
+        if found != character:
+            raise ValueError(f"Expected {character!r} in JSON document, found {found!r}")
+        self.advance(1)
+
+    def decode(self):
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._position)
+                # a number at the end of the buffer may continue in the next chunk
+                if end < len(self._buffer) or self._exhausted:
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._exhausted:
+                    raise
+            self._read_more()
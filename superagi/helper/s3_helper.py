@@ -4,6 +4,7 @@ import boto3
 from fastapi import HTTPException
 
 from superagi.config.config import get_config
+from superagi.helper.json_stream import iter_json_object_items
 from superagi.lib.logger import logger
 from urllib.parse import unquote
 import json
@@ -89,6 +90,26 @@ class S3Helper:
         except:
             raise HTTPException(status_code=500, detail="AWS credentials not found. Check your configuration.")
 
+    def iter_json_object_items(self, path, chunk_size: int = 1024 * 1024):
+        """
+        Stream the items of a JSON object file from S3, without loading the whole file in memory.
+
+        Args:
+            path (str): The path to the JSON file.
+            chunk_size (int): The number of bytes read from S3 at a time.
+
+        Raises:
+            HTTPException: If the AWS credentials are not found.
+
+        Returns:
+            generator: The key and value of each item of the JSON object.
+        """
+        try:
+            obj = self.s3.get_object(Bucket=self.bucket_name, Key=path)
+        except:
+            raise HTTPException(status_code=500, detail="AWS credentials not found. Check your configuration.")
+        return iter_json_object_items(obj['Body'].iter_chunks(chunk_size))
+
     def delete_file(self, path):
         """
         Delete a file from S3.
@@ -1,3 +1,7 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List
 
 import tiktoken
@@ -7,6 +11,12 @@ from superagi.lib.logger import logger
 from superagi.models.models import Models
 from sqlalchemy.orm import Session
 
+DEFAULT_TOKENS_PER_MESSAGE = 4
+MODEL_TOKENS_PER_MESSAGE = {"gpt-3.5-turbo-0301": 4, "gpt-4-0314": 3, "gpt-3.5-turbo": 4, "gpt-4": 3,
+                            "gpt-3.5-turbo-16k": 4, "gpt-4-32k": 3, "gpt-4-32k-0314": 3,
+                            "models/chat-bison-001": 4}
+TOKEN_COUNT_CACHE_SIZE = 20000
+
 
 class TokenCounter:
 
@@ -49,39 +59,62 @@ class TokenCounter:
         Returns:
             int: The number of tokens in the messages.
         """
-        try:
-            default_tokens_per_message = 4
-            model_token_per_message_dict = {"gpt-3.5-turbo-0301": 4, "gpt-4-0314": 3, "gpt-3.5-turbo": 4, "gpt-4": 3,
-                                            "gpt-3.5-turbo-16k": 4, "gpt-4-32k": 3, "gpt-4-32k-0314": 3,
-                                            "models/chat-bison-001": 4}
-            encoding = tiktoken.encoding_for_model(model)
-        except KeyError:
-            logger.warning("Warning: model not found. Using cl100k_base encoding.")
-            encoding = tiktoken.get_encoding("cl100k_base")
-
-        if model in model_token_per_message_dict.keys():
-            tokens_per_message = model_token_per_message_dict[model]
-        else:
-            tokens_per_message = default_tokens_per_message
-
-        if tokens_per_message is None:
-            raise NotImplementedError(
-                f"num_tokens_from_messages() is not implemented for model {model}.\n"
-                " See https://github.com/openai/openai-python/blob/main/chatml.md for"
-                " information on how messages are converted to tokens."
-            )
-
-        num_tokens = 0
-        for message in messages:
-            if isinstance(message, str):
-                message = {'content': message}
-            num_tokens += tokens_per_message
-            num_tokens += len(encoding.encode(message['content']))
-
-        num_tokens += 3
+        num_tokens = sum(TokenCounter.count_batch(messages, model)) + 3
         print("tokens",num_tokens)
         return num_tokens
 
+    @staticmethod
+    def count_batch(messages: List[BaseMessage], model: str = "gpt-3.5-turbo-0301") -> List[int]:
+        """
+        Function to count the tokens of every message in a list in one pass. Counts are cached by
+        content hash, so messages seen in earlier iterations are not tokenized again, and messages
+        carrying the token_count stored with their feed are not tokenized at all.
+
+        Args:
+            messages (List[BaseMessage]): The list of messages to count the tokens for.
+            model (str): The model to count the tokens for.
+
+        Returns:
+            List[int]: The number of tokens of each message, including the per message overhead
+            but not the 3 tokens every reply is primed with.
+        """
+        tokens_per_message = MODEL_TOKENS_PER_MESSAGE.get(model, DEFAULT_TOKENS_PER_MESSAGE)
+        encoding = _get_encoding(model)
+        # stored feed token counts are computed with cl100k_base, see count_content_tokens
+        use_stored_counts = encoding.name == "cl100k_base"
+        counts = [None] * len(messages)
+        uncounted = []
+        for index, message in enumerate(messages):
+            if use_stored_counts and isinstance(message, dict) and message.get('token_count') is not None:
+                counts[index] = message['token_count']
+            else:
+                uncounted.append(index)
+
+        contents = [messages[index] if isinstance(messages[index], str) else messages[index]['content']
+                    for index in uncounted]
+        for index, content_tokens in zip(uncounted, _count_content_tokens(encoding, contents)):
+            counts[index] = content_tokens
+        return [tokens_per_message + content_tokens for content_tokens in counts]
+
+    @staticmethod
+    def count_content_tokens(content: str) -> int:
+        """
+        Function to count the tokens of a feed's content, without any per message overhead.
+        This is the value stored in AgentExecutionFeed.token_count.
+
+        Args:
+            content (str): The content to count the tokens for.
+
+        Returns:
+            int: The number of tokens in the content, None if the encoding could not be loaded.
+        """
+        try:
+            encoding = _get_encoding_by_name("cl100k_base")
+        except Exception as e:
+            logger.error(f"Unable to load encoding to count feed tokens: {e}")
+            return None
+        return _count_content_tokens(encoding, [content or ""])[0]
+
     @staticmethod
     def count_text_tokens(message: str) -> int:
         """
@@ -93,6 +126,52 @@ class TokenCounter:
         Returns:
             int: The number of tokens in the text.
         """
-        encoding = tiktoken.get_encoding("cl100k_base")
-        num_tokens = len(encoding.encode(message)) + 4
+        encoding = _get_encoding_by_name("cl100k_base")
+        num_tokens = _count_content_tokens(encoding, [message])[0] + 4
         return num_tokens
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        logger.warning("Warning: model not found. Using cl100k_base encoding.")
+        return _get_encoding_by_name("cl100k_base")
+
+
+@lru_cache(maxsize=None)
+def _get_encoding_by_name(encoding_name: str):
+    return tiktoken.get_encoding(encoding_name)
+
+
+_token_count_cache = OrderedDict()
+_token_count_cache_lock = threading.Lock()
+
+
+def _count_content_tokens(encoding, contents: List[str]) -> List[int]:
+    if not contents:
+        return []
+    keys = [(encoding.name, hashlib.md5(content.encode("utf-8")).digest()) for content in contents]
+    counts = [None] * len(contents)
+    with _token_count_cache_lock:
+        for index, key in enumerate(keys):
+            if key in _token_count_cache:
+                _token_count_cache.move_to_end(key)
+                counts[index] = _token_count_cache[key]
+
+    missing = [index for index, count in enumerate(counts) if count is None]
+    if not missing:
+        return counts
+    if len(missing) == 1:
+        encoded = [encoding.encode(contents[missing[0]])]
+    else:
+        encoded = encoding.encode_batch([contents[index] for index in missing])
+
+    with _token_count_cache_lock:
+        for index, tokens in zip(missing, encoded):
+            counts[index] = len(tokens)
+            _token_count_cache[keys[index]] = counts[index]
+        while len(_token_count_cache) > TOKEN_COUNT_CACHE_SIZE:
+            _token_count_cache.popitem(last=False)
+    return counts
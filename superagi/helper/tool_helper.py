@@ -1,20 +1,18 @@
-import importlib.util
-import inspect
 import json
 import os
-import sys
 import zipfile
 from urllib.parse import urlparse
 
 import requests
 
 from superagi.config.config import get_config
+from superagi.helper.tool_import_registry import ToolImportRegistry
+from superagi.helper.tool_manifest import ToolManifest
 from superagi.lib.logger import logger
 from superagi.models.tool import Tool
 from superagi.models.tool_config import ToolConfig
 from superagi.models.toolkit import Toolkit
-from superagi.tools.base_tool import BaseTool, ToolConfiguration
-from superagi.tools.base_tool import BaseToolkit
+from superagi.types.key_type import ToolConfigKeyType
 
 
 def parse_github_url(github_url):
@@ -68,172 +66,118 @@ def download_tool(tool_url, target_folder):
     os.remove(tool_zip_file_path)
 
 
-def get_classes_in_file(file_path, clazz):
-    classes = []
-
-    module = load_module_from_file(file_path)
-
-    for name, member in inspect.getmembers(module):
-        if inspect.isclass(member) and issubclass(member, clazz) and member != clazz:
-            class_dict = {}
-            class_dict['class_name'] = member.__name__
-
-            class_obj = getattr(module, member.__name__)
-            try:
-                obj = class_obj()
-                if clazz == BaseToolkit:
-                    get_toolkit_info(class_dict, classes, obj)
-                elif clazz == BaseTool:
-                    get_tool_info(class_dict, classes, obj)
-            except:
-                class_dict = None
-    return classes
-
-
-def get_tool_info(class_dict, classes, obj):
-    """
-        Get tool information from an object.
-    """
-    class_dict['tool_name'] = obj.name
-    class_dict['tool_description'] = obj.description
-    classes.append(class_dict)
-
-
-def get_toolkit_info(class_dict, classes, obj):
-    """
-        Get toolkit information from an object.
-    """
-    class_dict['toolkit_name'] = obj.name
-    class_dict['toolkit_description'] = obj.description
-    class_dict['toolkit_tools'] = obj.get_tools()
-    class_dict['toolkit_keys'] = obj.get_env_keys()
-    classes.append(class_dict)
-
-
-def load_module_from_file(file_path):
-    spec = importlib.util.spec_from_file_location("module_name", file_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-
-    return module
-
-
-def init_tools(folder_paths, session, tool_name_to_toolkit):
-    # Iterate over all subfolders
-    for folder_path in folder_paths:
-        if not os.path.exists(folder_path):
-            continue
-        for folder_name in os.listdir(folder_path):
-            folder_dir = os.path.join(folder_path, folder_name)
-            # Iterate over all files in the subfolder
-            if not os.path.isdir(folder_dir):
-                continue
-                # sys.path.append(os.path.abspath('superagi/tools/email'))
-            sys.path.append(folder_dir)
-            for file_name in os.listdir(folder_dir):
-                file_path = os.path.join(folder_dir, file_name)
-                if file_name.endswith(".py") and not file_name.startswith("__init__"):
-                    # Get classes
-                    classes = get_classes_in_file(file_path=file_path, clazz=BaseTool)
-                    update_base_tool_class_info(classes, file_name, folder_name, session, tool_name_to_toolkit)
-
-
-def update_base_tool_class_info(classes, file_name, folder_name, session, tool_name_to_toolkit):
-    for clazz in classes:
-        if clazz["class_name"] is not None:
-            tool_name = clazz['tool_name']
-            tool_description = clazz['tool_description']
-            toolkit_id = tool_name_to_toolkit.get((tool_name, folder_name), None)
-            if toolkit_id is not None:
-                new_tool = Tool.add_or_update(session, tool_name=tool_name, folder_name=folder_name,
-                                              class_name=clazz['class_name'], file_name=file_name,
-                                              toolkit_id=tool_name_to_toolkit[(tool_name, folder_name)],
-                                              description=tool_description)
-
-
-def init_toolkits(code_link, existing_toolkits, folder_paths, organisation, session):
-    tool_name_to_toolkit = {}
-    new_toolkits = []
-    # Iterate over all subfolders
-    for folder_path in folder_paths:
-        if not os.path.exists(folder_path):
-            continue
-        for folder_name in os.listdir(folder_path):
-            folder_dir = os.path.join(folder_path, folder_name)
-
-            if not os.path.isdir(folder_dir):
-                continue
-                # sys.path.append(os.path.abspath('superagi/tools/email'))
-            sys.path.append(folder_dir)
-            # Iterate over all files in the subfolder
-            for file_name in os.listdir(folder_dir):
-                file_path = os.path.join(folder_dir, file_name)
-                if file_name.endswith(".py") and not file_name.startswith("__init__"):
-                    # Get classes
-                    classes = get_classes_in_file(file_path=file_path, clazz=BaseToolkit)
-                    tool_name_to_toolkit = update_base_toolkit_info(classes, code_link, folder_name, new_toolkits,
-                                                                    organisation, session, tool_name_to_toolkit)
-    # Delete toolkits that are not present in the updated toolkits
-    delete_extra_toolkit(existing_toolkits, new_toolkits, session)
-    return tool_name_to_toolkit
-
-
 def delete_extra_toolkit(existing_toolkits, new_toolkits, session):
+    deleted_toolkit_ids = []
     for toolkit in existing_toolkits:
         if toolkit.name not in [new_toolkit.name for new_toolkit in new_toolkits]:
             session.query(Tool).filter(Tool.toolkit_id == toolkit.id).delete()
             session.query(ToolConfig).filter(ToolConfig.toolkit_id == toolkit.id).delete()
+            deleted_toolkit_ids.append(toolkit.id)
             session.delete(toolkit)
     # Commit the changes to the database
     session.commit()
+    for toolkit_id in deleted_toolkit_ids:
+        ToolConfig.invalidate_cache(toolkit_id)
 
 
-def update_base_toolkit_info(classes, code_link, folder_name, new_toolkits, organisation, session,
-                             tool_name_to_toolkit):
-    for clazz in classes:
-        if clazz["class_name"] is not None:
-            toolkit_name = clazz["toolkit_name"]
-            toolkit_description = clazz["toolkit_description"]
-            tools = clazz["toolkit_tools"]
-            tool_config_keys = clazz["toolkit_keys"]
-            # Create a new ToolKit object
-            new_toolkit = Toolkit.add_or_update(
-                session,
-                name=toolkit_name,
-                description=toolkit_description,
-                show_toolkit=True if len(tools) > 1 else False,
-                organisation_id=organisation.id,
-                tool_code_link=code_link
-            )
-            new_toolkits.append(new_toolkit)
-            tool_mapping = {}
-            # Store the tools in the database
-            for tool in tools:
-                new_tool = Tool.add_or_update(session, tool_name=tool.name, folder_name=folder_name,
-                                              class_name=None, file_name=None,
-                                              toolkit_id=new_toolkit.id, description=tool.description)
-                tool_mapping[tool.name, folder_name] = new_toolkit.id
-            tool_name_to_toolkit = {**tool_mapping, **tool_name_to_toolkit}
-
-            # Store the tools config in the database
-            for tool_config_key in tool_config_keys:
-                if isinstance(tool_config_key, ToolConfiguration):
-                    new_config = ToolConfig.add_or_update(session, toolkit_id=new_toolkit.id,
-                                                      key=tool_config_key.key,
-                                                      key_type=tool_config_key.key_type,
-                                                      is_required=tool_config_key.is_required,
-                                                      is_secret=tool_config_key.is_secret)
-                else:
-                    ToolConfig.add_or_update(session, toolkit_id=new_toolkit.id,
-                                                          key = tool_config_key)
-    return tool_name_to_toolkit
+def sync_toolkits(session, organisation, manifest, code_link=None):
+    """
+    Bring the toolkits, tools and tool configs of an organisation in line with a tool manifest.
 
+    The existing rows are read with one query per table and only the rows that differ from the
+    manifest are written, followed by a single commit.
 
-def process_files(folder_paths, session, organisation, code_link=None):
+    Args:
+        session: The database session.
+        organisation: The organisation to register the toolkits for.
+        manifest (dict): The manifest built by `ToolManifest.scan`.
+        code_link (str): The code link of the toolkits.
+    """
     existing_toolkits = session.query(Toolkit).filter(Toolkit.organisation_id == organisation.id).all()
+    toolkits_by_name = {}
+    for toolkit in existing_toolkits:
+        toolkits_by_name.setdefault(toolkit.name, toolkit)
 
-    tool_name_to_toolkit = init_toolkits(code_link, existing_toolkits, folder_paths, organisation, session)
-    init_tools(folder_paths, session, tool_name_to_toolkit)
+    # toolkit rows, created or updated in manifest order, the last file declaring a toolkit wins
+    new_toolkits = []
+    for toolkit_entry in manifest["toolkits"]:
+        toolkit = toolkits_by_name.get(toolkit_entry["name"])
+        if toolkit is None:
+            toolkit = Toolkit(name=toolkit_entry["name"], organisation_id=organisation.id)
+            session.add(toolkit)
+            toolkits_by_name[toolkit.name] = toolkit
+        _set_changed(toolkit, description=toolkit_entry["description"],
+                     show_toolkit=len(toolkit_entry["tools"]) > 1, tool_code_link=code_link)
+        new_toolkits.append(toolkit)
+    session.flush()
+
+    # desired tools and configs, keyed like Tool.add_or_update and ToolConfig.add_or_update
+    tool_name_to_toolkit = {}
+    desired_tools = {}
+    desired_configs = {}
+    for toolkit_entry in manifest["toolkits"]:
+        toolkit_id = toolkits_by_name[toolkit_entry["name"]].id
+        tool_mapping = {}
+        for tool in toolkit_entry["tools"]:
+            desired_tools[toolkit_id, tool["name"]] = {"folder_name": toolkit_entry["folder_name"], "class_name": None,
+                                                       "file_name": None, "description": tool["description"]}
+            tool_mapping[tool["name"], toolkit_entry["folder_name"]] = toolkit_id
+        tool_name_to_toolkit = {**tool_mapping, **tool_name_to_toolkit}
+        for config in toolkit_entry["configs"]:
+            desired_configs[toolkit_id, config["key"]] = {
+                "key_type": config["key_type"] or ToolConfigKeyType.STRING.value,
+                "is_required": config["is_required"], "is_secret": config["is_secret"]}
+    for tool in manifest["tools"]:
+        toolkit_id = tool_name_to_toolkit.get((tool["name"], tool["folder_name"]))
+        if toolkit_id is not None:
+            desired_tools[toolkit_id, tool["name"]] = {"folder_name": tool["folder_name"],
+                                                       "class_name": tool["class_name"],
+                                                       "file_name": tool["file_name"],
+                                                       "description": tool["description"]}
+
+    toolkit_ids = list({toolkit_id for toolkit_id, _ in list(desired_tools) + list(desired_configs)})
+    existing_tools = {}
+    existing_configs = {}
+    if toolkit_ids:
+        for tool in session.query(Tool).filter(Tool.toolkit_id.in_(toolkit_ids)).all():
+            existing_tools.setdefault((tool.toolkit_id, tool.name), tool)
+        for tool_config in session.query(ToolConfig).filter(ToolConfig.toolkit_id.in_(toolkit_ids)).all():
+            existing_configs.setdefault((tool_config.toolkit_id, tool_config.key), tool_config)
+
+    for (toolkit_id, tool_name), values in desired_tools.items():
+        tool = existing_tools.get((toolkit_id, tool_name))
+        if tool is None:
+            session.add(Tool(name=tool_name, toolkit_id=toolkit_id, **values))
+        else:
+            _set_changed(tool, **values)
+
+    changed_config_toolkit_ids = set()
+    for (toolkit_id, key), values in desired_configs.items():
+        tool_config = existing_configs.get((toolkit_id, key))
+        if tool_config is None:
+            session.add(ToolConfig(toolkit_id=toolkit_id, key=key, value=None, **values))
+            changed_config_toolkit_ids.add(toolkit_id)
+        elif _set_changed(tool_config, **values):
+            changed_config_toolkit_ids.add(toolkit_id)
+
+    # Delete toolkits that are not present in the updated toolkits, this commits the changes
+    delete_extra_toolkit(existing_toolkits, new_toolkits, session)
+    for toolkit_id in changed_config_toolkit_ids:
+        ToolConfig.invalidate_cache(toolkit_id)
+
+
+def _set_changed(row, **values) -> bool:
+    """Sets the attributes of a row that differ from the given values, returns whether any did."""
+    changed = False
+    for attribute, value in values.items():
+        if getattr(row, attribute) != value:
+            setattr(row, attribute, value)
+            changed = True
+    return changed
+
+
+def process_files(folder_paths, session, organisation, code_link=None):
+    sync_toolkits(session, organisation, ToolManifest.scan(folder_paths), code_link)
 
 
 def get_readme_content_from_code_link(tool_code_link):
@@ -295,15 +239,8 @@ def add_tool_to_json(repo_link):
 
 
 def handle_tools_import():
-    print("Handling tools import")
-    tool_paths = ["superagi/tools", "superagi/tools/marketplace_tools", "superagi/tools/external_tools"]
-    for tool_path in tool_paths:
-        if not os.path.exists(tool_path):
-            continue
-        for folder_name in os.listdir(tool_path):
-            folder_dir = os.path.join(tool_path, folder_name)
-            if os.path.isdir(folder_dir):
-                sys.path.append(folder_dir)
+    """Add the tool folders to sys.path and import the tool modules, once per process."""
+    ToolImportRegistry.initialize()
 
 def compare_tools(tool1, tool2):
     fields = ["name", "description"]
@@ -0,0 +1,104 @@
+import importlib
+import os
+import sys
+import threading
+
+from superagi.lib.logger import logger
+
+TOOL_PATHS = ["superagi/tools", "superagi/tools/external_tools", "superagi/tools/marketplace_tools"]
+
+
+class ToolImportRegistry:
+    """
+    Once-per-process registry of the tool folders and the tool classes loaded from them.
+
+    The first call to initialize() adds every tool folder to sys.path exactly once and imports
+    the tool modules, so building a tool on a step is a dictionary lookup instead of a
+    filesystem probe and an import. Folders added later, e.g. by a marketplace install, are
+    picked up the first time one of their tools is requested.
+    """
+    _lock = threading.RLock()
+    _initialized = False
+    _tool_dirs = {}
+    _classes = {}
+
+    @classmethod
+    def initialize(cls, preload: bool = True):
+        """
+        Register the tool folders and optionally import their modules, once per process.
+
+        Args:
+            preload (bool): Import the modules of every tool folder.
+        """
+        if cls._initialized:
+            return
+        with cls._lock:
+            if cls._initialized:
+                return
+            cls._scan_tool_dirs()
+            if preload:
+                cls._preload_modules()
+            cls._initialized = True
+
+    @classmethod
+    def get_tool_class(cls, folder_name: str, file_name: str, class_name: str):
+        """
+        Get a tool class, importing its module on first use.
+
+        Args:
+            folder_name (str): The folder of the tool.
+            file_name (str): The module of the tool, without the ".py" extension.
+            class_name (str): The name of the tool class.
+
+        Returns:
+            type: The tool class.
+        """
+        key = (folder_name, file_name, class_name)
+        tool_class = cls._classes.get(key)
+        if tool_class is not None:
+            return tool_class
+
+        cls.initialize(preload=False)
+        with cls._lock:
+            if folder_name not in cls._tool_dirs:
+                cls._scan_tool_dirs()
+            tools_dir = cls._tool_dirs.get(folder_name, "")
+        module_name = ".".join(tools_dir.split("/") + [folder_name, file_name])
+        module = importlib.import_module(module_name)
+        tool_class = getattr(module, class_name)
+        cls._classes[key] = tool_class
+        return tool_class
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._initialized = False
+            cls._tool_dirs.clear()
+            cls._classes.clear()
+
+    @classmethod
+    def _scan_tool_dirs(cls):
+        for tool_path in TOOL_PATHS:
+            if not os.path.isdir(tool_path):
+                continue
+            for folder_name in sorted(os.listdir(tool_path)):
+                folder_dir = os.path.join(tool_path, folder_name)
+                if not os.path.isdir(folder_dir) or folder_name.startswith(("_", ".")):
+                    continue
+                # the first root holding a folder wins, as it does when tools are built
+                cls._tool_dirs.setdefault(folder_name, tool_path)
+                if folder_dir not in sys.path:
+                    sys.path.append(folder_dir)
+
+    @classmethod
+    def _preload_modules(cls):
+        for folder_name, tool_path in cls._tool_dirs.items():
+            folder_dir = os.path.join(tool_path, folder_name)
+            for file_name in sorted(os.listdir(folder_dir)):
+                if not file_name.endswith(".py") or file_name.startswith("_"):
+                    continue
+                module_name = ".".join(tool_path.split("/") + [folder_name, file_name[:-3]])
+                try:
+                    importlib.import_module(module_name)
+                except Exception as e:
+                    logger.error(f"Unable to preload tool module {module_name}: {e}")
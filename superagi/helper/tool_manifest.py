@@ -0,0 +1,181 @@
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import sys
+import threading
+
+from superagi.config.config import get_config
+from superagi.lib.logger import logger
+from superagi.tools.base_tool import BaseTool, BaseToolkit, ToolConfiguration
+from superagi.types.key_type import ToolConfigKeyType
+
+MANIFEST_VERSION = 2
+
+
+def load_module_from_file(file_path):
+    spec = importlib.util.spec_from_file_location("module_name", file_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+class ToolManifest:
+    """
+    Manifest of the toolkits, tools and tool configs declared by the tool files.
+
+    The files of a toolkit folder are only executed when one of them is new, removed or changed,
+    and then all of them are, since a toolkit reads its tools from the sibling modules. What was
+    read from each folder is kept for the process and in a JSON file (TOOL_MANIFEST_CACHE_FILE),
+    keyed by the mtimes and sizes of its files and, when those changed, the hash of their content.
+    Registering the toolkits of many organisations therefore costs one scan of the tool folders,
+    which is then reused for every organisation.
+    """
+    _lock = threading.Lock()
+    _folders = None
+    _dirty = False
+
+    @classmethod
+    def scan(cls, folder_paths: list) -> dict:
+        """
+        Build the manifest of the tool folders.
+
+        Args:
+            folder_paths (list): The folders holding one folder per toolkit.
+
+        Returns:
+            dict: "toolkits", the toolkits with their tools and configs, and "tools", the tool
+                classes, both in the order the files were found.
+        """
+        manifest = {"toolkits": [], "tools": []}
+        with cls._lock:
+            cls._load_cache()
+            for folder_path in folder_paths:
+                if not os.path.exists(folder_path):
+                    continue
+                for folder_name in os.listdir(folder_path):
+                    folder_dir = os.path.join(folder_path, folder_name)
+                    if not os.path.isdir(folder_dir):
+                        continue
+                    if folder_dir not in sys.path:
+                        sys.path.append(folder_dir)
+                    for file_name, entry in cls._get_folder_entries(folder_dir):
+                        manifest["toolkits"].extend({**toolkit, "folder_name": folder_name}
+                                                    for toolkit in entry["toolkits"])
+                        manifest["tools"].extend({**tool, "folder_name": folder_name, "file_name": file_name}
+                                                 for tool in entry["tools"])
+            cls._save_cache()
+        return manifest
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._folders = None
+            cls._dirty = False
+
+    @classmethod
+    def _cache_file(cls) -> str:
+        return get_config("TOOL_MANIFEST_CACHE_FILE", "/tmp/superagi_tool_manifest.json")
+
+    @classmethod
+    def _load_cache(cls):
+        if cls._folders is not None:
+            return
+        cls._folders = {}
+        try:
+            with open(cls._cache_file()) as file:
+                cache = json.load(file)
+            if cache.get("version") == MANIFEST_VERSION:
+                cls._folders = cache["folders"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Ignoring unreadable tool manifest cache: {e}")
+
+    @classmethod
+    def _save_cache(cls):
+        if not cls._dirty:
+            return
+        cache_file = cls._cache_file()
+        try:
+            temp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(temp_file, "w") as file:
+                json.dump({"version": MANIFEST_VERSION, "folders": cls._folders}, file)
+            os.replace(temp_file, cache_file)
+            cls._dirty = False
+        except OSError as e:
+            logger.error(f"Unable to write tool manifest cache: {e}")
+
+    @classmethod
+    def _get_folder_entries(cls, folder_dir: str) -> list:
+        """Returns the file name and the entry read from each tool file of a toolkit folder."""
+        file_names = sorted(file_name for file_name in os.listdir(folder_dir)
+                            if file_name.endswith(".py") and not file_name.startswith("__init__"))
+        stats = {}
+        for file_name in file_names:
+            stat = os.stat(os.path.join(folder_dir, file_name))
+            stats[file_name] = [stat.st_mtime_ns, stat.st_size]
+        folder = cls._folders.get(folder_dir)
+        if folder is not None and folder["files"] == stats:
+            return [(file_name, folder["entries"][file_name]) for file_name in file_names]
+
+        content_hash = hashlib.sha256()
+        for file_name in file_names:
+            with open(os.path.join(folder_dir, file_name), "rb") as file:
+                content_hash.update(file_name.encode() + b"\0" + hashlib.sha256(file.read()).digest())
+        if folder is None or folder["sha256"] != content_hash.hexdigest():
+            cls._forget_modules(folder_dir)
+            folder = {"sha256": content_hash.hexdigest(),
+                      "entries": {file_name: cls._read_tool_file(os.path.join(folder_dir, file_name))
+                                  for file_name in file_names}}
+        folder["files"] = stats
+        cls._folders[folder_dir] = folder
+        cls._dirty = True
+        return [(file_name, folder["entries"][file_name]) for file_name in file_names]
+
+    @staticmethod
+    def _forget_modules(folder_dir: str):
+        """Drop the imported modules of a changed folder, so its files import the current sibling modules."""
+        folder_dir = os.path.abspath(folder_dir)
+        for name, module in list(sys.modules.items()):
+            module_file = getattr(module, "__file__", None)
+            if module_file and os.path.dirname(os.path.abspath(module_file)) == folder_dir:
+                del sys.modules[name]
+
+    @classmethod
+    def _read_tool_file(cls, file_path: str) -> dict:
+        module = load_module_from_file(file_path)
+        toolkits = []
+        tools = []
+        for name, member in inspect.getmembers(module):
+            if not inspect.isclass(member):
+                continue
+            try:
+                if issubclass(member, BaseToolkit) and member != BaseToolkit:
+                    toolkits.append(cls._toolkit_entry(member))
+                elif issubclass(member, BaseTool) and member != BaseTool:
+                    tool = member()
+                    tools.append({"class_name": member.__name__, "name": tool.name,
+                                  "description": tool.description})
+            except Exception:
+                # classes that cannot be instantiated without arguments are not registered
+                continue
+        return {"toolkits": toolkits, "tools": tools}
+
+    @staticmethod
+    def _toolkit_entry(toolkit_class) -> dict:
+        toolkit = toolkit_class()
+        configs = []
+        for config_key in toolkit.get_env_keys():
+            if isinstance(config_key, ToolConfiguration):
+                key_type = config_key.key_type
+                configs.append({"key": config_key.key,
+                                "key_type": key_type.value if isinstance(key_type, ToolConfigKeyType) else key_type,
+                                "is_required": config_key.is_required, "is_secret": config_key.is_secret})
+            else:
+                configs.append({"key": config_key, "key_type": None, "is_required": False, "is_secret": False})
+        return {"class_name": toolkit_class.__name__, "name": toolkit.name, "description": toolkit.description,
+                "tools": [{"name": tool.name, "description": tool.description} for tool in toolkit.get_tools()],
+                "configs": configs}
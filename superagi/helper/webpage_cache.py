@@ -0,0 +1,217 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+import redis
+
+from superagi.config.config import get_config
+from superagi.lib.logger import logger
+from superagi.lib.redis_pool import RedisPool
+
+
+class WebpageCacheEntry:
+    """
+    Text extracted from a web page, with the validators needed to revalidate it once it is stale.
+
+    Attributes:
+        key (str): The cache key of the entry.
+        text (str): The extracted text.
+        etag (str): The ETag header of the page, if any.
+        last_modified (str): The Last-Modified header of the page, if any.
+        stored_at (float): When the page was last fetched or revalidated, in seconds since the epoch.
+    """
+
+    def __init__(self, key: str, text: str, etag: str = None, last_modified: str = None, stored_at: float = None):
+        self.key = key
+        self.text = text
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at if stored_at is not None else time.time()
+
+    def is_fresh(self, ttl: int) -> bool:
+        return time.time() - self.stored_at < ttl
+
+    def conditional_headers(self) -> dict:
+        """Returns the headers that turn a request for the page into a revalidation."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_json(self) -> str:
+        return json.dumps({"text": self.text, "etag": self.etag, "last_modified": self.last_modified,
+                           "stored_at": self.stored_at})
+
+    @classmethod
+    def from_json(cls, key: str, value: str):
+        data = json.loads(value)
+        return cls(key, data["text"], data.get("etag"), data.get("last_modified"), data.get("stored_at"))
+
+
+class RedisWebpageCacheBackend:
+    """Keeps entries in Redis, evicting the least recently stored ones beyond max_entries."""
+    INDEX_KEY = "webpage_cache:index"
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+
+    def get(self, key: str):
+        value = RedisPool.get_client().get(key)
+        return WebpageCacheEntry.from_json(key, value) if value is not None else None
+
+    def put(self, entry: WebpageCacheEntry):
+        pipeline = RedisPool.get_client().pipeline(transaction=True)
+        pipeline.set(entry.key, entry.to_json())
+        pipeline.zadd(self.INDEX_KEY, {entry.key: entry.stored_at})
+        pipeline.zcard(self.INDEX_KEY)
+        size = pipeline.execute()[-1]
+        if size > self.max_entries:
+            evicted = RedisPool.get_client().zpopmin(self.INDEX_KEY, size - self.max_entries)
+            if evicted:
+                RedisPool.get_client().delete(*[key for key, _ in evicted])
+
+
+class DiskWebpageCacheBackend:
+    """Keeps entries as files in a local directory, evicting the least recently stored ones beyond max_entries."""
+
+    def __init__(self, directory: str, max_entries: int):
+        self.directory = directory
+        self.max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key.replace(":", "_") + ".json")
+
+    def get(self, key: str):
+        try:
+            with open(self._path(key), "r") as cache_file:
+                return WebpageCacheEntry.from_json(key, cache_file.read())
+        except (OSError, ValueError):
+            return None
+
+    def put(self, entry: WebpageCacheEntry):
+        with open(self._path(entry.key), "w") as cache_file:
+            cache_file.write(entry.to_json())
+        paths = [os.path.join(self.directory, name) for name in os.listdir(self.directory)]
+        if len(paths) > self.max_entries:
+            paths.sort(key=os.path.getmtime)
+            for path in paths[:len(paths) - self.max_entries]:
+                os.remove(path)
+
+
+class WebpageCache:
+    """
+    Cache of the text WebpageExtractor extracts from web pages, keyed by extraction method and URL.
+
+    Entries are fresh for WEBPAGE_CACHE_TTL seconds. Stale entries carrying an ETag or
+    Last-Modified validator are revalidated with a conditional request instead of being
+    downloaded and parsed again. WEBPAGE_CACHE_BACKEND selects "redis" (default), "disk"
+    (under WEBPAGE_CACHE_DIR) or "none"; either backend keeps at most WEBPAGE_CACHE_MAX_ENTRIES.
+    """
+    _backend = None
+    _lock = threading.Lock()
+    _metrics = {"hits": 0, "misses": 0, "revalidations": 0, "stores": 0, "errors": 0}
+
+    @classmethod
+    def _get_backend(cls):
+        if cls._backend is None:
+            backend_name = str(get_config("WEBPAGE_CACHE_BACKEND", "redis")).lower()
+            max_entries = int(get_config("WEBPAGE_CACHE_MAX_ENTRIES", 1000))
+            if backend_name == "disk":
+                cls._backend = DiskWebpageCacheBackend(
+                    get_config("WEBPAGE_CACHE_DIR", "/tmp/superagi_webpage_cache"), max_entries)
+            elif backend_name == "redis":
+                cls._backend = RedisWebpageCacheBackend(max_entries)
+            else:
+                cls._backend = False
+        return cls._backend
+
+    @classmethod
+    def ttl(cls) -> int:
+        return int(get_config("WEBPAGE_CACHE_TTL", 3600))
+
+    @classmethod
+    def build_key(cls, method: str, url: str) -> str:
+        return f"webpage_cache:{method}:{hashlib.sha256(url.encode('utf-8')).hexdigest()}"
+
+    @classmethod
+    def get(cls, method: str, url: str):
+        """
+        Get the cached entry of a page, fresh or stale.
+
+        Args:
+            method (str): The extraction method, e.g. "bs4".
+            url (str): The URL of the page.
+
+        Returns:
+            WebpageCacheEntry: The entry, or None if the page is not cached.
+        """
+        backend = cls._get_backend()
+        if not backend:
+            return None
+        try:
+            entry = backend.get(cls.build_key(method, url))
+        except (redis.RedisError, OSError) as e:
+            logger.error(f"Unable to read webpage cache: {e}")
+            cls._count("errors")
+            return None
+        cls._count("hits" if entry is not None and entry.is_fresh(cls.ttl()) else "misses")
+        return entry
+
+    @classmethod
+    def put(cls, method: str, url: str, text: str, headers=None):
+        """
+        Store the text extracted from a page along with its validators.
+
+        Args:
+            method (str): The extraction method, e.g. "bs4".
+            url (str): The URL of the page.
+            text (str): The extracted text.
+            headers: The response headers of the page.
+        """
+        backend = cls._get_backend()
+        if not backend or not text:
+            return
+        headers = headers or {}
+        entry = WebpageCacheEntry(cls.build_key(method, url), text, headers.get("ETag"), headers.get("Last-Modified"))
+        cls._store(backend, entry)
+        cls._count("stores")
+
+    @classmethod
+    def revalidated(cls, entry: WebpageCacheEntry):
+        """Mark a stale entry as fresh again after the server answered 304 Not Modified."""
+        backend = cls._get_backend()
+        if not backend:
+            return
+        entry.stored_at = time.time()
+        cls._store(backend, entry)
+        cls._count("revalidations")
+
+    @classmethod
+    def get_metrics(cls) -> dict:
+        with cls._lock:
+            return dict(cls._metrics)
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._backend = None
+            for name in cls._metrics:
+                cls._metrics[name] = 0
+
+    @classmethod
+    def _store(cls, backend, entry: WebpageCacheEntry):
+        try:
+            backend.put(entry)
+        except (redis.RedisError, OSError) as e:
+            logger.error(f"Unable to write webpage cache: {e}")
+            cls._count("errors")
+
+    @classmethod
+    def _count(cls, name: str):
+        with cls._lock:
+            cls._metrics[name] += 1
@@ -6,10 +6,11 @@ import re
 from requests.exceptions import RequestException
 from bs4 import BeautifulSoup
 from newspaper import Article, ArticleException, Config
-from requests_html import HTMLSession
 import time
 import random
 from lxml import html
+from superagi.helper.html_render_pool import HtmlRenderPool
+from superagi.helper.webpage_cache import WebpageCache
 from superagi.lib.logger import logger
 
 USER_AGENTS = [
@@ -45,9 +46,17 @@ class WebpageExtractor:
         Returns:
             str: The extracted text.
         """
+        cached = WebpageCache.get("3k", url)
+        if cached is not None and cached.is_fresh(WebpageCache.ttl()):
+            return cached.text
+        conditional_headers = cached.conditional_headers() if cached is not None else {}
+
         try:
             if url.lower().endswith(".pdf"):
-                response = requests.get(url)
+                response = requests.get(url, headers=conditional_headers)
+                if cached is not None and response.status_code == 304:
+                    WebpageCache.revalidated(cached)
+                    return cached.text
                 response.raise_for_status()
 
                 with BytesIO(response.content) as pdf_data:
@@ -58,17 +67,23 @@ class WebpageExtractor:
                 config = Config()
                 config.browser_user_agent = random.choice(USER_AGENTS)
                 config.request_timeout = 10
-                session = HTMLSession()
-
-                response = session.get(url)
-                response.html.render(timeout=config.request_timeout)
-                html_content = response.html.html
-
-                article = Article(url, config=config)
-                article.set_html(html_content)
-                article.parse()
-                content = article.text.replace('\t', ' ').replace('\n', ' ').strip()
 
+                def parse_article(html_content):
+                    article = Article(url, config=config)
+                    article.set_html(html_content)
+                    article.parse()
+                    return article.text.replace('\t', ' ').replace('\n', ' ').strip()
+
+                response, content = HtmlRenderPool.get_instance().fetch(
+                    url, parse_article, headers={"User-Agent": config.browser_user_agent, **conditional_headers})
+                if cached is not None and response.status_code == 304:
+                    WebpageCache.revalidated(cached)
+                    return cached.text
+                if content is None:
+                    response.raise_for_status()
+                    return ""
+
+            WebpageCache.put("3k", url, content[:1500], response.headers)
             return content[:1500]
 
         except ArticleException as ae:
@@ -93,12 +108,20 @@ class WebpageExtractor:
         Returns:
             str: The extracted text.
         """
+        cached = WebpageCache.get("bs4", url)
+        if cached is not None and cached.is_fresh(WebpageCache.ttl()):
+            return cached.text
         headers = {
             "User-Agent": random.choice(USER_AGENTS)
         }
+        if cached is not None:
+            headers.update(cached.conditional_headers())
 
         try:
             response = requests.get(url, headers=headers, timeout=10)
+            if cached is not None and response.status_code == 304:
+                WebpageCache.revalidated(cached)
+                return cached.text
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
                 for tag in soup(['script', 'style', 'nav', 'footer', 'head', 'link', 'meta', 'noscript']):
@@ -114,6 +137,7 @@ class WebpageExtractor:
 
                 content = re.sub(r'\t', ' ', content)
                 content = re.sub(r'\s+', ' ', content)
+                WebpageCache.put("bs4", url, content, response.headers)
                 return content
             elif response.status_code == 404:
                 return f"Error: 404. Url is invalid or does not exist. Try with valid url..."
@@ -135,21 +159,28 @@ class WebpageExtractor:
         Returns:
             str: The extracted text.
         """
-        try:
-            config = Config()
-            config.browser_user_agent = random.choice(USER_AGENTS)
-            config.request_timeout = 10
-            session = HTMLSession()
+        cached = WebpageCache.get("lxml", url)
+        if cached is not None and cached.is_fresh(WebpageCache.ttl()):
+            return cached.text
+        conditional_headers = cached.conditional_headers() if cached is not None else {}
 
-            response = session.get(url)
-            response.html.render(timeout=config.request_timeout)
-            html_content = response.html.html
-
-            tree = html.fromstring(html_content)
-            paragraphs = tree.cssselect('p, h1, h2, h3, h4, h5, h6')
-            content = ' '.join([para.text_content() for para in paragraphs if para.text_content()])
-            content = content.replace('\t', ' ').replace('\n', ' ').strip()
+        try:
+            def parse_paragraphs(html_content):
+                tree = html.fromstring(html_content)
+                paragraphs = tree.cssselect('p, h1, h2, h3, h4, h5, h6')
+                content = ' '.join([para.text_content() for para in paragraphs if para.text_content()])
+                return content.replace('\t', ' ').replace('\n', ' ').strip()
+
+            response, content = HtmlRenderPool.get_instance().fetch(
+                url, parse_paragraphs, headers={"User-Agent": random.choice(USER_AGENTS), **conditional_headers})
+            if cached is not None and response.status_code == 304:
+                WebpageCache.revalidated(cached)
+                return cached.text
+            if content is None:
+                response.raise_for_status()
+                return ""
 
+            WebpageCache.put("lxml", url, content, response.headers)
             return content
 
         except ArticleException as ae:
@@ -0,0 +1,112 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from urllib.parse import urlparse
+
+from superagi.helper.token_counter import TokenCounter
+from superagi.helper.webpage_extractor import WebpageExtractor
+from superagi.lib.logger import logger
+
+MAX_CONCURRENT_FETCHES = 5
+MAX_CONCURRENT_FETCHES_PER_HOST = 1
+MIN_HOST_REQUEST_INTERVAL = 1.0
+MAX_FETCH_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 1.0
+MAX_WORDS_PER_PAGE = 500
+
+
+class _HostLimiter:
+    """Limits the number of concurrent requests to a host and spaces out consecutive ones."""
+
+    def __init__(self, max_concurrent: int, min_interval: float):
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._last_request_at = {}
+
+    def acquire(self, host: str):
+        with self._lock:
+            semaphore = self._semaphores.setdefault(host, threading.BoundedSemaphore(self.max_concurrent))
+        semaphore.acquire()
+        with self._lock:
+            wait_seconds = self._last_request_at.get(host, 0) + self.min_interval - time.monotonic()
+            self._last_request_at[host] = time.monotonic() + max(wait_seconds, 0)
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+    def release(self, host: str):
+        self._semaphores[host].release()
+
+
+class WebpageFetcher:
+    """
+    Fetches the text of the result pages of a search concurrently through WebpageExtractor.
+
+    Requests are limited per host across all the fetchers of the process, retried with exponential
+    backoff when nothing could be extracted, and no more pages are waited for once the pages fetched
+    so far, in result order, fill the token budget.
+    """
+    # shared by every fetcher, the searches build one per call
+    host_limiter = _HostLimiter(MAX_CONCURRENT_FETCHES_PER_HOST, MIN_HOST_REQUEST_INTERVAL)
+
+    def __init__(self, extractor: WebpageExtractor = None, max_workers: int = MAX_CONCURRENT_FETCHES,
+                 max_attempts: int = MAX_FETCH_ATTEMPTS, backoff: float = RETRY_BACKOFF_SECONDS,
+                 max_words: int = MAX_WORDS_PER_PAGE):
+        self.extractor = extractor or WebpageExtractor()
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_words = max_words
+
+    def fetch(self, urls: list, token_budget: int = None) -> list:
+        """
+        Fetch the text of the given pages.
+
+        Args:
+            urls (list): The URLs of the pages, in result order.
+            token_budget (int): Stop once the leading pages hold more tokens than this. None to fetch every page.
+
+        Returns:
+            list: The text of the leading pages in the order of the URLs; shorter than urls if the budget was filled.
+        """
+        if not urls:
+            return []
+        webpages = [None] * len(urls)
+        next_index = 0
+        token_count = 0
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls)))
+        try:
+            futures = {executor.submit(self._fetch_page, url): index for index, url in enumerate(urls)}
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    webpages[futures[future]] = future.result()
+                while next_index < len(urls) and webpages[next_index] is not None:
+                    token_count += TokenCounter.count_content_tokens(webpages[next_index]) or 0
+                    next_index += 1
+                    if token_budget is not None and token_count > token_budget:
+                        return webpages[:next_index]
+            return webpages
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_page(self, url: str) -> str:
+        host = urlparse(url).netloc
+        content = ""
+        for attempt in range(self.max_attempts):
+            if attempt > 0:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            self.host_limiter.acquire(host)
+            try:
+                content = self.extractor.extract_with_bs4(url)
+            except Exception as e:
+                logger.error(f"Error while fetching {url}: {e}")
+                content = ""
+            finally:
+                self.host_limiter.release(host)
+            if content != "":
+                break
+        max_length = len(' '.join(content.split(" ")[:self.max_words]))
+        return content[:max_length]
@@ -5,6 +5,7 @@ from superagi.llms.local_llm import LocalLLM
 
 import superagi.worker
 from superagi.agent.agent_iteration_step_handler import AgentIterationStepHandler
+from superagi.agent.agent_step_context import AgentStepContext
 from superagi.agent.agent_tool_step_handler import AgentToolStepHandler
 from superagi.agent.agent_workflow_step_wait_handler import AgentWaitStepHandler
 from superagi.agent.types.wait_step_status import AgentWorkflowStepWaitStatus
@@ -15,13 +16,12 @@ from superagi.llms.google_palm import GooglePalm
 from superagi.llms.hugging_face import HuggingFace
 from superagi.llms.llm_model_factory import get_model
 from superagi.llms.replicate import Replicate
-from superagi.models.agent import Agent
-from superagi.models.agent_config import AgentConfiguration
 from superagi.models.agent_execution import AgentExecution
 from superagi.models.db import connect_db
 from superagi.models.workflows.agent_workflow_step import AgentWorkflowStep
 from superagi.models.workflows.agent_workflow_step_wait import AgentWorkflowStepWait
 from superagi.types.vector_store_types import VectorStoreType
+from superagi.vector_store.embedding.cached import CachedEmbedding
 from superagi.vector_store.embedding.openai import OpenAiEmbedding
 from superagi.vector_store.vector_factory import VectorFactory
 from superagi.worker import execute_agent
@@ -48,26 +48,23 @@ class AgentExecutor:
                 logger.error("Older agent execution found, skipping execution")
                 return
 
-            agent = session.query(Agent).filter(Agent.id == agent_execution.agent_id).first()
-            agent_config = Agent.fetch_configuration(session, agent.id)
-            if agent.is_deleted or (
+            step_context = AgentStepContext.fetch(session, agent_execution.agent_id, agent_execution_id)
+            agent_config = step_context.agent_config
+            if agent_config["is_deleted"] or (
                     agent_execution.status != AgentExecutionStatus.RUNNING.value and agent_execution.status != AgentExecutionStatus.WAITING_FOR_PERMISSION.value):
-                logger.error(f"Agent execution stopped. {agent.id}: {agent_execution.status}")
+                logger.error(f"Agent execution stopped. {step_context.agent_id}: {agent_execution.status}")
                 return
 
-            organisation = Agent.find_org_by_agent_id(session, agent_id=agent.id)
+            organisation = step_context.organisation
             if self._check_for_max_iterations(session, organisation.id, agent_config, agent_execution_id):
-                logger.error(f"Agent execution stopped. Max iteration exceeded. {agent.id}: {agent_execution.status}")
+                logger.error(f"Agent execution stopped. Max iteration exceeded. {step_context.agent_id}: {agent_execution.status}")
                 return
 
-            try:
-                model_config = AgentConfiguration.get_model_api_key(session, agent_execution.agent_id,
-                                                                    agent_config["model"])
-                model_api_key = model_config['api_key']
-                model_llm_source = model_config['provider']
-            except Exception as e:
-                logger.info(f"Unable to get model config...{e}")
+            if step_context.model_config is None:
+                logger.info("Unable to get model config...")
                 return
+            model_api_key = step_context.model_api_key
+            model_llm_source = step_context.model_provider
 
             try:
                 memory = None
@@ -83,8 +80,7 @@ class AgentExecutor:
             agent_workflow_step = session.query(AgentWorkflowStep).filter(
                 AgentWorkflowStep.id == agent_execution.current_agent_step_id).first()
             try:
-                self.__execute_workflow_step(agent, agent_config, agent_execution_id, agent_workflow_step, memory,
-                                             model_api_key, organisation, session)
+                self.__execute_workflow_step(step_context, agent_workflow_step, memory, session)
 
             except Exception as e:
                 logger.info("Exception in executing the step: {}".format(e))
@@ -102,34 +98,36 @@ class AgentExecutor:
             session.close()
             engine.dispose()
 
-    def __execute_workflow_step(self, agent, agent_config, agent_execution_id, agent_workflow_step, memory,
-                                model_api_key, organisation, session):
+    def __execute_workflow_step(self, step_context, agent_workflow_step, memory, session):
         logger.info("Executing Workflow step : ", agent_workflow_step.action_type)
+        agent_id = step_context.agent_id
+        agent_execution_id = step_context.agent_execution_id
         if agent_workflow_step.action_type == AgentWorkflowStepAction.TOOL.value:
             tool_step_handler = AgentToolStepHandler(session,
-                                                     llm=get_model(model=agent_config["model"], api_key=model_api_key,
-                                                                   organisation_id=organisation.id)
-                                                     , agent_id=agent.id, agent_execution_id=agent_execution_id,
-                                                     memory=memory)
+                                                     llm=get_model(model=step_context.agent_config["model"],
+                                                                   api_key=step_context.model_api_key,
+                                                                   organisation_id=step_context.organisation.id)
+                                                     , agent_id=agent_id, agent_execution_id=agent_execution_id,
+                                                     memory=memory, step_context=step_context)
             tool_step_handler.execute_step()
         elif agent_workflow_step.action_type == AgentWorkflowStepAction.ITERATION_WORKFLOW.value:
             iteration_step_handler = AgentIterationStepHandler(session,
-                                                               llm=get_model(model=agent_config["model"],
-                                                                             api_key=model_api_key,
-                                                                             organisation_id=organisation.id)
-                                                               , agent_id=agent.id,
-                                                               agent_execution_id=agent_execution_id, memory=memory)
-            print(get_model(model=agent_config["model"], api_key=model_api_key, organisation_id=organisation.id))
+                                                               llm=get_model(model=step_context.agent_config["model"],
+                                                                             api_key=step_context.model_api_key,
+                                                                             organisation_id=step_context.organisation.id)
+                                                               , agent_id=agent_id,
+                                                               agent_execution_id=agent_execution_id, memory=memory,
+                                                               step_context=step_context)
             iteration_step_handler.execute_step()
         elif agent_workflow_step.action_type == AgentWorkflowStepAction.WAIT_STEP.value:
-            (AgentWaitStepHandler(session=session, agent_id=agent.id,
+            (AgentWaitStepHandler(session=session, agent_id=agent_id,
                                   agent_execution_id=agent_execution_id)
              .execute_step())
 
     @classmethod
     def get_embedding(cls, model_source, model_api_key):
         if "OpenAI" in model_source:
-            return OpenAiEmbedding(api_key=model_api_key)
+            return CachedEmbedding(OpenAiEmbedding(api_key=model_api_key))
         if "Google" in model_source:
             return GooglePalm(api_key=model_api_key)
         if "Hugging" in model_source:
@@ -0,0 +1,140 @@
+from datetime import datetime, time, timedelta
+
+from sqlalchemy import func, insert, Integer
+
+from superagi.config.config import get_config
+from superagi.lib.logger import logger
+from superagi.models.agent_analytics_rollup import AgentAnalyticsRollup
+from superagi.models.events import Event
+from superagi.models.tool_analytics_rollup import ToolAnalyticsRollup
+
+RUN_END_EVENTS = ['run_completed', 'run_iteration_limit_crossed']
+
+
+class AnalyticsRollupBuilder:
+    """
+    Rolls the events up into the daily analytics rollups read by the analytics endpoints.
+
+    Every refresh rebuilds the rollups of the last ANALYTICS_ROLLUP_WINDOW_DAYS days, and of every
+    day since the last rolled up day, from the events of those days, in one transaction. Events
+    that reach the table late, e.g. from the APM write buffer, are counted by the next refresh,
+    and older days are left as they are. The first refresh rolls up the whole history.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self.window_days = int(get_config("ANALYTICS_ROLLUP_WINDOW_DAYS", 2))
+
+    def refresh(self):
+        start_day = self._start_day()
+        since = datetime.combine(start_day, time.min)
+
+        agent_rollups = self._build_agent_rollups(since)
+        tool_rollups = self._build_tool_rollups(since)
+
+        self.session.query(AgentAnalyticsRollup).filter(AgentAnalyticsRollup.day >= start_day) \
+            .delete(synchronize_session=False)
+        self.session.query(ToolAnalyticsRollup).filter(ToolAnalyticsRollup.day >= start_day) \
+            .delete(synchronize_session=False)
+        now = datetime.utcnow()
+        if agent_rollups:
+            self.session.execute(insert(AgentAnalyticsRollup),
+                                 [{**rollup, "created_at": now, "updated_at": now} for rollup in agent_rollups])
+        if tool_rollups:
+            self.session.execute(insert(ToolAnalyticsRollup),
+                                 [{**rollup, "created_at": now, "updated_at": now} for rollup in tool_rollups])
+        self.session.commit()
+        logger.info(f"Rolled up analytics since {start_day}: {len(agent_rollups)} agent days, "
+                    f"{len(tool_rollups)} tool days")
+
+    def _start_day(self):
+        start_day = datetime.utcnow().date() - timedelta(days=self.window_days - 1)
+        last_day = self.session.query(func.max(AgentAnalyticsRollup.day)).scalar()
+        if last_day is None:
+            first_event_at = self.session.query(func.min(Event.created_at)).scalar()
+            return first_event_at.date() if first_event_at is not None else start_day
+        return min(start_day, last_day)
+
+    def _build_agent_rollups(self, since: datetime) -> list:
+        day = func.date(Event.created_at).label('day')
+        rollups = {}
+
+        def rollup(org_id, agent_id, rollup_day):
+            return rollups.setdefault((org_id, agent_id, rollup_day), {
+                "org_id": org_id, "agent_id": agent_id, "day": rollup_day, "agents_created": 0,
+                "runs_completed": 0, "tokens_consumed": 0, "calls": 0, "run_time_total": 0.0, "timed_runs": 0})
+
+        created = self.session.query(Event.org_id, Event.agent_id, day, func.count(Event.id).label('agents')) \
+            .filter(Event.event_name == 'agent_created', Event.created_at >= since) \
+            .group_by(Event.org_id, Event.agent_id, day).all()
+        for row in created:
+            rollup(row.org_id, row.agent_id, row.day)["agents_created"] = row.agents
+
+        runs = self.session.query(
+            Event.org_id, Event.agent_id, day,
+            func.count(Event.id).label('runs'),
+            func.sum(Event.event_property['tokens_consumed'].astext.cast(Integer)).label('tokens'),
+            func.sum(Event.event_property['calls'].astext.cast(Integer)).label('calls')
+        ).filter(Event.event_name.in_(RUN_END_EVENTS), Event.created_at >= since) \
+            .group_by(Event.org_id, Event.agent_id, day).all()
+        for row in runs:
+            agent_rollup = rollup(row.org_id, row.agent_id, row.day)
+            agent_rollup["runs_completed"] = row.runs
+            agent_rollup["tokens_consumed"] = row.tokens or 0
+            agent_rollup["calls"] = row.calls or 0
+
+        for org_id, agent_id, run_day, run_time in self._fetch_run_times(since):
+            agent_rollup = rollup(org_id, agent_id, run_day)
+            agent_rollup["run_time_total"] += run_time
+            agent_rollup["timed_runs"] += 1
+
+        agents = self._fetch_agents({agent_id for _, agent_id, _ in rollups})
+        # like the events they are built from, agents without an agent_created event are left out
+        return [{**agent_rollup, **agents[agent_rollup["agent_id"]]} for agent_rollup in rollups.values()
+                if agent_rollup["agent_id"] in agents]
+
+    def _fetch_run_times(self, since: datetime) -> list:
+        """Returns the organisation, agent, day and run time of the runs that ended since the given time."""
+        execution_id = Event.event_property['agent_execution_id'].astext
+        ends = self.session.query(
+            Event.org_id, Event.agent_id, execution_id.label('agent_execution_id'),
+            func.max(Event.created_at).label('end_time')
+        ).filter(Event.event_name.in_(RUN_END_EVENTS), Event.created_at >= since) \
+            .group_by(Event.org_id, Event.agent_id, execution_id).all()
+        if not ends:
+            return []
+        starts = dict(self.session.query(execution_id, func.min(Event.created_at)).filter(
+            Event.event_name == 'run_created',
+            execution_id.in_({end.agent_execution_id for end in ends})
+        ).group_by(execution_id).all())
+
+        run_times = []
+        for end in ends:
+            start_time = starts.get(end.agent_execution_id)
+            if start_time is not None:
+                run_times.append((end.org_id, end.agent_id, end.end_time.date(),
+                                  (end.end_time - start_time).total_seconds()))
+        return run_times
+
+    def _fetch_agents(self, agent_ids: set) -> dict:
+        if not agent_ids:
+            return {}
+        created_events = self.session.query(
+            Event.agent_id,
+            Event.event_property['agent_name'].astext.label('agent_name'),
+            Event.event_property['model'].astext.label('model')
+        ).filter(Event.event_name == 'agent_created', Event.agent_id.in_(agent_ids)).order_by(Event.id).all()
+        agents = {}
+        for event in created_events:
+            agents.setdefault(event.agent_id, {"agent_name": event.agent_name, "model": event.model})
+        return agents
+
+    def _build_tool_rollups(self, since: datetime) -> list:
+        day = func.date(Event.created_at).label('day')
+        tool_name = Event.event_property['tool_name'].astext.label('tool_name')
+        tool_calls = self.session.query(Event.org_id, Event.agent_id, tool_name, day,
+                                        func.count(Event.id).label('calls')) \
+            .filter(Event.event_name == 'tool_used', Event.created_at >= since) \
+            .group_by(Event.org_id, Event.agent_id, tool_name, day).all()
+        return [{"org_id": row.org_id, "agent_id": row.agent_id, "tool_name": row.tool_name, "day": row.day,
+                 "calls": row.calls} for row in tool_calls if row.tool_name is not None]
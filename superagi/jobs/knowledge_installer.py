@@ -0,0 +1,113 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from superagi.config.config import get_config
+from superagi.helper.s3_helper import S3Helper
+from superagi.lib.logger import logger
+from superagi.models.knowledge_configs import KnowledgeConfigs
+from superagi.models.knowledge_installation import KnowledgeInstallation
+from superagi.models.knowledges import Knowledges
+from superagi.models.marketplace_stats import MarketPlaceStats
+from superagi.models.vector_db_configs import VectordbConfigs
+from superagi.models.vector_db_indices import VectordbIndices
+from superagi.models.vector_dbs import Vectordbs
+from superagi.types.vector_store_types import VectorStoreType
+from superagi.vector_embeddings.vector_embedding_factory import VectorEmbeddingFactory
+from superagi.vector_store.vector_factory import VectorFactory
+
+# weaviate upserts through the client's shared batch, which is not thread safe
+MAX_WORKERS_BY_VECTOR_STORE = {VectorStoreType.WEAVIATE: 1}
+
+
+class KnowledgeInstaller:
+    """
+    Installs a marketplace knowledge into a vector db index in the background.
+
+    The chunk file is streamed from S3 and upserted in batches of KNOWLEDGE_INSTALL_BATCH_SIZE
+    chunks by up to KNOWLEDGE_INSTALL_WORKERS threads, so memory stays bounded by the batches in
+    flight. The number of chunks upserted so far is checkpointed on the installation after every
+    batch, and a failed installation resumes after them when it is run again. Upserts are keyed
+    by the chunk ids, so a batch upserted twice is harmless. An installation is claimed before it
+    is run, so it is never run by two workers at once and the knowledge is installed only once.
+    """
+
+    def __init__(self, session, installation_id: int):
+        self.session = session
+        self.installation_id = installation_id
+        self.batch_size = int(get_config("KNOWLEDGE_INSTALL_BATCH_SIZE", 100))
+        self.max_workers = int(get_config("KNOWLEDGE_INSTALL_WORKERS", 4))
+
+    def install(self):
+        if not KnowledgeInstallation.claim(self.session, self.installation_id):
+            logger.info(f"Knowledge installation {self.installation_id} is running or completed, skipping it")
+            return
+        installation = KnowledgeInstallation.get_installation(self.session, self.installation_id)
+        installed_chunks = installation.installed_chunks or 0
+        try:
+            selected_knowledge = Knowledges.fetch_knowledge_details_marketplace(installation.knowledge_name)
+            selected_knowledge_config = KnowledgeConfigs.fetch_knowledge_config_details_marketplace(
+                selected_knowledge['id'])
+            vector_db_index = VectordbIndices.get_vector_index_from_id(self.session, installation.vector_db_index_id)
+            vector = Vectordbs.get_vector_db_from_id(self.session, vector_db_index.vector_db_id)
+            db_creds = VectordbConfigs.get_vector_db_config_from_db_id(self.session, vector.id)
+            vector_db_storage = VectorFactory.build_vector_storage(vector.db_type, vector_db_index.name, **db_creds)
+
+            chunks = S3Helper().iter_json_object_items(selected_knowledge_config["file_path"])
+            installed_chunks = self._upsert_chunks(vector.db_type, vector_db_storage,
+                                                   islice(chunks, installed_chunks, None), installed_chunks)
+
+            self._add_installed_knowledge(selected_knowledge, selected_knowledge_config, installation)
+        except Exception as err:
+            logger.error(f"Knowledge installation {self.installation_id} failed: {err}")
+            self.session.rollback()
+            KnowledgeInstallation.update_status(self.session, self.installation_id, "FAILED", error=str(err))
+            raise
+        KnowledgeInstallation.update_status(self.session, self.installation_id, "COMPLETED",
+                                            installed_chunks=installed_chunks)
+
+    def _upsert_chunks(self, db_type: str, vector_db_storage, chunks, installed_chunks: int) -> int:
+        """Upserts the chunks in batches and returns the number of chunks installed, checkpointing as batches finish."""
+        max_workers = MAX_WORKERS_BY_VECTOR_STORE.get(VectorStoreType.get_vector_store_type(db_type),
+                                                      self.max_workers)
+
+        def upsert(batch):
+            upsert_data = VectorEmbeddingFactory.build_vector_storage(db_type, dict(batch)) \
+                .get_vector_embeddings_from_chunks()
+            vector_db_storage.add_embeddings_to_vector_db(upsert_data)
+            return len(batch)
+
+        in_flight = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                while True:
+                    batch = list(islice(chunks, self.batch_size))
+                    if batch:
+                        in_flight.append(executor.submit(upsert, batch))
+                    # the checkpoint only moves past batches that finished along with every batch before them
+                    while in_flight and (len(in_flight) > max_workers * 2 or not batch or in_flight[0].done()):
+                        installed_chunks += in_flight.pop(0).result()
+                        KnowledgeInstallation.update_status(self.session, self.installation_id, "RUNNING",
+                                                            installed_chunks=installed_chunks)
+                    if not batch:
+                        return installed_chunks
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+    def _add_installed_knowledge(self, selected_knowledge: dict, selected_knowledge_config: dict,
+                                 installation: KnowledgeInstallation):
+        selected_knowledge_data = {
+            "id": -1,
+            "name": selected_knowledge["name"],
+            "description": selected_knowledge["description"],
+            "index_id": installation.vector_db_index_id,
+            "organisation_id": installation.organisation_id,
+            "contributed_by": selected_knowledge["contributed_by"],
+        }
+        new_knowledge = Knowledges.add_update_knowledge(self.session, selected_knowledge_data)
+        configs = {key: value for key, value in selected_knowledge_config.items() if key != 'file_path'}
+        KnowledgeConfigs.add_update_knowledge_config(self.session, new_knowledge.id, configs)
+        VectordbIndices.update_vector_index_state(self.session, installation.vector_db_index_id, "Marketplace")
+        install_number = MarketPlaceStats.get_knowledge_installation_number(selected_knowledge["id"])
+        MarketPlaceStats.update_knowledge_install_number(self.session, selected_knowledge["id"],
+                                                         int(install_number) + 1)
@@ -0,0 +1,176 @@
+import asyncio
+import json
+from datetime import datetime
+
+import redis
+import redis.asyncio
+
+from superagi.config.config import get_config
+from superagi.lib.logger import logger
+from superagi.lib.redis_pool import RedisPool
+from superagi.models.agent import Agent
+from superagi.models.project import Project
+
+SUBSCRIBER_QUEUE_SIZE = 100
+RECONNECT_DELAY_SECONDS = 1.0
+# session.info keys of the events recorded in a transaction, before and after the flush resolved their ids
+PENDING_EVENTS_KEY = "execution_events_pending"
+FLUSHED_EVENTS_KEY = "execution_events_flushed"
+
+
+class ExecutionEventChannel:
+    """
+    Redis pub/sub channel of agent execution events, so clients can be pushed status changes and
+    new feeds instead of polling for them.
+
+    Any process may publish. Each web server process holds a single subscription, started with
+    its first subscriber, and fans the events out to the in-process subscribers of the event's
+    organisation and agent.
+
+    Events are dicts with an "event" type ("status" or "feed"), organisation_id, agent_id,
+    agent_execution_id and, for status events, status and old_status.
+
+    Changes made in a session are recorded with `record_status_change` and `record_feed`, and only
+    published once the session commits, so clients never read the rows before they are committed
+    and rolled back changes are never published.
+    """
+    CHANNEL = "agent_execution_events"
+    # subscriber queue -> (organisation_id, agent_id or None for all the organisation's agents)
+    _subscribers = {}
+    _listener_task = None
+
+    @classmethod
+    def publish(cls, event: dict):
+        """Publish an event, logging rather than raising if Redis is unavailable."""
+        event = {**event, "published_at": datetime.utcnow().isoformat()}
+        try:
+            RedisPool.get_client().publish(cls.CHANNEL, json.dumps(event))
+        except redis.RedisError as e:
+            logger.error(f"Unable to publish agent execution event: {e}")
+
+    @classmethod
+    def record_status_change(cls, session, agent_execution, status: str, old_status: str = None):
+        """Record a status change made in the session, to be published once the session commits."""
+        session.info.setdefault(PENDING_EVENTS_KEY, []).append(
+            (cls._status_event, (agent_execution, status, old_status)))
+
+    @classmethod
+    def record_feed(cls, session, agent_execution_feed):
+        """Record a feed inserted in the session, to be published once the session commits."""
+        session.info.setdefault(PENDING_EVENTS_KEY, []).append((cls._feed_event, (agent_execution_feed,)))
+
+    @classmethod
+    def resolve_recorded(cls, session):
+        """
+        Build the recorded events once flushed, while the ids of new rows can be read without a query,
+        and add the organisation of their agents.
+        """
+        pending = session.info.pop(PENDING_EVENTS_KEY, None)
+        if not pending:
+            return
+        events = [build_event(*args) for build_event, args in pending]
+        organisation_ids = dict(session.query(Agent.id, Project.organisation_id)
+                                .join(Project, Project.id == Agent.project_id)
+                                .filter(Agent.id.in_({event["agent_id"] for event in events}))
+                                .all())
+        for event in events:
+            event["organisation_id"] = organisation_ids.get(event["agent_id"])
+        session.info.setdefault(FLUSHED_EVENTS_KEY, []).extend(events)
+
+    @classmethod
+    def publish_recorded(cls, session):
+        """Publish the events recorded in the committed transaction."""
+        session.info.pop(PENDING_EVENTS_KEY, None)
+        for event in session.info.pop(FLUSHED_EVENTS_KEY, []):
+            cls.publish(event)
+
+    @classmethod
+    def discard_recorded(cls, session):
+        session.info.pop(PENDING_EVENTS_KEY, None)
+        session.info.pop(FLUSHED_EVENTS_KEY, None)
+
+    @staticmethod
+    def _status_event(agent_execution, status: str, old_status: str = None) -> dict:
+        return {"event": "status", "agent_id": agent_execution.agent_id,
+                "agent_execution_id": agent_execution.id, "status": status, "old_status": old_status}
+
+    @staticmethod
+    def _feed_event(agent_execution_feed) -> dict:
+        return {"event": "feed", "agent_id": agent_execution_feed.agent_id,
+                "agent_execution_id": agent_execution_feed.agent_execution_id,
+                "feed_id": agent_execution_feed.id}
+
+    @classmethod
+    async def subscribe(cls, organisation_id: int, agent_id: int = None, keepalive_seconds: float = 15):
+        """
+        Subscribe to the events published from now on.
+
+        Args:
+            organisation_id (int): Only the events of this organisation's agents are received.
+            agent_id (int): Only the events of this agent are received, None for all the organisation's agents.
+            keepalive_seconds (float): Yield None when no event arrived for this long, so the caller can
+                keep its connection alive and notice disconnected clients.
+
+        Yields:
+            dict: The events, or None after keepalive_seconds without events.
+        """
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        cls._subscribers[queue] = (organisation_id, agent_id)
+        if cls._listener_task is None or cls._listener_task.done():
+            cls._listener_task = asyncio.get_running_loop().create_task(cls._listen())
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), timeout=keepalive_seconds)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            cls._subscribers.pop(queue, None)
+
+    @classmethod
+    async def server_sent_events(cls, request, organisation_id: int, agent_id: int = None):
+        """Stream the subscribed events as server-sent events until the client disconnects."""
+        async for event in cls.subscribe(organisation_id, agent_id):
+            if await request.is_disconnected():
+                break
+            if event is None:
+                yield ": keepalive\n\n"
+            else:
+                yield f"event: {event['event']}\ndata: {json.dumps(event)}\n\n"
+
+    @classmethod
+    def _dispatch(cls, event: dict):
+        for queue, (organisation_id, agent_id) in list(cls._subscribers.items()):
+            # filtered before queueing, so other organisations' events never push out a subscriber's own
+            if event.get("organisation_id") != organisation_id or \
+                    (agent_id is not None and event.get("agent_id") != agent_id):
+                continue
+            if queue.full():
+                # a slow client misses its oldest events rather than holding up the others
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    @classmethod
+    async def _listen(cls):
+        redis_url = get_config('REDIS_URL') or "localhost:6379"
+        while cls._subscribers:
+            client = redis.asyncio.Redis.from_url("redis://" + redis_url + "/0", decode_responses=True)
+            pubsub = client.pubsub()
+            try:
+                await pubsub.subscribe(cls.CHANNEL)
+                while cls._subscribers:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is None:
+                        continue
+                    try:
+                        event = json.loads(message["data"])
+                    except ValueError as e:
+                        logger.error(f"Ignoring malformed agent execution event: {e}")
+                        continue
+                    cls._dispatch(event)
+            except redis.RedisError as e:
+                logger.error(f"Agent execution event subscription failed: {e}")
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+            finally:
+                await pubsub.reset()
+                await client.close()
@@ -0,0 +1,81 @@
+import threading
+
+import redis
+
+from superagi.config.config import get_config
+from superagi.lib.logger import logger
+
+
+class RedisPool:
+    """
+    Process-wide Redis connection pool shared by the task queues, the Redis vector store and the
+    cache helpers, so a step reuses a few connections instead of opening one per client object.
+
+    The pool blocks for up to REDIS_POOL_TIMEOUT seconds when all REDIS_POOL_MAX_CONNECTIONS
+    connections are in use. redis-py recreates it after a fork, so celery workers get their own.
+    """
+    _pool = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_pool(cls) -> redis.ConnectionPool:
+        if cls._pool is None:
+            with cls._lock:
+                if cls._pool is None:
+                    redis_url = get_config('REDIS_URL') or "localhost:6379"
+                    cls._pool = redis.BlockingConnectionPool.from_url(
+                        "redis://" + redis_url + "/0",
+                        decode_responses=True,
+                        max_connections=int(get_config("REDIS_POOL_MAX_CONNECTIONS", 50)),
+                        timeout=int(get_config("REDIS_POOL_TIMEOUT", 20)))
+        return cls._pool
+
+    @classmethod
+    def get_client(cls) -> redis.Redis:
+        """
+        Get a Redis client backed by the shared pool. Clients are cheap, connections are only
+        checked out of the pool for the duration of a command or pipeline.
+
+        Returns:
+            redis.Redis: The Redis client.
+        """
+        return redis.Redis(connection_pool=cls.get_pool())
+
+    @classmethod
+    def get_metrics(cls) -> dict:
+        """
+        Get the usage of the shared pool in this process.
+
+        The connection counts are read from the internals of redis-py's BlockingConnectionPool, as of
+        redis==4.5.5 pinned in requirements.txt. If another version lays them out differently, the
+        counts are None.
+
+        Returns:
+            dict: max_connections, created_connections, in_use_connections and idle_connections.
+        """
+        pool = cls.get_pool()
+        try:
+            created_connections = len(pool._connections)
+            idle_connections = sum(1 for connection in list(pool.pool.queue) if connection is not None)
+        except (AttributeError, TypeError) as e:
+            logger.error(f"Unable to read the Redis pool connection counts: {e}")
+            return {
+                "max_connections": pool.max_connections,
+                "created_connections": None,
+                "in_use_connections": None,
+                "idle_connections": None
+            }
+        return {
+            "max_connections": pool.max_connections,
+            "created_connections": created_connections,
+            "in_use_connections": created_connections - idle_connections,
+            "idle_connections": idle_connections
+        }
+
+    @classmethod
+    def reset(cls):
+        """Disconnect and drop the shared pool, the next client creates a new one."""
+        with cls._lock:
+            if cls._pool is not None:
+                cls._pool.disconnect()
+            cls._pool = None
@@ -4,6 +4,7 @@ from superagi.llms.openai import OpenAi
 from superagi.llms.replicate import Replicate
 from superagi.llms.hugging_face import HuggingFace
 from superagi.llms.lm_studio import LMStudio
+from superagi.llms.llm_registry import LlmRegistry
 from superagi.models.models_config import ModelsConfig
 from superagi.models.models import Models
 from sqlalchemy.orm import sessionmaker
@@ -11,6 +12,18 @@ from superagi.models.db import connect_db
 
 
 def get_model(organisation_id, api_key, model="gpt-3.5-turbo", **kwargs):
+    registry_key = LlmRegistry.build_key(organisation_id, model, api_key, kwargs)
+    llm = LlmRegistry.get(registry_key)
+    if llm is not None:
+        return llm
+
+    version = LlmRegistry.fetch_version(organisation_id)
+    llm = _build_model(organisation_id, api_key, model, **kwargs)
+    LlmRegistry.register(registry_key, llm, version)
+    return llm
+
+
+def _build_model(organisation_id, api_key, model, **kwargs):
     print("Fetching model details from database...")
     engine = connect_db()
     Session = sessionmaker(bind=engine)
@@ -0,0 +1,78 @@
+import hashlib
+import threading
+import time
+
+from superagi.config.config import get_config
+from superagi.helper.cache_version import CacheVersion
+
+
+class LlmRegistry:
+    """
+    Process-local registry of LLM clients keyed by organisation, model, api key hash and
+    constructor kwargs, so repeated `get_model` calls reuse one client (and its HTTP session)
+    instead of querying the model tables and constructing a new client every time.
+
+    Entries expire after `LLM_REGISTRY_TTL` seconds and are dropped when the organisation's
+    model version stamp is bumped through `invalidate`.
+    """
+    _clients = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _ttl(cls):
+        return int(get_config("LLM_REGISTRY_TTL", 600))
+
+    @classmethod
+    def build_key(cls, organisation_id, model: str, api_key: str, kwargs: dict):
+        api_key_hash = hashlib.sha256(str(api_key).encode("utf-8")).hexdigest()
+        return organisation_id, model, api_key_hash, tuple(sorted((k, repr(v)) for k, v in kwargs.items()))
+
+    @classmethod
+    def version_key(cls, organisation_id):
+        return CacheVersion.key("organisation_models", organisation_id)
+
+    @classmethod
+    def get(cls, key):
+        """
+        Returns the registered client for the key, or None if it is missing, expired or stale.
+        """
+        with cls._lock:
+            entry = cls._clients.get(key)
+        if entry is None:
+            return None
+        client, version, registered_at = entry
+        if time.monotonic() - registered_at >= cls._ttl() or CacheVersion.fetch([cls.version_key(key[0])]) != version:
+            with cls._lock:
+                cls._clients.pop(key, None)
+            return None
+        return client
+
+    @classmethod
+    def fetch_version(cls, organisation_id):
+        """Returns the current model version of the organisation, to be read before the client is built."""
+        return CacheVersion.fetch([cls.version_key(organisation_id)])
+
+    @classmethod
+    def register(cls, key, client, version):
+        if client is None or version is None:
+            return
+        with cls._lock:
+            cls._clients[key] = (client, version, time.monotonic())
+
+    @classmethod
+    def invalidate(cls, organisation_id):
+        """
+        Drops the clients of an organisation in this process and marks them stale in every other process.
+
+        Args:
+            organisation_id (int): The ID of the organisation whose models or api keys changed.
+        """
+        with cls._lock:
+            for key in [key for key in cls._clients if key[0] == organisation_id]:
+                del cls._clients[key]
+        CacheVersion.bump(cls.version_key(organisation_id))
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._clients.clear()
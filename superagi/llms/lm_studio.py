@@ -30,6 +30,8 @@ class LMStudio(BaseLlm):
         self.presence_penalty = presence_penalty
         self.number_of_results = number_of_results
         self.end_point = end_point or "http://192.168.0.144:1234"
+        # Kept per client so a registry-cached LM Studio client reuses its connections
+        self.http_session = requests.Session()
 
         # Ensure endpoint has proper format
         if not self.end_point.startswith('http'):
@@ -117,7 +119,7 @@ class LMStudio(BaseLlm):
             logger.info(f"Making request to LM Studio at: {url}")
             logger.info(f"Request data: {json.dumps(data, indent=2)}")
 
-            response = requests.post(url, headers=headers, json=data, timeout=60)
+            response = self.http_session.post(url, headers=headers, json=data, timeout=60)
 
             if response.status_code == 200:
                 response_data = response.json()
@@ -190,7 +192,7 @@ class LMStudio(BaseLlm):
                 headers['Authorization'] = f'Bearer {self.api_key}'
 
             url = f"{self.end_point}/models"
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.http_session.get(url, headers=headers, timeout=30)
 
             if response.status_code == 200:
                 models_data = response.json()
@@ -220,7 +222,7 @@ class LMStudio(BaseLlm):
                 headers['Authorization'] = f'Bearer {test_key}'
 
             url = f"{self.end_point}/models"
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.http_session.get(url, headers=headers, timeout=10)
 
             return response.status_code == 200
 
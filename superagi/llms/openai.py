@@ -84,6 +84,7 @@ class OpenAi(BaseLlm):
         try:
             # openai.api_key = get_config("OPENAI_API_KEY")
             response = openai.ChatCompletion.create(
+                api_key=self.api_key,
                 n=self.number_of_results,
                 model=self.model,
                 messages=messages,
@@ -122,7 +123,7 @@ class OpenAi(BaseLlm):
             bool: True if the access key is valid, False otherwise.
         """
         try:
-            models = openai.Model.list()
+            models = openai.Model.list(api_key=self.api_key)
             return True
         except Exception as exception:
             logger.info("OpenAi Exception:", exception)
@@ -136,7 +137,7 @@ class OpenAi(BaseLlm):
             list: The models.
         """
         try:
-            models = openai.Model.list()
+            models = openai.Model.list(api_key=self.api_key)
             models = [model["id"] for model in models["data"]]
             models_supported = ['gpt-4', 'gpt-3.5-turbo', 'gpt-3.5-turbo-16k', 'gpt-4-32k']
             models = [model for model in models if model in models_supported]
@@ -0,0 +1,51 @@
+from sqlalchemy import Column, Integer, String, Date, Float
+
+from superagi.models.base_model import DBBaseModel
+
+
+class AgentAnalyticsRollup(DBBaseModel):
+    """
+    Daily totals of the run events of an agent, rolled up from the events table.
+
+    Only agents with an agent_created event are rolled up, the model and the name of the agent
+    are the ones of that event.
+
+    Attributes:
+        id (int): The unique identifier of the rollup.
+        org_id (int): The identifier of the organisation.
+        agent_id (int): The identifier of the agent.
+        day (date): The UTC day of the events.
+        agent_name (str): The name of the agent.
+        model (str): The model the agent was created with.
+        agents_created (int): The number of agent_created events.
+        runs_completed (int): The number of runs that completed or crossed the iteration limit.
+        tokens_consumed (int): The tokens consumed by those runs.
+        calls (int): The llm calls made by those runs.
+        run_time_total (float): The total run time in seconds of the runs with a run_created event.
+        timed_runs (int): The number of runs in run_time_total.
+    """
+
+    __tablename__ = 'agent_analytics_rollups'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    org_id = Column(Integer)
+    agent_id = Column(Integer)
+    day = Column(Date)
+    agent_name = Column(String)
+    model = Column(String)
+    agents_created = Column(Integer, default=0)
+    runs_completed = Column(Integer, default=0)
+    tokens_consumed = Column(Integer, default=0)
+    calls = Column(Integer, default=0)
+    run_time_total = Column(Float, default=0)
+    timed_runs = Column(Integer, default=0)
+
+    def __repr__(self):
+        """
+        Returns a string representation of the Agent Analytics Rollup object.
+
+        Returns:
+            str: String representation of the Agent Analytics Rollup.
+        """
+        return f"AgentAnalyticsRollup(id={self.id}, org_id={self.org_id}, agent_id={self.agent_id}, " \
+               f"day={self.day}, runs_completed={self.runs_completed}, tokens_consumed={self.tokens_consumed})"
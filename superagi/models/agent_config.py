@@ -87,6 +87,9 @@ class AgentConfiguration(DBBaseModel):
         # Commit the changes to the database
         session.commit()
 
+        from superagi.agent.agent_step_context import AgentStepContext
+        AgentStepContext.invalidate(agent_id=agent_id)
+
         return "Details updated successfully"
     
     @classmethod
@@ -66,6 +66,9 @@ class AgentExecutionConfiguration(DBBaseModel):
                 session.add(agent_execution_config)
             session.commit()
 
+        from superagi.agent.agent_step_context import AgentStepContext
+        AgentStepContext.invalidate(agent_execution_id=execution.id)
+
     @classmethod
     def fetch_configuration(cls, session, execution_id):
         """
@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, Text, String, asc
+from sqlalchemy import Boolean, Column, Integer, Text, String, asc, desc, event
 from sqlalchemy.orm import Session
 
+from superagi.helper.feed_parser import render_feed_display, is_feed_visible
 from superagi.models.agent_execution import AgentExecution
 from superagi.models.base_model import DBBaseModel
 
@@ -16,6 +17,9 @@ class AgentExecutionFeed(DBBaseModel):
         feed (str): The feed content.
         role (str): The role of the feed entry. Possible values: 'system', 'user', or 'assistant'.
         extra_info (str): Additional information related to the feed entry.
+        token_count (int): The number of tokens in the feed content, excluding the per message overhead.
+        display_feed (str): The feed content as shown in the execution feed, rendered when the feed is written.
+        is_visible (bool): Whether the feed is shown in the execution feed.
     """
 
     __tablename__ = 'agent_execution_feeds'
@@ -28,6 +32,9 @@ class AgentExecutionFeed(DBBaseModel):
     extra_info = Column(String)
     feed_group_id = Column(String)
     error_message = Column(String)
+    token_count = Column(Integer)
+    display_feed = Column(Text)
+    is_visible = Column(Boolean)
 
     def __repr__(self):
         """
@@ -57,7 +64,8 @@ class AgentExecutionFeed(DBBaseModel):
     @classmethod
     def fetch_agent_execution_feeds(cls, session, agent_execution_id: int):
         agent_execution = AgentExecution.find_by_id(session, agent_execution_id)
-        agent_feeds = session.query(AgentExecutionFeed.role, AgentExecutionFeed.feed, AgentExecutionFeed.id) \
+        agent_feeds = session.query(AgentExecutionFeed.role, AgentExecutionFeed.feed, AgentExecutionFeed.id,
+                                    AgentExecutionFeed.token_count) \
             .filter(AgentExecutionFeed.agent_execution_id == agent_execution_id,
                     AgentExecutionFeed.feed_group_id == agent_execution.current_feed_group_id) \
             .order_by(asc(AgentExecutionFeed.created_at)) \
@@ -67,3 +75,117 @@ class AgentExecutionFeed(DBBaseModel):
             return agent_feeds
         else:
             return agent_feeds[2:]
+
+    @classmethod
+    def fetch_agent_execution_feeds_window(cls, session, agent_execution_id: int, token_budget: int,
+                                           after_feed_id: int = 0, page_size: int = 50):
+        """
+        Fetches the newest feeds of the current feed group, reading keyset pages newest first until
+        the token budget is full, instead of loading the whole feed group.
+
+        Args:
+            session: The database session object.
+            agent_execution_id (int): The ID of the agent execution.
+            token_budget (int): The number of tokens after which no more pages are read.
+            after_feed_id (int): Feeds up to this ID are covered by the LTM summary and are never read.
+            page_size (int): The number of feeds read per query.
+
+        Returns:
+            list: The feeds in chronological order.
+        """
+        filters, after_feed_id = cls._feed_group_filters(session, agent_execution_id, after_feed_id)
+
+        agent_feeds = []
+        token_total = 0
+        before_feed_id = None
+        while token_total <= token_budget:
+            query = session.query(AgentExecutionFeed.role, AgentExecutionFeed.feed, AgentExecutionFeed.id,
+                                  AgentExecutionFeed.token_count) \
+                .filter(*filters, AgentExecutionFeed.id > (after_feed_id or 0))
+            if before_feed_id is not None:
+                query = query.filter(AgentExecutionFeed.id < before_feed_id)
+            page = query.order_by(desc(AgentExecutionFeed.id)).limit(page_size).all()
+            agent_feeds.extend(page)
+            if len(page) < page_size:
+                break
+            before_feed_id = page[-1].id
+            token_total += sum(cls._estimate_token_count(agent_feed) for agent_feed in page)
+        agent_feeds.reverse()
+        return agent_feeds
+
+    @classmethod
+    def fetch_agent_execution_feeds_range(cls, session, agent_execution_id: int, after_feed_id: int,
+                                          before_feed_id: int, token_budget: int, page_size: int = 50):
+        """
+        Fetches the oldest feeds of the current feed group between two feed IDs, reading keyset pages
+        oldest first until the token budget is full.
+
+        Args:
+            session: The database session object.
+            agent_execution_id (int): The ID of the agent execution.
+            after_feed_id (int): Only feeds after this ID are read.
+            before_feed_id (int): Only feeds before this ID are read.
+            token_budget (int): The number of tokens the feeds may add up to, the first feed is always read.
+            page_size (int): The number of feeds read per query.
+
+        Returns:
+            list: The feeds in chronological order.
+        """
+        filters, after_feed_id = cls._feed_group_filters(session, agent_execution_id, after_feed_id)
+        agent_feeds = []
+        token_total = 0
+        while True:
+            page = session.query(AgentExecutionFeed.role, AgentExecutionFeed.feed, AgentExecutionFeed.id,
+                                 AgentExecutionFeed.token_count) \
+                .filter(*filters, AgentExecutionFeed.id > (after_feed_id or 0),
+                        AgentExecutionFeed.id < before_feed_id) \
+                .order_by(asc(AgentExecutionFeed.id)) \
+                .limit(page_size) \
+                .all()
+            for agent_feed in page:
+                token_total += cls._estimate_token_count(agent_feed)
+                if agent_feeds and token_total > token_budget:
+                    return agent_feeds
+                agent_feeds.append(agent_feed)
+            if len(page) < page_size:
+                return agent_feeds
+            after_feed_id = page[-1].id
+
+    @classmethod
+    def has_agent_feeds(cls, session, agent_execution_id: int) -> bool:
+        """Whether the current feed group has feeds, other than the prompt feeds the default feed group starts with."""
+        filters, after_feed_id = cls._feed_group_filters(session, agent_execution_id)
+        return session.query(AgentExecutionFeed.id) \
+            .filter(*filters, AgentExecutionFeed.id > (after_feed_id or 0)) \
+            .first() is not None
+
+    @classmethod
+    def _feed_group_filters(cls, session, agent_execution_id: int, after_feed_id: int = 0):
+        """Returns the filters of the current feed group, and the ID after which its feeds follow the prompt feeds."""
+        agent_execution = AgentExecution.find_by_id(session, agent_execution_id)
+        filters = [AgentExecutionFeed.agent_execution_id == agent_execution_id,
+                   AgentExecutionFeed.feed_group_id == agent_execution.current_feed_group_id]
+        # Default feed has prompt in the first 2 entries.
+        if agent_execution.current_feed_group_id == "DEFAULT":
+            prompt_feeds = session.query(AgentExecutionFeed.id).filter(*filters) \
+                .order_by(asc(AgentExecutionFeed.id)) \
+                .limit(2) \
+                .all()
+            if prompt_feeds:
+                after_feed_id = max(after_feed_id or 0, prompt_feeds[-1].id)
+        return filters, after_feed_id
+
+    @staticmethod
+    def _estimate_token_count(agent_feed) -> int:
+        # rows written before token counts were stored fall back to ~4 characters per token
+        if agent_feed.token_count is not None:
+            return agent_feed.token_count
+        return len(agent_feed.feed or "") // 4
+
+
+@event.listens_for(AgentExecutionFeed, "before_insert")
+@event.listens_for(AgentExecutionFeed, "before_update")
+def render_agent_execution_feed(mapper, connection, target):
+    """Render the display form of a feed whenever it is written, so reading the execution feed needs no parsing."""
+    target.display_feed = render_feed_display(target.role, target.feed)
+    target.is_visible = is_feed_visible(target.feed)
@@ -0,0 +1,97 @@
+from sqlalchemy import Column, Integer, String, Text
+
+from superagi.models.base_model import DBBaseModel
+
+
+class KnowledgeInstallation(DBBaseModel):
+    """
+    Progress of the background installation of a marketplace knowledge into a vector db index.
+
+    Attributes:
+        id (int): The unique identifier of the installation.
+        knowledge_name (str): The marketplace name of the knowledge.
+        vector_db_index_id (int): The index the knowledge is installed into.
+        organisation_id (int): The identifier of the installing organisation.
+        status (str): PENDING, RUNNING, COMPLETED or FAILED.
+        installed_chunks (int): The number of chunks upserted so far, an installation resumes after them.
+        error (str): The error of the last failed attempt.
+    """
+
+    __tablename__ = 'knowledge_installations'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    knowledge_name = Column(String)
+    vector_db_index_id = Column(Integer)
+    organisation_id = Column(Integer)
+    status = Column(String)
+    installed_chunks = Column(Integer, default=0)
+    error = Column(Text)
+
+    def __repr__(self):
+        """
+        Returns a string representation of the Knowledge Installation object.
+
+        Returns:
+            str: String representation of the Knowledge Installation.
+        """
+        return f"KnowledgeInstallation(id={self.id}, knowledge_name='{self.knowledge_name}', " \
+               f"vector_db_index_id={self.vector_db_index_id}, organisation_id={self.organisation_id}, " \
+               f"status='{self.status}', installed_chunks={self.installed_chunks})"
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "knowledge_name": self.knowledge_name,
+            "vector_db_index_id": self.vector_db_index_id,
+            "status": self.status,
+            "installed_chunks": self.installed_chunks,
+            "error": self.error,
+        }
+
+    @classmethod
+    def get_installation(cls, session, installation_id: int, organisation_id: int = None):
+        query = session.query(KnowledgeInstallation).filter(KnowledgeInstallation.id == installation_id)
+        if organisation_id is not None:
+            query = query.filter(KnowledgeInstallation.organisation_id == organisation_id)
+        return query.first()
+
+    @classmethod
+    def find_unfinished(cls, session, knowledge_name: str, vector_db_index_id: int, organisation_id: int):
+        return session.query(KnowledgeInstallation).filter(
+            KnowledgeInstallation.knowledge_name == knowledge_name,
+            KnowledgeInstallation.vector_db_index_id == vector_db_index_id,
+            KnowledgeInstallation.organisation_id == organisation_id,
+            KnowledgeInstallation.status != "COMPLETED").order_by(KnowledgeInstallation.id.desc()).first()
+
+    @classmethod
+    def add_installation(cls, session, knowledge_name: str, vector_db_index_id: int, organisation_id: int):
+        installation = KnowledgeInstallation(knowledge_name=knowledge_name, vector_db_index_id=vector_db_index_id,
+                                             organisation_id=organisation_id, status="PENDING", installed_chunks=0)
+        session.add(installation)
+        session.commit()
+        return installation
+
+    @classmethod
+    def claim(cls, session, installation_id: int) -> bool:
+        """
+        Marks a pending or failed installation as running, in one update so only one worker claims it.
+
+        Returns:
+            bool: True if the installation was claimed, False if it is running or completed.
+        """
+        claimed = session.query(KnowledgeInstallation).filter(
+            KnowledgeInstallation.id == installation_id,
+            KnowledgeInstallation.status.in_(["PENDING", "FAILED"])
+        ).update({"status": "RUNNING", "error": None}, synchronize_session=False)
+        session.commit()
+        return claimed == 1
+
+    @classmethod
+    def update_status(cls, session, installation_id: int, status: str, installed_chunks: int = None,
+                      error: str = None):
+        installation = session.query(KnowledgeInstallation).filter(KnowledgeInstallation.id == installation_id).first()
+        installation.status = status
+        if installed_chunks is not None:
+            installation.installed_chunks = installed_chunks
+        installation.error = error
+        session.commit()
@@ -100,6 +100,8 @@ class ModelsConfig(DBBaseModel):
                 cls.storeLMStudioModels(session, organisation_id, new_entry.id, model_api_key)
             result = {'message': 'The API key was successfully stored', 'model_provider_id': new_entry.id}
 
+        from superagi.agent.agent_step_context import AgentStepContext
+        AgentStepContext.invalidate(organisation_id=organisation_id)
         return result
 
     @classmethod
@@ -0,0 +1,36 @@
+from sqlalchemy import Column, Integer, String, Date
+
+from superagi.models.base_model import DBBaseModel
+
+
+class ToolAnalyticsRollup(DBBaseModel):
+    """
+    Daily number of tool_used events of a tool by an agent, rolled up from the events table.
+
+    Attributes:
+        id (int): The unique identifier of the rollup.
+        org_id (int): The identifier of the organisation.
+        agent_id (int): The identifier of the agent.
+        tool_name (str): The name of the tool.
+        day (date): The UTC day of the events.
+        calls (int): The number of tool_used events.
+    """
+
+    __tablename__ = 'tool_analytics_rollups'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    org_id = Column(Integer)
+    agent_id = Column(Integer)
+    tool_name = Column(String)
+    day = Column(Date)
+    calls = Column(Integer, default=0)
+
+    def __repr__(self):
+        """
+        Returns a string representation of the Tool Analytics Rollup object.
+
+        Returns:
+            str: String representation of the Tool Analytics Rollup.
+        """
+        return f"ToolAnalyticsRollup(id={self.id}, org_id={self.org_id}, agent_id={self.agent_id}, " \
+               f"tool_name='{self.tool_name}', day={self.day}, calls={self.calls})"
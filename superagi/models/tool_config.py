@@ -2,6 +2,7 @@ from sqlalchemy import Column, Integer, String, Boolean
 from sqlalchemy.orm import Session, sessionmaker
 from superagi.types.key_type import ToolConfigKeyType
 from superagi.models.base_model import DBBaseModel
+from superagi.helper.cache_version import CacheVersion
 from superagi.helper.encyption_helper import encrypt_data
 import json
 import yaml
@@ -34,6 +35,15 @@ class ToolConfig(DBBaseModel):
     def __repr__(self):
         return f"ToolConfig(id={self.id}, key='{self.key}', value='{self.value}, toolkit_id={self.toolkit_id}')"
 
+    @staticmethod
+    def version_key(toolkit_id: int) -> str:
+        return CacheVersion.key("toolkit_config", toolkit_id)
+
+    @classmethod
+    def invalidate_cache(cls, toolkit_id: int):
+        """Marks everything cached from the configs of the toolkit as stale in every process."""
+        CacheVersion.bump(cls.version_key(toolkit_id))
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -100,6 +110,7 @@ class ToolConfig(DBBaseModel):
             session.add(tool_config)
 
         session.commit()
+        ToolConfig.invalidate_cache(toolkit_id)
 
     @classmethod
     def get_toolkit_tool_config(cls, session: Session, toolkit_id: int):
@@ -8,6 +8,7 @@ from superagi.models.base_model import DBBaseModel
 from superagi.models.workflows.agent_workflow_step_tool import AgentWorkflowStepTool
 from superagi.models.workflows.agent_workflow_step_wait import AgentWorkflowStepWait
 from superagi.models.workflows.iteration_workflow import IterationWorkflow
+from superagi.models.workflows.workflow_graph import WorkflowGraph
 
 
 class AgentWorkflowStep(DBBaseModel):
@@ -105,6 +106,9 @@ class AgentWorkflowStep(DBBaseModel):
     @classmethod
     def find_by_id(cls, session, step_id: int):
         """ Find the workflow step by id"""
+        graph = WorkflowGraph.fetch(session)
+        if graph is not None and graph.has_step(step_id):
+            return graph.step(step_id)
         return session.query(AgentWorkflowStep).filter(AgentWorkflowStep.id == step_id).first()
 
     @classmethod
@@ -148,6 +152,7 @@ class AgentWorkflowStep(DBBaseModel):
         workflow_step.next_steps = []
         workflow_step.completion_prompt = completion_prompt
         session.commit()
+        WorkflowGraph.invalidate()
         return workflow_step
 
     @classmethod
@@ -171,6 +176,7 @@ class AgentWorkflowStep(DBBaseModel):
         workflow_step.action_type = "WAIT_STEP"
         workflow_step.next_steps = []
         session.commit()
+        WorkflowGraph.invalidate()
         return workflow_step
 
     @classmethod
@@ -204,6 +210,7 @@ class AgentWorkflowStep(DBBaseModel):
         workflow_step.action_type = "ITERATION_WORKFLOW"
         workflow_step.next_steps = []
         session.commit()
+        WorkflowGraph.invalidate()
         return workflow_step
 
     @classmethod
@@ -232,6 +239,7 @@ class AgentWorkflowStep(DBBaseModel):
             next_steps.append({"step_response": str(step_response), "step_id": str(next_unique_id)})
             current_step.next_steps = next_steps
         session.commit()
+        WorkflowGraph.invalidate()
         return current_step
 
     @classmethod
@@ -242,6 +250,9 @@ class AgentWorkflowStep(DBBaseModel):
             session: db session
             current_agent_step_id: id of the current agent step
         """
+        graph = WorkflowGraph.fetch(session)
+        if graph is not None and graph.has_step(current_agent_step_id):
+            return graph.default_next_step(current_agent_step_id)
         current_step = AgentWorkflowStep.find_by_id(session, current_agent_step_id)
         next_steps = current_step.next_steps
         default_steps = [step for step in next_steps if step["step_response"] == "default"]
@@ -258,6 +269,9 @@ class AgentWorkflowStep(DBBaseModel):
             current_agent_step_id: id of the current agent step
             step_response: response of the current step
         """
+        graph = WorkflowGraph.fetch(session)
+        if graph is not None and graph.has_step(current_agent_step_id):
+            return graph.next_step(current_agent_step_id, step_response)
         current_step = AgentWorkflowStep.find_by_id(session, current_agent_step_id)
         next_steps = current_step.next_steps
         matching_steps = [step for step in next_steps if str(step["step_response"]).lower() == step_response.lower()]
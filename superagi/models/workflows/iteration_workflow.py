@@ -4,6 +4,7 @@ from sqlalchemy import Column, Integer, String, Text, Boolean
 
 from superagi.models.base_model import DBBaseModel
 from superagi.models.workflows.iteration_workflow_step import IterationWorkflowStep
+from superagi.models.workflows.workflow_graph import WorkflowGraph
 
 
 class IterationWorkflow(DBBaseModel):
@@ -90,6 +91,11 @@ class IterationWorkflow(DBBaseModel):
             int: The ID of the trigger step.
 
         """
+        graph = WorkflowGraph.fetch(session)
+        if graph is not None:
+            trigger_step = graph.iteration_trigger_step(workflow_id)
+            if trigger_step is not None:
+                return trigger_step
 
         trigger_step = session.query(IterationWorkflowStep).filter(
             IterationWorkflowStep.iteration_workflow_id == workflow_id,
@@ -127,10 +133,16 @@ class IterationWorkflow(DBBaseModel):
             session.commit()
         iteration_workflow.has_task_queue = has_task_queue
         session.commit()
+        WorkflowGraph.invalidate()
 
         return iteration_workflow
 
     @classmethod
     def find_by_id(cls, session, id: int):
         """ Find the workflow step by id"""
+        graph = WorkflowGraph.fetch(session)
+        if graph is not None:
+            iteration_workflow = graph.iteration_workflow(id)
+            if iteration_workflow is not None:
+                return iteration_workflow
         return session.query(IterationWorkflow).filter(IterationWorkflow.id == id).first()
\ No newline at end of file
@@ -4,6 +4,7 @@ from sqlalchemy import Column, Integer, String, Text, Boolean
 from sqlalchemy.dialects.postgresql import JSONB
 
 from superagi.models.base_model import DBBaseModel
+from superagi.models.workflows.workflow_graph import WorkflowGraph
 
 
 class IterationWorkflowStep(DBBaseModel):
@@ -94,6 +95,9 @@ class IterationWorkflowStep(DBBaseModel):
 
     @classmethod
     def find_by_id(cls, session, step_id: int):
+        graph = WorkflowGraph.fetch(session)
+        if graph is not None and graph.has_iteration_step(step_id):
+            return graph.iteration_step(step_id)
         return session.query(IterationWorkflowStep).filter(IterationWorkflowStep.id == step_id).first()
 
     @classmethod
@@ -116,6 +120,7 @@ class IterationWorkflowStep(DBBaseModel):
         if completion_prompt:
             workflow_step.completion_prompt = completion_prompt
         session.commit()
+        WorkflowGraph.invalidate()
         return workflow_step
 
 
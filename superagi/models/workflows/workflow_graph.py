@@ -0,0 +1,152 @@
+import copy
+import threading
+import time
+
+from sqlalchemy import inspect
+
+from superagi.helper.cache_version import CacheVersion
+
+
+class WorkflowGraph:
+    """
+    Process-local compiled snapshot of the agent workflows and of the iteration workflows their steps run.
+
+    The graph holds the steps of every agent workflow, the transitions of every step keyed by step
+    response, and the iteration workflows with their steps, so moving an execution from one step to
+    the next needs no database reads. Workflows are seeded at startup and rarely written; writers
+    call `invalidate` once committed and the graph is compiled again on the next lookup. Without
+    Redis, `fetch` returns None and callers read the database.
+
+    Lookups return copies of the rows that are not attached to any session.
+    """
+    TTL_SECONDS = 600
+
+    _snapshot = None
+    _lock = threading.Lock()
+
+    def __init__(self, steps: list, iteration_workflows: list, iteration_steps: list):
+        self._steps = {step.id: step for step in steps}
+        self._workflow_steps = {}
+        self._steps_by_unique_id = {}
+        self._transitions = {}
+        self._default_transitions = {}
+        for step in steps:
+            self._workflow_steps.setdefault(step.agent_workflow_id, {}).setdefault(step.unique_id, step)
+            self._steps_by_unique_id.setdefault(step.unique_id, step)
+            transitions = {}
+            for next_step in step.next_steps or []:
+                transitions.setdefault(str(next_step["step_response"]).lower(), str(next_step["step_id"]))
+                if next_step["step_response"] == "default":
+                    self._default_transitions.setdefault(step.id, str(next_step["step_id"]))
+            self._transitions[step.id] = transitions
+        self._iteration_workflows = {workflow.id: workflow for workflow in iteration_workflows}
+        self._iteration_steps = {step.id: step for step in iteration_steps}
+        self._iteration_trigger_steps = {}
+        for step in iteration_steps:
+            if step.step_type == "TRIGGER":
+                self._iteration_trigger_steps.setdefault(step.iteration_workflow_id, step)
+
+    @classmethod
+    def fetch(cls, session):
+        """
+        Get the compiled graph, compiling it if the cached one is stale.
+
+        Args:
+            session: The database session, only used to compile the graph.
+
+        Returns:
+            WorkflowGraph: The graph, or None if it cannot be cached.
+        """
+        version = CacheVersion.fetch([cls.version_key()])
+        if version is None:
+            return None
+        snapshot = cls._snapshot
+        if snapshot is not None:
+            graph, graph_version, built_at = snapshot
+            if graph_version == version and time.monotonic() - built_at < cls.TTL_SECONDS:
+                return graph
+        with cls._lock:
+            # the version was read before the rows, so a write racing with the compile leaves a stale version behind
+            graph = cls._compile(session)
+            cls._snapshot = (graph, version, time.monotonic())
+        return graph
+
+    @classmethod
+    def version_key(cls) -> str:
+        return CacheVersion.key("workflow_graph", "all")
+
+    @classmethod
+    def invalidate(cls):
+        """Marks the compiled graph as stale in every process, to be called after workflow rows are committed."""
+        CacheVersion.bump(cls.version_key())
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._snapshot = None
+
+    @classmethod
+    def _compile(cls, session):
+        from superagi.models.workflows.agent_workflow_step import AgentWorkflowStep
+        from superagi.models.workflows.iteration_workflow import IterationWorkflow
+        from superagi.models.workflows.iteration_workflow_step import IterationWorkflowStep
+
+        steps = session.query(AgentWorkflowStep).order_by(AgentWorkflowStep.id).all()
+        iteration_workflows = session.query(IterationWorkflow).order_by(IterationWorkflow.id).all()
+        iteration_steps = session.query(IterationWorkflowStep).order_by(IterationWorkflowStep.id).all()
+        return WorkflowGraph([_detached_copy(step) for step in steps],
+                             [_detached_copy(workflow) for workflow in iteration_workflows],
+                             [_detached_copy(step) for step in iteration_steps])
+
+    def has_step(self, step_id: int) -> bool:
+        return step_id in self._steps
+
+    def step(self, step_id: int):
+        step = self._steps.get(step_id)
+        return _detached_copy(step) if step is not None else None
+
+    def default_next_step(self, step_id: int):
+        """Same as `AgentWorkflowStep.fetch_default_next_step`, for a step in the graph."""
+        next_unique_id = self._default_transitions.get(step_id)
+        if next_unique_id is None:
+            return None
+        return self._find_by_unique_id(step_id, next_unique_id)
+
+    def next_step(self, step_id: int, step_response: str):
+        """Same as `AgentWorkflowStep.fetch_next_step`, for a step in the graph."""
+        transitions = self._transitions[step_id]
+        next_unique_id = transitions.get(step_response.lower())
+        if next_unique_id is None:
+            next_unique_id = transitions.get("default")
+            if next_unique_id is None:
+                return None
+        if next_unique_id == "-1":
+            return "COMPLETE"
+        return self._find_by_unique_id(step_id, next_unique_id)
+
+    def iteration_workflow(self, iteration_workflow_id: int):
+        workflow = self._iteration_workflows.get(iteration_workflow_id)
+        return _detached_copy(workflow) if workflow is not None else None
+
+    def has_iteration_step(self, iteration_step_id: int) -> bool:
+        return iteration_step_id in self._iteration_steps
+
+    def iteration_step(self, iteration_step_id: int):
+        step = self._iteration_steps.get(iteration_step_id)
+        return _detached_copy(step) if step is not None else None
+
+    def iteration_trigger_step(self, iteration_workflow_id: int):
+        step = self._iteration_trigger_steps.get(iteration_workflow_id)
+        return _detached_copy(step) if step is not None else None
+
+    def _find_by_unique_id(self, step_id: int, unique_id: str):
+        # steps are looked up within their own workflow first, unique ids are prefixed with the workflow id
+        agent_workflow_id = self._steps[step_id].agent_workflow_id
+        step = self._workflow_steps.get(agent_workflow_id, {}).get(unique_id) or self._steps_by_unique_id.get(unique_id)
+        return _detached_copy(step) if step is not None else None
+
+
+def _detached_copy(row):
+    model = type(row)
+    return model(**{attribute.key: copy.deepcopy(getattr(row, attribute.key))
+                    for attribute in inspect(model).column_attrs})
@@ -1,5 +1,6 @@
 from datetime import datetime
 import logging
+from superagi.agent.agent_step_context import AgentStepContext
 from superagi.lib.logger import logger
 from superagi.models.agent import Agent
 from superagi.models.agent_config import AgentConfiguration
@@ -63,6 +64,8 @@ class ResourceSummarizer:
                    AgentConfiguration.key == "last_resource_time").first()
 
 
+        summary_changed = agent_config_resource_summary is None or \
+                          agent_config_resource_summary.value != resource_summary
         if agent_config_resource_summary is not None:
             agent_config_resource_summary.value = resource_summary
         else:
@@ -76,6 +79,8 @@ class ResourceSummarizer:
                                                      value=str(resources[-1].updated_at))
             self.session.add(agent_last_resource)
         self.session.commit()
+        if summary_changed:
+            AgentStepContext.invalidate(agent_id=self.agent_id)
 
     def fetch_or_create_agent_resource_summary(self, default_summary: str):
         print(self.__get_model_source())
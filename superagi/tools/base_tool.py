@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from functools import wraps
+from functools import lru_cache, wraps
 from inspect import signature
 from typing import List
 from typing import Optional, Type, Callable, Any, Union, Dict, Tuple
@@ -59,19 +59,29 @@ def create_function_schema(
     )
 
 
+@lru_cache(maxsize=1)
+def _load_config_yaml():
+    with open("config.yaml") as file:
+        return yaml.safe_load(file) or {}
+
+
 class BaseToolkitConfiguration:
 
     def __init__(self):
         self.session = None
 
     def get_tool_config(self, key: str):
-        # Default implementation of the tool configuration retrieval logic
-        with open("config.yaml") as file:
-            config = yaml.safe_load(file)
+        # Default implementation of the tool configuration retrieval logic, config.yaml is read once per process
+        config = _load_config_yaml()
 
         # Retrieve the value associated with the given key
         return config.get(key)
 
+    @staticmethod
+    def reload_config():
+        """Drop the parsed config.yaml, so the next lookup reads it from disk again."""
+        _load_config_yaml.cache_clear()
+
 
 class BaseTool(BaseModel):
     name: str = None
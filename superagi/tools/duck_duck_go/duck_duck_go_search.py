@@ -1,7 +1,6 @@
 import json
 import requests
 from typing import Type, Optional,Union
-import time
 from superagi.helper.error_handler import ErrorHandler
 from superagi.lib.logger import logger
 from pydantic import BaseModel, Field
@@ -12,12 +11,13 @@ from superagi.llms.base_llm import BaseLlm
 from superagi.models.agent_execution import AgentExecution
 from superagi.models.agent_execution_feed import AgentExecutionFeed
 from superagi.tools.base_tool import BaseTool
-from superagi.helper.webpage_extractor import WebpageExtractor
+from superagi.helper.webpage_fetcher import WebpageFetcher
 
 #Const variables
 DUCKDUCKGO_MAX_ATTEMPTS = 3
 WEBPAGE_EXTRACTOR_MAX_ATTEMPTS=2
 MAX_LINKS_TO_SCRAPE=3
+SEARCH_TOKEN_BUDGET=3000
 NUM_RESULTS_TO_USE=10
 class DuckDuckGoSearchSchema(BaseModel):
     query: str = Field(
@@ -95,7 +95,7 @@ class DuckDuckGoSearchTool(BaseTool):
         for webpage in webpages:
             results.append({"title": search_results[i]["title"], "body": webpage, "links": search_results[i]["href"]})
             i += 1
-            if TokenCounter.count_text_tokens(json.dumps(results)) > 3000:
+            if TokenCounter.count_text_tokens(json.dumps(results)) > SEARCH_TOKEN_BUDGET:
                 break    
 
         return results
@@ -113,17 +113,8 @@ class DuckDuckGoSearchTool(BaseTool):
         webpages=[]                                                                         #webpages array for storing the contents extracted from the links
         
         if links:
-            for i in range(0, MAX_LINKS_TO_SCRAPE):                                         #using first 3 (Value of MAX_LINKS_TO_SCRAPE) links
-                time.sleep(3)
-                content = WebpageExtractor().extract_with_bs4(links[i])                     #takes in the link and returns content extracted from Webpage extractor
-                max_length = len(' '.join(content.split(" ")[:500]))    
-                content = content[:max_length]                                              #formatting the content
-                attempts = 0
-                while content == "" and attempts < WEBPAGE_EXTRACTOR_MAX_ATTEMPTS:
-                    attempts += 1
-                    content = WebpageExtractor().extract_with_bs4(links[i])
-                    content = content[:max_length]
-                webpages.append(content)
+            webpages = WebpageFetcher(max_attempts=WEBPAGE_EXTRACTOR_MAX_ATTEMPTS + 1) \
+                .fetch(links[:MAX_LINKS_TO_SCRAPE], token_budget=SEARCH_TOKEN_BUDGET)                   #using first 3 (Value of MAX_LINKS_TO_SCRAPE) links
 
         return webpages
 
@@ -6,3 +6,17 @@ class BaseEmbedding(ABC):
     @abstractmethod
     def get_embedding(self, text):
         pass
+
+    def get_embeddings(self, texts, batch_size: int = None):
+        """
+        Get the embeddings of several texts, in the order of the texts. Models with a batch
+        endpoint override this; the default embeds the texts one by one.
+
+        Args:
+            texts: The texts to embed.
+            batch_size (int): The maximum number of texts sent in one request.
+
+        Returns:
+            list: The embedding of every text.
+        """
+        return [self.get_embedding(text) for text in texts]
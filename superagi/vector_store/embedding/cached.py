@@ -0,0 +1,166 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import redis
+
+from superagi.config.config import get_config
+from superagi.lib.logger import logger
+from superagi.lib.redis_pool import RedisPool
+from superagi.vector_store.embedding.base import BaseEmbedding
+
+EMBEDDING_CACHE_SIZE = 512
+
+
+class CachedEmbedding(BaseEmbedding):
+    """
+    Wraps an embedding model with a cache keyed by the model and a hash of the text, so identical
+    texts (queries repeated across steps, the "sample" text used to learn the vector dimension)
+    are embedded once.
+
+    Embeddings are kept in a process-local LRU shared by every wrapper of the same model. When
+    EMBEDDING_REDIS_CACHE_TTL is set, they are also kept in Redis for that many seconds so other
+    processes can reuse them. Errors returned by the wrapped model are never cached.
+
+    Attributes:
+        embedding_model: The wrapped embedding model.
+    """
+    _cache = OrderedDict()
+    _dimensions = {}
+    _lock = threading.Lock()
+
+    def __init__(self, embedding_model):
+        self.embedding_model = embedding_model
+
+    @classmethod
+    def wrap(cls, embedding_model):
+        """Returns the embedding model wrapped in a cache, unless it is None or already cached."""
+        if embedding_model is None or isinstance(embedding_model, CachedEmbedding):
+            return embedding_model
+        return cls(embedding_model)
+
+    def __getattr__(self, name):
+        return getattr(self.embedding_model, name)
+
+    @property
+    def model_key(self) -> str:
+        return f"{type(self.embedding_model).__name__}:{getattr(self.embedding_model, 'model', '')}"
+
+    def get_embedding(self, text):
+        key = self._build_key(text)
+        with self._lock:
+            embedding = self._cache.get(key)
+            if embedding is not None:
+                self._cache.move_to_end(key)
+                return embedding
+
+        embedding = self._fetch_from_redis(key)
+        if embedding is None:
+            embedding = self.embedding_model.get_embedding(text)
+            if isinstance(embedding, dict) and "error" in embedding:
+                return embedding
+            self._store_in_redis(key, embedding)
+        self._store(key, embedding)
+        return embedding
+
+    def get_embeddings(self, texts, batch_size: int = None):
+        """
+        Get the embeddings of several texts, sending only the uncached ones to the wrapped model in one batch.
+
+        Args:
+            texts: The texts to embed.
+            batch_size (int): The maximum number of texts the wrapped model sends in one request.
+
+        Returns:
+            list: The embedding of every text, in the order of the texts.
+        """
+        texts = list(texts)
+        keys = [self._build_key(text) for text in texts]
+        embeddings = [None] * len(texts)
+        with self._lock:
+            for index, key in enumerate(keys):
+                embedding = self._cache.get(key)
+                if embedding is not None:
+                    self._cache.move_to_end(key)
+                    embeddings[index] = embedding
+        for index, key in enumerate(keys):
+            if embeddings[index] is None:
+                embeddings[index] = self._fetch_from_redis(key)
+
+        missing = [index for index, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            missing_texts = [texts[index] for index in missing]
+            if hasattr(self.embedding_model, "get_embeddings"):
+                new_embeddings = self.embedding_model.get_embeddings(missing_texts, batch_size=batch_size)
+            else:
+                new_embeddings = [self.embedding_model.get_embedding(text) for text in missing_texts]
+            for index, embedding in zip(missing, new_embeddings):
+                embeddings[index] = embedding
+                if not (isinstance(embedding, dict) and "error" in embedding):
+                    self._store_in_redis(keys[index], embedding)
+        for key, embedding in zip(keys, embeddings):
+            if not (isinstance(embedding, dict) and "error" in embedding):
+                self._store(key, embedding)
+        return embeddings
+
+    def get_dimension(self) -> int:
+        """
+        Returns the dimension of the model's vectors, embedding the "sample" text once per model.
+
+        Returns:
+            int: The vector dimension.
+        """
+        dimension = self._dimensions.get(self.model_key)
+        if dimension is not None:
+            return dimension
+        sample_embedding = self.get_embedding("sample")
+        if "error" in sample_embedding:
+            logger.error(f"Error in embedding model {sample_embedding}")
+            return len(sample_embedding)
+        self._dimensions[self.model_key] = len(sample_embedding)
+        return len(sample_embedding)
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._cache.clear()
+            cls._dimensions.clear()
+
+    def _build_key(self, text: str) -> str:
+        text_hash = hashlib.sha256(str(text).encode("utf-8")).hexdigest()
+        return f"embedding:{self.model_key}:{text_hash}"
+
+    def _store(self, key: str, embedding):
+        with self._lock:
+            self._cache[key] = embedding
+            self._cache.move_to_end(key)
+            while len(self._cache) > EMBEDDING_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    @classmethod
+    def _redis_ttl(cls) -> int:
+        return int(get_config("EMBEDDING_REDIS_CACHE_TTL", 0) or 0)
+
+    @classmethod
+    def _get_db(cls):
+        return RedisPool.get_client()
+
+    def _fetch_from_redis(self, key: str):
+        if self._redis_ttl() <= 0:
+            return None
+        try:
+            value = self._get_db().get(key)
+        except redis.RedisError as e:
+            logger.error(f"Unable to fetch cached embedding: {e}")
+            return None
+        return json.loads(value) if value is not None else None
+
+    def _store_in_redis(self, key: str, embedding):
+        ttl = self._redis_ttl()
+        if ttl <= 0:
+            return
+        try:
+            self._get_db().set(key, json.dumps(embedding), ex=ttl)
+        except redis.RedisError as e:
+            logger.error(f"Unable to cache embedding: {e}")
@@ -1,7 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import openai
 
+from superagi.helper.token_counter import TokenCounter
+from superagi.vector_store.embedding.base import BaseEmbedding
+
+# Requests to the embeddings endpoint are split so none exceeds these limits,
+# and at most EMBEDDING_MAX_CONCURRENCY of them are in flight at once.
+EMBEDDING_BATCH_SIZE = 256
+EMBEDDING_BATCH_TOKEN_LIMIT = 100000
+EMBEDDING_MAX_CONCURRENCY = 4
 
-class OpenAiEmbedding:
+
+class OpenAiEmbedding(BaseEmbedding):
     def __init__(self, api_key, model="text-embedding-ada-002"):
         self.model = model
         self.api_key = api_key
@@ -29,3 +40,54 @@ class OpenAiEmbedding:
             return response['data'][0]['embedding']
         except Exception as exception:
             return {"error": exception}
+
+    def get_embeddings(self, texts, batch_size: int = EMBEDDING_BATCH_SIZE):
+        """
+        Get the embeddings of several texts using as few requests as the batch limits allow.
+
+        Args:
+            texts: The texts to embed.
+            batch_size (int): The maximum number of texts sent in one request.
+
+        Returns:
+            list: The embedding of every text, or {"error": exception} for texts whose request failed.
+        """
+        texts = list(texts)
+        batches = self._split_batches(texts, batch_size or EMBEDDING_BATCH_SIZE)
+        if len(batches) <= 1:
+            results = [self._embed_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=min(EMBEDDING_MAX_CONCURRENCY, len(batches))) as executor:
+                results = list(executor.map(self._embed_batch, batches))
+        return [embedding for batch_embeddings in results for embedding in batch_embeddings]
+
+    def _embed_batch(self, texts):
+        try:
+            response = openai.Embedding.create(
+                api_key=self.api_key,
+                input=texts,
+                engine=self.model
+            )
+            data = sorted(response['data'], key=lambda item: item['index'])
+            return [item['embedding'] for item in data]
+        except Exception as exception:
+            return [{"error": exception} for _ in texts]
+
+    @staticmethod
+    def _split_batches(texts, batch_size: int):
+        batches = []
+        batch = []
+        batch_tokens = 0
+        for text in texts:
+            text_tokens = TokenCounter.count_content_tokens(text)
+            if text_tokens is None:
+                text_tokens = len(text or "") // 4
+            if batch and (len(batch) >= batch_size or batch_tokens + text_tokens > EMBEDDING_BATCH_TOKEN_LIMIT):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+            batch.append(text)
+            batch_tokens += text_tokens
+        if batch:
+            batches.append(batch)
+        return batches
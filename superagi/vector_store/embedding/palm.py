@@ -1,8 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import openai
 import google.generativeai as palm
 
+from superagi.vector_store.embedding.base import BaseEmbedding
+
+# The PaLM embedding endpoint takes one text per request, so batches are sent concurrently instead.
+EMBEDDING_MAX_CONCURRENCY = 4
+
 
-class PalmEmbedding:
+class PalmEmbedding(BaseEmbedding):
     def __init__(self, api_key, model="models/embedding-gecko-001"):
         self.model = model
         self.api_key = api_key
@@ -13,3 +20,20 @@ class PalmEmbedding:
             return response['embedding']
         except Exception as exception:
             return {"error": exception}
+
+    def get_embeddings(self, texts, batch_size: int = None):
+        """
+        Get the embeddings of several texts, with at most EMBEDDING_MAX_CONCURRENCY requests in flight.
+
+        Args:
+            texts: The texts to embed.
+            batch_size (int): Unused, the endpoint embeds one text per request.
+
+        Returns:
+            list: The embedding of every text, or {"error": exception} for texts whose request failed.
+        """
+        texts = list(texts)
+        if len(texts) <= 1:
+            return [self.get_embedding(text) for text in texts]
+        with ThreadPoolExecutor(max_workers=min(EMBEDDING_MAX_CONCURRENCY, len(texts))) as executor:
+            return list(executor.map(self.get_embedding, texts))
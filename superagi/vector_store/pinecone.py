@@ -68,10 +68,11 @@ class Pinecone(VectorStore):
         if len(ids) < len(texts):
             raise ValueError("Number of ids must match number of texts.")
 
-        for text, id in zip(texts, ids):
+        embeddings = self.embedding_model.get_embeddings(texts, batch_size=batch_size)
+        for text, id, embedding in zip(texts, ids, embeddings):
             metadata = metadatas.pop(0) if metadatas else {}
             metadata[self.text_field] = text
-            vectors.append((id, self.embedding_model.get_embedding(text), metadata))
+            vectors.append((id, embedding, metadata))
 
         self.add_embeddings_to_vector_db({"vectors": vectors})
         return ids
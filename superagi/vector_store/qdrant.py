@@ -79,12 +79,13 @@ class Qdrant(VectorStore):
         metadata_list = metadata_list or []
         id_list = id_list or [uuid.uuid4().hex for _ in input_texts]
         num_batches = len(input_texts) // batch_limit + (len(input_texts) % batch_limit != 0)
+        input_vectors = self.__get_embeddings(input_texts)
 
         for i in range(num_batches):
             text_batch = input_texts[i * batch_limit: (i + 1) * batch_limit]
             metadata_batch = metadata_list[i * batch_limit: (i + 1) * batch_limit] or None
             id_batch = id_list[i * batch_limit: (i + 1) * batch_limit]
-            vectors = self.__get_embeddings(text_batch)
+            vectors = input_vectors[i * batch_limit: (i + 1) * batch_limit]
             payloads = self.__build_payloads(
                 text_batch,
                 metadata_batch,
@@ -129,7 +130,7 @@ class Qdrant(VectorStore):
         if embedding is not None and text is not None:
             raise ValueError("Only provide embedding or text")
         if text is not None:
-            embedding = self.__get_embeddings(text)[0]
+            embedding = self.__get_embeddings([text])[0]
 
         if metadata is not None:
             filter_conditions = []
@@ -205,10 +206,7 @@ class Qdrant(VectorStore):
     ) -> List[List[float]]:
         """Return embeddings for a list of texts using the embedding model."""
         if self.embedding_model is not None:
-            query_vectors = []
-            for text in texts:
-                query_vector = self.embedding_model.get_embedding(text)
-                query_vectors.append(query_vector)
+            query_vectors = self.embedding_model.get_embeddings(texts)
         else:
             raise ValueError("Embedding model is not set")
         
@@ -5,12 +5,11 @@ from typing import Any, List, Iterable, Mapping
 from typing import Optional, Pattern
 import traceback
 import numpy as np
-import redis
 from redis.commands.search.field import TagField, VectorField
 from redis.commands.search.indexDefinition import IndexDefinition, IndexType
 
-from superagi.config.config import get_config
 from superagi.lib.logger import logger
+from superagi.lib.redis_pool import RedisPool
 from superagi.vector_store.base import VectorStore
 from superagi.vector_store.document import Document
 
@@ -41,8 +40,7 @@ class Redis(VectorStore):
         embedding_model: An instance of a BaseEmbedding model.
         vector_group_id: vector group id used to index similar vectors.
         """
-        redis_url = get_config('REDIS_URL')
-        self.redis_client = redis.Redis.from_url("redis://" + redis_url + "/0", decode_responses=True)
+        self.redis_client = RedisPool.get_client()
         # self.redis_client = redis.Redis(host=redis_host, port=redis_port)
         self.index = index
         self.embedding_model = embedding_model
@@ -63,10 +61,12 @@ class Redis(VectorStore):
         pipe = self.redis_client.pipeline()
         prefix = DOC_PREFIX + str(self.index)
         keys = []
-        for i, text in enumerate(texts):
+        texts = list(texts)
+        if embeddings is None:
+            embeddings = self.embedding_model.get_embeddings(texts)
+        for i, (text, embedding) in enumerate(zip(texts, embeddings)):
             id = ids[i] if ids else self.build_redis_key(prefix)
             metadata = metadatas[i] if metadatas else {}
-            embedding = self.embedding_model.get_embedding(text)
             embedding_arr = np.array(embedding, dtype=np.float32)
 
             pipe.hset(id, mapping={CONTENT_KEY: text, self.vector_key: embedding_arr.tobytes(),
@@ -4,10 +4,10 @@ from pinecone import UnauthorizedException
 from superagi.vector_store.pinecone import Pinecone
 from superagi.vector_store import weaviate
 from superagi.config.config import get_config
-from superagi.lib.logger import logger
 from superagi.types.vector_store_types import VectorStoreType
 from superagi.vector_store import qdrant
 from superagi.vector_store.redis import Redis
+from superagi.vector_store.embedding.cached import CachedEmbedding
 from superagi.vector_store.embedding.openai import OpenAiEmbedding
 from superagi.vector_store.qdrant import Qdrant
 
@@ -29,6 +29,7 @@ class VectorFactory:
         """
         if isinstance(vector_store, str):
             vector_store = VectorStoreType.get_vector_store_type(vector_store)
+        embedding_model = CachedEmbedding.wrap(embedding_model)
         if vector_store == VectorStoreType.PINECONE:
             try:
                 api_key = get_config("PINECONE_API_KEY")
@@ -38,14 +39,10 @@ class VectorFactory:
                 pinecone.init(api_key=api_key, environment=env)
 
                 if index_name not in pinecone.list_indexes():
-                    sample_embedding = embedding_model.get_embedding("sample")
-                    if "error" in sample_embedding:
-                        logger.error(f"Error in embedding model {sample_embedding}")
-
                     # if does not exist, create index
                     pinecone.create_index(
                         index_name,
-                        dimension=len(sample_embedding),
+                        dimension=embedding_model.get_dimension(),
                         metric='dotproduct'
                     )
                 index = pinecone.Index(index_name)
@@ -67,11 +64,7 @@ class VectorFactory:
 
         if vector_store == VectorStoreType.QDRANT:
             client = qdrant.create_qdrant_client()
-            sample_embedding = embedding_model.get_embedding("sample")
-            if "error" in sample_embedding:
-                logger.error(f"Error in embedding model {sample_embedding}")
-
-            Qdrant.create_collection(client, index_name, len(sample_embedding))
+            Qdrant.create_collection(client, index_name, embedding_model.get_dimension())
             return qdrant.Qdrant(client, embedding_model, index_name)
         
         if vector_store == VectorStoreType.REDIS:
@@ -86,6 +79,7 @@ class VectorFactory:
     def build_vector_storage(cls, vector_store: VectorStoreType, index_name, embedding_model = None, **creds):
         if isinstance(vector_store, str):
             vector_store = VectorStoreType.get_vector_store_type(vector_store)
+        embedding_model = CachedEmbedding.wrap(embedding_model)
         
         if vector_store == VectorStoreType.PINECONE:
             try:
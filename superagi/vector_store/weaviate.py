@@ -55,11 +55,12 @@ class Weaviate(VectorStore):
     ) -> List[str]:
         result = {}
         collected_ids = []
-        for i, text in enumerate(texts):
+        texts = list(texts)
+        vectors = self.embedding_model.get_embeddings(texts)
+        for i, (text, vector) in enumerate(zip(texts, vectors)):
             metadata = metadatas[i] if metadatas else {}
             data_object = metadata.copy()
             data_object[self.text_field] = text
-            vector = self.embedding_model.get_embedding(text)
             id = str(uuid4())
             result = {"ids": id, "data_object": data_object, "vectors": vector}
             collected_ids.append(id)
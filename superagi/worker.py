@@ -1,13 +1,14 @@
 from __future__ import absolute_import
 import sys
 
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import object_session, sessionmaker
 
 from superagi.helper.tool_helper import handle_tools_import
 from superagi.lib.logger import logger
 
 from datetime import timedelta
 from celery import Celery
+from celery.signals import worker_process_shutdown, worker_shutdown
 
 from superagi.config.config import get_config
 from superagi.helper.agent_schedule_helper import AgentScheduleHelper
@@ -16,9 +17,12 @@ from superagi.models.agent import Agent
 from superagi.models.db import connect_db
 from superagi.types.model_source_types import ModelSourceType
 
-from sqlalchemy import event
+from sqlalchemy import event, orm
 from superagi.models.agent_execution import AgentExecution
+from superagi.models.agent_execution_feed import AgentExecutionFeed
 from superagi.helper.webhook_manager import WebHookManager
+from superagi.lib.execution_event_channel import ExecutionEventChannel
+from superagi.apm.apm_write_buffer import ApmWriteBuffer
 
 redis_url = get_config('REDIS_URL', 'super__redis:6379')
 
@@ -38,6 +42,10 @@ beat_schedule = {
         'task': 'execute_waiting_workflows',
         'schedule': timedelta(minutes=2),
     },
+    'refresh_analytics_rollups': {
+        'task': 'refresh_analytics_rollups',
+        'schedule': timedelta(minutes=1),
+    },
 }
 app.conf.beat_schedule = beat_schedule
 
@@ -45,6 +53,34 @@ app.conf.beat_schedule = beat_schedule
 def agent_status_change(target, val,old_val,initiator):
     if not hasattr(sys, '_called_from_test'):
         webhook_callback.delay(target.id,val,old_val)
+        session = object_session(target)
+        # an execution that is not in a session yet has no id to publish the change under
+        if val != old_val and session is not None:
+            ExecutionEventChannel.record_status_change(session, target, val,
+                                                       old_val if isinstance(old_val, str) else None)
+
+@event.listens_for(AgentExecutionFeed, "after_insert")
+def agent_execution_feed_added(mapper, connection, target):
+    if not hasattr(sys, '_called_from_test'):
+        ExecutionEventChannel.record_feed(object_session(target), target)
+
+@event.listens_for(orm.Session, "after_flush")
+def resolve_execution_events(session, flush_context):
+    ExecutionEventChannel.resolve_recorded(session)
+
+@event.listens_for(orm.Session, "after_commit")
+def publish_execution_events(session):
+    ExecutionEventChannel.publish_recorded(session)
+
+@event.listens_for(orm.Session, "after_rollback")
+def discard_execution_events(session):
+    ExecutionEventChannel.discard_recorded(session)
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def flush_apm_write_buffer(**kwargs):
+    """Flush the buffered events and call logs, pool processes exit without running atexit hooks."""
+    ApmWriteBuffer.shutdown()
 
 @app.task(name="execute_waiting_workflows", autoretry_for=(Exception,), retry_backoff=2, max_retries=5)
 def execute_waiting_workflows():
@@ -103,6 +139,52 @@ def summarize_resource(agent_id: int, resource_id: int):
                                                                documents=documents)
     session.close()
 
+@app.task(name="summarize_agent_history", autoretry_for=(Exception,), retry_backoff=2, max_retries=5)
+def summarize_agent_history(agent_id: int, agent_execution_id: int):
+    """Fold the older history of an agent execution into its LTM summary in background."""
+    from superagi.agent.agent_message_builder import AgentLlmMessageBuilder
+    from superagi.agent.agent_step_context import AgentStepContext
+    from superagi.llms.llm_model_factory import get_model
+
+    engine = connect_db()
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        try:
+            step_context = AgentStepContext.fetch(session, agent_id, agent_execution_id)
+            if step_context.model_config is None:
+                logger.info("Unable to get model config...")
+                return
+            llm = get_model(model=step_context.agent_config["model"], api_key=step_context.model_api_key,
+                            organisation_id=step_context.organisation.id)
+            logger.info("Summarize agent history:" + str(agent_id) + "," + str(agent_execution_id))
+            AgentLlmMessageBuilder(session, llm, llm.get_model(), agent_id, agent_execution_id).update_ltm_summary()
+        finally:
+            AgentLlmMessageBuilder.release_ltm_summary_request(agent_execution_id)
+
+@app.task(name="install_knowledge")
+def install_knowledge(installation_id: int):
+    """
+    Install a marketplace knowledge in background, resuming after the chunks installed by earlier attempts.
+
+    A failed installation is not retried, it is resumed when it is installed again.
+    """
+    from superagi.jobs.knowledge_installer import KnowledgeInstaller
+
+    engine = connect_db()
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        KnowledgeInstaller(session, installation_id).install()
+
+@app.task(name="refresh_analytics_rollups", autoretry_for=(Exception,), retry_backoff=2, max_retries=5)
+def refresh_analytics_rollups():
+    """Roll the recent events up into the analytics rollups read by the analytics endpoints."""
+    from superagi.jobs.analytics_rollup_builder import AnalyticsRollupBuilder
+
+    engine = connect_db()
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        AnalyticsRollupBuilder(session).refresh()
+
 @app.task(name="webhook_callback", autoretry_for=(Exception,), retry_backoff=2, max_retries=5,serializer='pickle')
 def webhook_callback(agent_execution_id,val,old_val):
     engine = connect_db()
@@ -20,6 +20,11 @@ def mock_openai_embedding(monkeypatch):
         "get_embedding",
         lambda self, text: np.random.random(3).tolist(),
     )
+    monkeypatch.setattr(
+        OpenAiEmbedding,
+        "get_embeddings",
+        lambda self, texts, batch_size=None: [np.random.random(3).tolist() for _ in texts],
+    )
 
 
 @pytest.fixture
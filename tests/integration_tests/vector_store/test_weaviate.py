@@ -41,13 +41,13 @@ class TestWeaviate(unittest.TestCase):
         self.embedding_model.get_embedding.assert_called_once_with('query')
 
     def test_add_texts(self):
-        self.embedding_model.get_embedding.return_value = 'vector'
+        self.embedding_model.get_embeddings.return_value = ['vector1', 'vector2']
         self.weaviateVectorStore.add_embeddings_to_vector_db = Mock()
         texts = ['text1', 'text2']
         result = self.weaviateVectorStore.add_texts(texts)
         self.assertEqual(len(result), 2)    # We expect to get 2 IDs.
         self.assertTrue(isinstance(result[0], str))    # The IDs should be strings.
-        self.embedding_model.get_embedding.assert_has_calls([call(texts[0]), call(texts[1])])
+        self.embedding_model.get_embeddings.assert_called_once_with(texts)
         self.assertEqual(self.weaviateVectorStore.add_embeddings_to_vector_db.call_count, 2)
 
     def test_add_embeddings_to_vector_db(self):
@@ -7,7 +7,7 @@ from superagi.agent.agent_message_builder import AgentLlmMessageBuilder
 from superagi.agent.agent_prompt_builder import AgentPromptBuilder
 from superagi.agent.output_handler import ToolOutputHandler
 from superagi.agent.task_queue import TaskQueue
-from superagi.agent.tool_builder import ToolBuilder
+from superagi.agent.tool_builder import ToolBuilder, ExecutionToolCache
 from superagi.config.config import get_config
 from superagi.helper.token_counter import TokenCounter
 from superagi.models.agent import Agent
@@ -50,10 +50,10 @@ def test_build_agent_prompt(test_handler, mocker):
 
     mocker.patch.object(AgentPromptBuilder, 'replace_main_variables', return_value='Test prompt')
     mocker.patch.object(AgentPromptBuilder, 'replace_task_based_variables', return_value='Test prompt')
-    mocker.patch.object(task_queue, 'get_last_task_details', return_value={"task": "last task", "response": "last response"})
-    mocker.patch.object(task_queue, 'get_first_task', return_value='Test task')
-    mocker.patch.object(task_queue, 'get_tasks', return_value=[])
-    mocker.patch.object(task_queue, 'get_completed_tasks', return_value=[])
+    mocker.patch.object(task_queue, 'get_task_details',
+                        return_value={"current_task": "Test task", "tasks": [],
+                                      "last_task_details": {"task": "last task", "response": "last response"},
+                                      "completed_tasks": []})
     mocker.patch.object(TokenCounter, 'token_limit', return_value=1000)
     mocker.patch('superagi.agent.agent_iteration_step_handler.get_config', return_value=600)
 
@@ -66,12 +66,11 @@ def test_build_agent_prompt(test_handler, mocker):
     assert result_prompt == 'Test prompt'
     AgentPromptBuilder.replace_main_variables.assert_called_once_with(prompt, agent_execution_config["goal"],
                                                                       agent_execution_config["instruction"],
-                                                                      agent_config["constraints"], agent_tools, False)
-    AgentPromptBuilder.replace_task_based_variables.assert_called_once()
-    task_queue.get_last_task_details.assert_called_once()
-    task_queue.get_first_task.assert_called_once()
-    task_queue.get_tasks.assert_called_once()
-    task_queue.get_completed_tasks.assert_called_once()
+                                                                      agent_config["constraints"], agent_tools, False,
+                                                                      tools_string=mocker.ANY)
+    AgentPromptBuilder.replace_task_based_variables.assert_called_once_with('Test prompt', 'Test task', 'last task',
+                                                                            'last response', [], [], 400)
+    task_queue.get_task_details.assert_called_once()
     TokenCounter.token_limit.assert_called_once()
 
 def test_build_tools(test_handler, mocker):
@@ -84,7 +83,7 @@ def test_build_tools(test_handler, mocker):
     mocker.patch.object(ToolBuilder, 'set_default_params_tool', return_value=ThinkingTool())
     mocker.patch.object(ResourceSummarizer, 'fetch_or_create_agent_resource_summary', return_value=True)
     mocker.patch('superagi.models.tool.Tool')
-    test_handler.session.query.return_value.filter.return_value.all.return_value = [ThinkingTool()]
+    test_handler.session.query.return_value.filter.return_value.all.return_value = [Tool(id=1, toolkit_id=1)]
 
     # Act
     agent_tools = test_handler._build_tools(agent_config, agent_execution_config)
@@ -97,6 +96,28 @@ def test_build_tools(test_handler, mocker):
     assert ResourceSummarizer.fetch_or_create_agent_resource_summary.call_count == 1
 
 
+def test_build_tools_reuses_cached_tools(test_handler, mocker):
+    agent_config = {'model': 'gpt-3', 'tools': [1, 2, 3], 'resource_summary': True}
+    agent_execution_config = {'goal': 'Test goal', 'instruction': 'Test instruction', 'tools': [1]}
+
+    ExecutionToolCache.clear()
+    mocker.patch('superagi.agent.tool_builder.CacheVersion.fetch', return_value=(1,))
+    mocker.patch.object(AgentConfiguration, 'get_model_api_key', return_value={'api_key': 'test_api_key', 'provider': 'test_provider'})
+    mocker.patch.object(ToolBuilder, 'build_tool', return_value=ThinkingTool())
+    mocker.patch.object(ToolBuilder, 'set_default_params_tool', side_effect=lambda tool, *args, **kwargs: tool)
+    mocker.patch.object(ResourceSummarizer, 'fetch_or_create_agent_resource_summary', return_value=None)
+    test_handler.session.query.return_value.filter.return_value.all.return_value = [Tool(id=1, toolkit_id=1)]
+
+    first_tools = test_handler._build_tools(agent_config, agent_execution_config)
+    second_tools = test_handler._build_tools(agent_config, agent_execution_config)
+    agent_execution_config['tools'] = [1, 2]
+    test_handler._build_tools(agent_config, agent_execution_config)
+
+    assert second_tools is first_tools
+    assert ToolBuilder.build_tool.call_count == 2
+    ExecutionToolCache.clear()
+
+
 def test_handle_wait_for_permission(test_handler, mocker):
     # Arrange
     mock_agent_execution = mocker.Mock(spec=AgentExecution)
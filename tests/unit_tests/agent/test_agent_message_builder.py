@@ -41,6 +41,95 @@ def test_build_agent_messages(mock_get_config, mock_token_limit):
         assert feed_obj.feed == messages[i]["content"]
         assert feed_obj.role == messages[i]["role"]
 
+@patch('superagi.agent.agent_message_builder.AgentLlmMessageBuilder._request_ltm_summary')
+@patch('superagi.helper.token_counter.TokenCounter.count_batch')
+def test_split_history(mock_count_batch, mock_request_ltm_summary):
+    history = [{'role': 'user', 'content': 'feed', 'chat_id': chat_id, 'token_count': 7} for chat_id in range(1, 6)]
+    mock_count_batch.return_value = [10, 10, 10, 10, 10]
+    builder = AgentLlmMessageBuilder(Mock(), Mock(), "gpt-4", 1, 1)
+
+    past_messages, current_messages = builder._split_history(history, 30)
+
+    assert past_messages == history[:3]
+    assert current_messages == history[3:]
+    mock_request_ltm_summary.assert_called_once()
+
+    mock_request_ltm_summary.reset_mock()
+    past_messages, current_messages = builder._split_history(history, 100)
+
+    assert past_messages == []
+    assert current_messages == history
+    mock_request_ltm_summary.assert_not_called()
+
+
+@patch('superagi.agent.agent_message_builder.AgentLlmMessageBuilder._add_or_update_last_agent_feed_ltm_summary_id')
+@patch('superagi.agent.agent_message_builder.AgentLlmMessageBuilder._build_ltm_summary')
+@patch('superagi.models.agent_execution_feed.AgentExecutionFeed.fetch_agent_execution_feeds_range')
+@patch('superagi.agent.agent_message_builder.AgentLlmMessageBuilder.fetch_agent_feeds')
+@patch('superagi.helper.token_counter.TokenCounter.count_batch')
+@patch('superagi.helper.token_counter.TokenCounter.token_limit')
+@patch('superagi.agent.agent_message_builder.get_config')
+def test_update_ltm_summary(mock_get_config, mock_token_limit, mock_count_batch, mock_fetch_agent_feeds,
+                            mock_fetch_range, mock_build_ltm_summary, mock_add_or_update_ltm_summary_id):
+    mock_get_config.return_value = 800
+    mock_token_limit.return_value = 1200
+    # the window starts well after the boundary at feed 2
+    mock_fetch_agent_feeds.return_value = [Mock(role='user', feed='feed', id=feed_id, token_count=97)
+                                           for feed_id in range(10, 15)]
+    mock_count_batch.return_value = [100, 100, 100, 100, 100]
+    mock_fetch_range.return_value = [Mock(role='user', feed='feed', id=feed_id) for feed_id in range(3, 7)]
+    mock_build_ltm_summary.return_value = "summary"
+    mock_session = Mock()
+    builder = AgentLlmMessageBuilder(mock_session, Mock(), "gpt-4", 1, 1)
+    builder.last_agent_feed_ltm_summary_id = 2
+
+    assert builder.update_ltm_summary() == "summary"
+
+    mock_fetch_range.assert_called_once_with(mock_session, 1, 2, 14, 300)
+    past_messages = mock_build_ltm_summary.call_args.kwargs['past_messages']
+    assert [message['chat_id'] for message in past_messages] == [3, 4, 5, 6]
+    # the boundary only moves past the feeds that were summarized
+    mock_add_or_update_ltm_summary_id.assert_called_once_with("6")
+
+
+@patch('superagi.agent.agent_message_builder.AgentLlmMessageBuilder._build_ltm_summary')
+@patch('superagi.models.agent_execution_feed.AgentExecutionFeed.fetch_agent_execution_feeds_range')
+@patch('superagi.agent.agent_message_builder.AgentLlmMessageBuilder.fetch_agent_feeds')
+@patch('superagi.helper.token_counter.TokenCounter.count_batch')
+@patch('superagi.helper.token_counter.TokenCounter.token_limit')
+@patch('superagi.agent.agent_message_builder.get_config')
+def test_update_ltm_summary_keeps_a_short_history(mock_get_config, mock_token_limit, mock_count_batch,
+                                                  mock_fetch_agent_feeds, mock_fetch_range, mock_build_ltm_summary):
+    mock_get_config.return_value = 800
+    mock_token_limit.return_value = 1200
+    mock_fetch_agent_feeds.return_value = [Mock(role='user', feed='feed', id=1, token_count=97)]
+    mock_count_batch.return_value = [100]
+    builder = AgentLlmMessageBuilder(Mock(), Mock(), "gpt-4", 1, 1)
+
+    assert builder.update_ltm_summary() is None
+    mock_fetch_range.assert_not_called()
+    mock_build_ltm_summary.assert_not_called()
+
+
+@patch('superagi.models.agent_execution_config.AgentExecutionConfiguration.fetch_value')
+@patch('superagi.models.agent_execution_feed.AgentExecutionFeed.fetch_agent_execution_feeds_window')
+@patch('superagi.helper.token_counter.TokenCounter.token_limit')
+@patch('superagi.agent.agent_message_builder.get_config')
+def test_fetch_agent_feeds_skips_summarized_feeds(mock_get_config, mock_token_limit, mock_fetch_window,
+                                                  mock_fetch_value):
+    mock_get_config.return_value = 800
+    mock_token_limit.return_value = 4000
+    mock_fetch_value.return_value = Mock(value="12")
+    mock_fetch_window.return_value = ["feed"]
+    mock_session = Mock()
+
+    builder = AgentLlmMessageBuilder(mock_session, Mock(), "gpt-4", 1, 2)
+
+    assert builder.fetch_agent_feeds() == ["feed"]
+    assert builder.last_agent_feed_ltm_summary_id == 12
+    mock_fetch_window.assert_called_once_with(mock_session, 2, 2400 + 4000, after_feed_id=12)
+
+
 @patch('superagi.models.agent_execution_config.AgentExecutionConfiguration.fetch_value')
 @patch('superagi.models.agent_execution_config.AgentExecutionConfiguration.add_or_update_agent_execution_config')
 @patch('superagi.agent.agent_message_builder.AgentLlmMessageBuilder._build_prompt_for_recursive_ltm_summary_using_previous_ltm_summary')
@@ -119,3 +208,26 @@ def test_build_prompt_for_recursive_ltm_summary_using_previous_ltm_summary(mock_
     assert "Summary" in prompt
     assert "user: Hello\nassistant: Hi\n" in prompt
     assert "400" in prompt
+
+
+@patch('superagi.models.agent_execution_feed.AgentExecutionFeed.has_agent_feeds')
+@patch('superagi.models.agent_execution_config.AgentExecutionConfiguration.fetch_value')
+@patch('superagi.models.agent_execution_feed.AgentExecutionFeed.fetch_agent_execution_feeds_window')
+@patch('superagi.helper.token_counter.TokenCounter.token_limit')
+@patch('superagi.agent.agent_message_builder.get_config')
+def test_fetch_agent_feeds_with_everything_summarized(mock_get_config, mock_token_limit, mock_fetch_window,
+                                                      mock_fetch_value, mock_has_agent_feeds):
+    mock_get_config.return_value = 800
+    mock_token_limit.return_value = 4000
+    mock_fetch_value.return_value = Mock(value="12")
+    mock_fetch_window.return_value = []
+    mock_has_agent_feeds.return_value = True
+    mock_session = Mock()
+    builder = AgentLlmMessageBuilder(mock_session, Mock(), "gpt-4", 1, 2)
+
+    assert builder.fetch_agent_feeds() == []
+    assert builder.has_agent_feeds is True
+    mock_has_agent_feeds.assert_called_once_with(mock_session, 2)
+
+    builder.build_agent_messages("prompt", [], history_enabled=False)
+    mock_session.add.assert_not_called()
@@ -0,0 +1,83 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from superagi.agent.agent_step_context import AgentStepContext
+from superagi.helper.cache_version import CacheVersion
+from superagi.models.agent import Agent
+from superagi.models.agent_config import AgentConfiguration
+from superagi.models.agent_execution_config import AgentExecutionConfiguration
+from superagi.models.organisation import Organisation
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    AgentStepContext.clear()
+    yield
+    AgentStepContext.clear()
+
+
+@pytest.fixture
+def mock_rows():
+    with patch.object(Agent, 'fetch_configuration', return_value={"model": "gpt-4", "goal": ["goal"]}) as agent_config, \
+            patch.object(AgentExecutionConfiguration, 'fetch_configuration',
+                         return_value={"goal": ["goal"], "instruction": [], "tools": []}) as execution_config, \
+            patch.object(Agent, 'find_org_by_agent_id', return_value=Organisation(id=3, name="org")), \
+            patch.object(AgentConfiguration, 'get_model_api_key',
+                         return_value={"provider": "OpenAi", "api_key": "key"}) as model_config:
+        yield agent_config, execution_config, model_config
+
+
+def test_fetch_reuses_snapshot_while_versions_match(mock_rows):
+    agent_config, execution_config, model_config = mock_rows
+    with patch.object(CacheVersion, 'fetch', side_effect=lambda keys: tuple(0 for _ in keys)):
+        first = AgentStepContext.fetch(Mock(), 1, 2)
+        second = AgentStepContext.fetch(Mock(), 1, 2)
+
+    assert agent_config.call_count == 1
+    assert execution_config.call_count == 1
+    assert model_config.call_count == 1
+    assert second.organisation.id == 3
+    assert second.model_api_key == "key"
+    assert second.model_provider == "OpenAi"
+
+    first.agent_config["goal"].append("changed")
+    assert second.agent_config["goal"] == ["goal"]
+
+
+def test_fetch_rebuilds_when_version_changes(mock_rows):
+    agent_config, _, _ = mock_rows
+    with patch.object(CacheVersion, 'fetch', side_effect=lambda keys: tuple(0 for _ in keys)):
+        AgentStepContext.fetch(Mock(), 1, 2)
+    with patch.object(CacheVersion, 'fetch', side_effect=lambda keys: tuple(1 for _ in keys)):
+        AgentStepContext.fetch(Mock(), 1, 2)
+
+    assert agent_config.call_count == 2
+
+
+def test_fetch_does_not_cache_without_versions(mock_rows):
+    agent_config, _, _ = mock_rows
+    with patch.object(CacheVersion, 'fetch', return_value=None):
+        AgentStepContext.fetch(Mock(), 1, 2)
+        AgentStepContext.fetch(Mock(), 1, 2)
+
+    assert agent_config.call_count == 2
+
+
+def test_fetch_does_not_cache_without_model_config(mock_rows):
+    agent_config, _, model_config = mock_rows
+    model_config.side_effect = Exception("Model provider not found")
+    with patch.object(CacheVersion, 'fetch', side_effect=lambda keys: tuple(0 for _ in keys)):
+        context = AgentStepContext.fetch(Mock(), 1, 2)
+        AgentStepContext.fetch(Mock(), 1, 2)
+
+    assert context.model_config is None
+    assert agent_config.call_count == 2
+
+
+def test_invalidate_bumps_requested_keys():
+    with patch.object(CacheVersion, 'bump') as mock_bump:
+        AgentStepContext.invalidate(agent_id=1, agent_execution_id=2, organisation_id=3)
+
+    mock_bump.assert_called_once_with("cache_version:agent:1", "cache_version:agent_execution:2",
+                                      "cache_version:organisation_models:3")
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 
 from superagi.agent.task_queue import TaskQueue
 
@@ -47,6 +47,27 @@ class TaskQueueTests(unittest.TestCase):
         self.queue.get_last_task_details()
         mock_get_last_task_details.assert_called()
 
+    def test_get_task_details(self):
+        self.queue.db = MagicMock()
+        self.queue.db.pipeline.return_value.execute.return_value = [
+            ["task 2", "task 3"],
+            ['{"task": "task 1", "response": "done"}', "{'task': 'task 0', 'response': 'legacy'}"]
+        ]
+
+        task_details = self.queue.get_task_details()
+
+        self.assertEqual(task_details["current_task"], "task 2")
+        self.assertEqual(task_details["tasks"], ["task 2", "task 3"])
+        self.assertEqual(task_details["last_task_details"], {"task": "task 1", "response": "done"})
+        self.assertEqual(task_details["completed_tasks"][1], {"task": "task 0", "response": "legacy"})
+
+    def test_complete_task_records_json_response(self):
+        self.queue.db = MagicMock()
+        self.queue.complete_task({"result": "ok"})
+
+        self.queue.db.register_script.return_value.assert_called_once_with(
+            keys=["test_queue_q", "test_queue_q_completed"], args=['{"result": "ok"}'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,8 @@
 import pytest
 from unittest.mock import Mock, patch
 
-from superagi.agent.tool_builder import ToolBuilder
+from superagi.agent.tool_builder import ToolBuilder, ExecutionToolCache, DBToolkitConfiguration
+from superagi.helper.tool_import_registry import ToolImportRegistry
 from superagi.models.tool import Tool
 
 
@@ -33,18 +34,104 @@ def agent_config():
 def agent_execution_config():
     return {"goal": "Test Goal", "instruction": "Test Instruction"}
 
-@patch('superagi.agent.tool_builder.importlib.import_module')
-@patch('superagi.agent.tool_builder.getattr')
-def test_build_tool(mock_getattr, mock_import_module, tool_builder, tool):
+@patch('superagi.helper.tool_import_registry.importlib.import_module')
+def test_build_tool(mock_import_module, tool_builder, tool):
+    ToolImportRegistry.reset()
     mock_module = Mock()
-    mock_class = Mock()
     mock_import_module.return_value = mock_module
-    mock_getattr.return_value = mock_class
 
     result_tool = tool_builder.build_tool(tool)
+    tool_builder.build_tool(tool)
 
-    mock_import_module.assert_called_with('.test_folder.test')
-    mock_getattr.assert_called_with(mock_module, tool.class_name)
-
+    mock_import_module.assert_called_once_with('.test_folder.test')
     assert result_tool.toolkit_config.session == tool_builder.session
-    assert result_tool.toolkit_config.toolkit_id == tool.toolkit_id
\ No newline at end of file
+    assert result_tool.toolkit_config.toolkit_id == tool.toolkit_id
+    ToolImportRegistry.reset()
+
+@pytest.fixture
+def tool_cache():
+    ExecutionToolCache.clear()
+    yield ExecutionToolCache
+    ExecutionToolCache.clear()
+
+
+@patch('superagi.agent.tool_builder.CacheVersion.fetch', return_value=(1,))
+def test_execution_tool_cache_reuses_tools_until_toolkit_config_changes(mock_fetch, tool_cache):
+    tools = [Mock()]
+    keys, version = tool_cache.fetch_version([5, 5])
+    tool_cache.put(1, "fingerprint", tools, keys, version)
+
+    assert keys == ["cache_version:toolkit_config:5"]
+    assert tool_cache.get(1, "fingerprint") is tools
+    assert tool_cache.get(1, "other fingerprint") is None
+    mock_fetch.return_value = (2,)
+    assert tool_cache.get(1, "fingerprint") is None
+
+
+@patch('superagi.agent.tool_builder.CacheVersion.fetch', return_value=None)
+def test_execution_tool_cache_skips_caching_without_redis(mock_fetch, tool_cache):
+    keys, version = tool_cache.fetch_version([5])
+    tool_cache.put(1, "fingerprint", [Mock()], keys, version)
+
+    assert tool_cache.get(1, "fingerprint") is None
+
+
+def test_execution_tool_cache_renders_tools_prompt_once(tool_cache):
+    tools = [Mock()]
+    tool_cache.put(1, "fingerprint", tools, [], ())
+    render = Mock(return_value="1. tool")
+
+    tool_cache.get_tools_prompt(1, tools, True, render)
+    prompt = tool_cache.get_tools_prompt(1, tools, True, render)
+
+    assert prompt == "1. tool"
+    render.assert_called_once_with(tools, True)
+
+
+def test_bind_tools_points_tools_at_current_session(tool_builder):
+    tool = Mock()
+    tool.toolkit_config = DBToolkitConfiguration(session=Mock(), toolkit_id=1)
+    memory = Mock()
+
+    tool_builder.bind_tools([tool], memory)
+
+    assert tool.toolkit_config.session is tool_builder.session
+    assert tool.resource_manager.session is tool_builder.session
+    assert tool.tool_response_manager.memory is memory
+
+
+def _toolkit_configuration(session, version):
+    DBToolkitConfiguration.clear()
+    session.query.return_value.filter.return_value.all.return_value = [
+        Mock(key="API_KEY", value="plain"), Mock(key="EMPTY", value="")]
+    return patch("superagi.agent.tool_builder.CacheVersion.fetch", return_value=version)
+
+
+def test_toolkit_configs_are_loaded_with_one_query(session):
+    with _toolkit_configuration(session, ("1",)):
+        toolkit_config = DBToolkitConfiguration(session=session, toolkit_id=1)
+        assert toolkit_config.get_tool_config("API_KEY") == "plain"
+        assert toolkit_config.get_tool_config("API_KEY") == "plain"
+
+    assert session.query.call_count == 1
+
+
+def test_toolkit_configs_reload_after_invalidation(session):
+    with _toolkit_configuration(session, ("1",)) as fetch:
+        toolkit_config = DBToolkitConfiguration(session=session, toolkit_id=1)
+        toolkit_config.get_tool_config("API_KEY")
+        fetch.return_value = ("2",)
+        toolkit_config.get_tool_config("API_KEY")
+
+    assert session.query.call_count == 2
+
+
+def test_toolkit_configs_fall_back_to_config_yaml(session):
+    with _toolkit_configuration(session, None), \
+            patch("superagi.tools.base_tool._load_config_yaml", return_value={"EMPTY": "from yaml"}):
+        toolkit_config = DBToolkitConfiguration(session=session, toolkit_id=1)
+        assert toolkit_config.get_tool_config("EMPTY") == "from yaml"
+        toolkit_config.get_tool_config("EMPTY")
+
+    # without a config version nothing is cached
+    assert session.query.call_count == 2
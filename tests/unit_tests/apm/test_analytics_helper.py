@@ -20,11 +20,40 @@ def test_calculate_run_completed_metrics(analytics_helper, mock_session):
     result = analytics_helper.calculate_run_completed_metrics()
     assert isinstance(result, dict)
 
+def test_calculate_run_completed_metrics_from_rollups(analytics_helper, mock_session):
+    gpt4 = MagicMock(model='gpt-4', agents=2, runs=3, tokens=300)
+    gpt3 = MagicMock(model='gpt-3.5-turbo', agents=1, runs=0, tokens=0)
+    mock_session.query.return_value.filter.return_value.group_by.return_value.all.return_value = [gpt4, gpt3]
+
+    result = analytics_helper.calculate_run_completed_metrics()
+
+    assert result['agent_details'] == {'total_agents': 3, 'model_metrics': [{'name': 'gpt-4', 'value': 2},
+                                                                           {'name': 'gpt-3.5-turbo', 'value': 1}]}
+    assert result['run_details'] == {'total_runs': 3, 'model_metrics': [{'name': 'gpt-4', 'value': 3}]}
+    assert result['tokens_details'] == {'total_tokens': 300, 'model_metrics': [{'name': 'gpt-4', 'value': 300}]}
+
 def test_fetch_agent_data(analytics_helper, mock_session):
     mock_session.query().all.return_value = [MagicMock()]
     result = analytics_helper.fetch_agent_data()
     assert isinstance(result, dict)
 
+def test_fetch_agent_data_from_rollups(analytics_helper, mock_session):
+    agent = MagicMock(agent_id=1, agent_name='agent', model='gpt-4', total_tokens=300, total_calls=6,
+                      runs_completed=3, run_time_total=90.0, timed_runs=2)
+    idle_agent = MagicMock(agent_id=2, agent_name='idle', model='gpt-4', total_tokens=0, total_calls=0,
+                           runs_completed=0, run_time_total=0, timed_runs=0)
+    mock_session.query.return_value.filter.return_value.group_by.return_value.all.return_value = [agent, idle_agent]
+    mock_session.query.return_value.filter.return_value.distinct.return_value.all.return_value = [
+        MagicMock(agent_id=1, tool_name='Write File'), MagicMock(agent_id=1, tool_name='Read File')]
+
+    result = analytics_helper.fetch_agent_data()
+
+    assert result['agent_details'][0] == {'name': 'agent', 'agent_id': 1, 'runs_completed': 3, 'total_calls': 6,
+                                          'total_tokens': 300, 'tools_used': ['Read File', 'Write File'],
+                                          'model_name': 'gpt-4', 'avg_run_time': 45.0}
+    assert result['agent_details'][1]['tools_used'] is None
+    assert result['agent_details'][1]['avg_run_time'] == 0
+
 def test_fetch_agent_runs(analytics_helper, mock_session):
     mock_session.query().all.return_value = [MagicMock()]
     result = analytics_helper.fetch_agent_runs(1)
@@ -0,0 +1,102 @@
+import json
+import threading
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from superagi.apm.apm_write_buffer import ApmWriteBuffer
+from superagi.models.call_logs import CallLogs
+from superagi.models.events import Event
+
+
+@pytest.fixture
+def write_buffer(tmp_path):
+    spill_file = str(tmp_path / "apm_buffer.jsonl")
+    ApmWriteBuffer.reset()
+    with patch.object(ApmWriteBuffer, '_spill_file', return_value=spill_file), \
+            patch.object(ApmWriteBuffer, '_flush_interval', return_value=60), \
+            patch.object(ApmWriteBuffer, '_insert') as mock_insert:
+        yield mock_insert, spill_file
+    ApmWriteBuffer.reset()
+
+
+def _event(name):
+    return {'event_name': name, 'event_value': 1, 'event_property': {}, 'agent_id': 1, 'org_id': 1}
+
+
+def test_flush_inserts_queued_rows_in_one_batch(write_buffer):
+    mock_insert, _ = write_buffer
+    ApmWriteBuffer.add(Event, _event('tool_used'))
+    ApmWriteBuffer.add(CallLogs, {'agent_execution_name': 'run', 'agent_id': 1, 'tokens_consumed': 10,
+                                  'tool_used': 'tool', 'model': 'gpt-4', 'org_id': 1})
+
+    assert ApmWriteBuffer.flush() == 2
+
+    mock_insert.assert_called_once()
+    rows = mock_insert.call_args[0][0]
+    assert [table_name for table_name, _ in rows] == ['events', 'call_logs']
+    assert isinstance(rows[0][1]['created_at'], datetime)
+    metrics = ApmWriteBuffer.get_metrics()
+    assert metrics['flushes'] == 1
+    assert metrics['flushed_rows'] == 2
+    assert metrics['queued_rows'] == 0
+    assert metrics['max_flush_latency'] >= metrics['last_flush_latency'] >= 0
+
+
+def test_flush_when_buffer_is_full(write_buffer):
+    mock_insert, _ = write_buffer
+    flushed = threading.Event()
+    mock_insert.side_effect = lambda rows: flushed.set()
+
+    with patch.object(ApmWriteBuffer, '_buffer_size', return_value=2):
+        ApmWriteBuffer.add(Event, _event('first'))
+        ApmWriteBuffer.add(Event, _event('second'))
+        assert flushed.wait(5)
+
+    assert len(mock_insert.call_args[0][0]) == 2
+
+
+def test_failed_flush_keeps_rows_queued(write_buffer):
+    mock_insert, _ = write_buffer
+    mock_insert.side_effect = [Exception('db down'), None]
+    ApmWriteBuffer.add(Event, _event('tool_used'))
+
+    assert ApmWriteBuffer.flush() == 0
+    assert ApmWriteBuffer.get_metrics()['failed_flushes'] == 1
+    assert ApmWriteBuffer.get_metrics()['queued_rows'] == 1
+    assert ApmWriteBuffer.flush() == 1
+
+
+def test_oldest_rows_are_dropped_beyond_the_limit(write_buffer):
+    mock_insert, _ = write_buffer
+    with patch('superagi.apm.apm_write_buffer.get_config', side_effect=lambda key, default=None: 2
+               if key == 'APM_BUFFER_MAX_ROWS' else default):
+        for name in ('first', 'second', 'third'):
+            ApmWriteBuffer.add(Event, _event(name))
+
+    ApmWriteBuffer.flush()
+    assert [row['event_name'] for _, row in mock_insert.call_args[0][0]] == ['second', 'third']
+    assert ApmWriteBuffer.get_metrics()['dropped_rows'] == 1
+
+
+def test_shutdown_spills_unflushed_rows_and_next_process_replays_them(write_buffer):
+    mock_insert, spill_file = write_buffer
+    mock_insert.side_effect = Exception('db down')
+    ApmWriteBuffer.add(Event, _event('run_completed'))
+
+    ApmWriteBuffer.shutdown()
+
+    with open(spill_file) as file:
+        spilled = [json.loads(line) for line in file]
+    assert spilled[0]['table'] == 'events'
+    assert spilled[0]['row']['event_name'] == 'run_completed'
+
+    ApmWriteBuffer.reset()
+    mock_insert.side_effect = None
+    ApmWriteBuffer.add(Event, _event('tool_used'))
+    ApmWriteBuffer.flush()
+
+    rows = mock_insert.call_args[0][0]
+    assert [row['event_name'] for _, row in rows] == ['run_completed', 'tool_used']
+    assert isinstance(rows[0][1]['created_at'], datetime)
@@ -4,8 +4,9 @@ from superagi.models.call_logs import CallLogs
 from superagi.models.agent import Agent
 from superagi.models.tool import Tool
 from superagi.models.toolkit import Toolkit
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+from superagi.apm.apm_write_buffer import ApmWriteBuffer
 from superagi.apm.call_log_helper import CallLogHelper
 
 @pytest.fixture
@@ -37,6 +38,16 @@ def test_create_call_log_success(call_log_helper, mock_session):
     mock_session.add.assert_called_once()
     mock_session.commit.assert_called_once()
 
+def test_create_call_log_buffered(call_log_helper, mock_session):
+    with patch.object(ApmWriteBuffer, 'enabled', return_value=True), \
+            patch.object(ApmWriteBuffer, 'add') as mock_add:
+        call_log = call_log_helper.create_call_log('test', 1, 10, 'test_tool', 'test_model', buffered=True)
+
+    assert isinstance(call_log, CallLogs)
+    mock_add.assert_called_once_with(CallLogs, {'agent_execution_name': 'test', 'agent_id': 1, 'tokens_consumed': 10,
+                                                'tool_used': 'test_tool', 'model': 'test_model', 'org_id': 1})
+    mock_session.commit.assert_not_called()
+
 def test_create_call_log_failure(call_log_helper, mock_session):
     mock_session.commit = MagicMock(side_effect=SQLAlchemyError())
     call_log = call_log_helper.create_call_log('test', 1, 10, 'test_tool', 'test_model')
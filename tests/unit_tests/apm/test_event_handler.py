@@ -1,8 +1,9 @@
 import pytest
 from sqlalchemy.exc import SQLAlchemyError
 from superagi.models.events import Event
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+from superagi.apm.apm_write_buffer import ApmWriteBuffer
 from superagi.apm.event_handler import EventHandler
 
 @pytest.fixture
@@ -25,4 +26,24 @@ def test_create_event_success(event_handler, mock_session):
 def test_create_event_failure(event_handler, mock_session):
     mock_session.commit = MagicMock(side_effect=SQLAlchemyError())
     event = event_handler.create_event('test', {}, 1, 1, 100)
-    assert event is None
\ No newline at end of file
+    assert event is None
+
+def test_create_event_buffered(event_handler, mock_session):
+    with patch.object(ApmWriteBuffer, 'enabled', return_value=True), \
+            patch.object(ApmWriteBuffer, 'add') as mock_add:
+        event = event_handler.create_event('tool_used', {'tool_name': 'test'}, 1, 2, buffered=True)
+
+    assert isinstance(event, Event)
+    mock_add.assert_called_once_with(Event, {'event_name': 'tool_used', 'event_value': 1,
+                                             'event_property': {'tool_name': 'test'}, 'agent_id': 1, 'org_id': 2})
+    mock_session.add.assert_not_called()
+    mock_session.commit.assert_not_called()
+
+
+def test_create_event_buffered_when_buffer_disabled(event_handler, mock_session):
+    with patch.object(ApmWriteBuffer, 'enabled', return_value=False), \
+            patch.object(ApmWriteBuffer, 'add') as mock_add:
+        event_handler.create_event('tool_used', {}, 1, 2, buffered=True)
+
+    mock_add.assert_not_called()
+    mock_session.commit.assert_called_once()
@@ -21,26 +21,12 @@ def tools_handler(mock_session, organisation_id):
     return ToolsHandler(mock_session, organisation_id)
 
 def test_calculate_tool_usage(tools_handler, mock_session):
-    tool_used_subquery = MagicMock()
-    agent_count_subquery = MagicMock()
-    total_usage_subquery = MagicMock()
-
-    tool_used_subquery.c.tool_name = 'Tool1'
-    tool_used_subquery.c.agent_id = 1
-    agent_count_subquery.c.tool_name = 'Tool1'
-    agent_count_subquery.c.unique_agents = 1
-    total_usage_subquery.c.tool_name = 'Tool1'
-    total_usage_subquery.c.total_usage = 5
-
-    mock_session.query.return_value.filter_by.return_value.subquery.return_value = tool_used_subquery
-    mock_session.query.return_value.group_by.return_value.subquery.side_effect = [agent_count_subquery, total_usage_subquery]
-
     result_obj = MagicMock()
     result_obj.tool_name = 'Tool1'
     result_obj.unique_agents = 1
     result_obj.total_usage = 5
 
-    mock_session.query.return_value.join.return_value.all.return_value = [result_obj]
+    mock_session.query.return_value.filter.return_value.group_by.return_value.all.return_value = [result_obj]
 
     tools_handler.get_tool_and_toolkit = MagicMock(return_value={'tool1': 'Toolkit1'})
 
@@ -144,4 +130,26 @@ def test_get_tool_events_by_name_tool_not_found(tools_handler, mock_session):
     with pytest.raises(HTTPException):
         tools_handler.get_tool_events_by_name(tool_name)
         
-    assert mock_session.query().filter_by().first.called
\ No newline at end of file
+    assert mock_session.query().filter_by().first.called
+
+def test_get_tool_events_by_name_lists_each_run_once(tools_handler, mock_session):
+    mock_session.query().filter_by().first.return_value = MagicMock()
+
+    tool_events = []
+    for event_id in (1, 2):
+        tool_event = MagicMock(agent_id=1, id=event_id, created_at=datetime(2023, 6, 1, 12, 0))
+        tool_event.event_property = {'tool_name': 'Tool1', 'agent_execution_id': 7}
+        tool_events.append(tool_event)
+    event_run = MagicMock(agent_id=1, id=3)
+    event_run.event_property = {'tokens_consumed': 10, 'calls': 2, 'name': 'Run', 'agent_execution_id': 7}
+    agent_created = MagicMock(agent_id=1)
+    agent_created.event_property = {'agent_name': 'A1', 'model': 'gpt-4'}
+    mock_session.query().filter().all.side_effect = [tool_events, [event_run], [agent_created], []]
+    mock_session.query().filter().first.return_value = None
+
+    with patch.object(AgentConfiguration, 'get_agent_config_by_key_and_agent_id', return_value=None):
+        result = tools_handler.get_tool_events_by_name('Tool1')
+
+    assert result == [{'created_at': datetime(2023, 6, 1, 12, 0).astimezone(pytz.timezone('GMT')).strftime("%d %B %Y %H:%M"),
+                       'agent_execution_id': 7, 'tokens_consumed': 10, 'calls': 2, 'agent_execution_name': 'Run',
+                       'other_tools': [], 'agent_name': 'A1', 'model': 'gpt-4'}]
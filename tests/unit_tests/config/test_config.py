@@ -0,0 +1,43 @@
+import os
+import timeit
+from unittest.mock import patch
+
+import pytest
+
+from superagi.config import config
+from superagi.config.config import get_config, reload_config
+
+
+@pytest.fixture
+def restore_config():
+    config_instance = config._config_instance
+    yield
+    config._config_instance = config_instance
+
+
+def test_get_config_reads_the_loaded_settings():
+    assert get_config("ENV") == os.environ["ENV"]
+    assert get_config("MISSING_CONFIG_KEY", "default") == "default"
+
+
+def test_settings_are_immutable():
+    with pytest.raises(TypeError):
+        config._config_instance.ENV = "PROD"
+    with pytest.raises(TypeError):
+        config._config_instance.snapshot["ENV"] = "PROD"
+
+
+def test_reload_config_picks_up_environment_changes(restore_config):
+    with patch.dict(os.environ, {"RELOADED_CONFIG_KEY": "1"}):
+        assert get_config("RELOADED_CONFIG_KEY") is None
+        reload_config()
+        assert get_config("RELOADED_CONFIG_KEY") == "1"
+
+
+@pytest.mark.skipif(not os.environ.get("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS to run the benchmarks")
+def test_get_config_benchmark():
+    """Compares a lookup with copying the settings, which get_config used to do on every call."""
+    number = 2000
+    lookup = timeit.timeit(lambda: get_config("ENV"), number=number) / number
+    copy = timeit.timeit(lambda: config._config_instance.dict().get("ENV"), number=number) / number
+    print(f"get_config: {lookup * 1e6:.2f}us per call, settings copy: {copy * 1e6:.2f}us per call")
@@ -218,3 +218,13 @@ def test_create_run_project_not_matching_org(mock_agent_execution, mock_api_key_
 
         assert response.status_code == 404
         assert response.text == '{"detail":"Agent not found"}'
+
+
+def test_get_agent_run_events_agent_not_found(mock_api_key_get):
+    with patch('superagi.helper.auth.db') as mock_auth_db, \
+            patch('superagi.controllers.api.agent.db') as db_mock, \
+            patch('superagi.controllers.api.agent.Agent.get_active_agent_by_id', return_value=None):
+        response = client.get("/v1/agent/1/events", headers={"X-API-Key": mock_api_key_get})
+
+        assert response.status_code == 404
+        assert response.text == '{"detail":"Agent not found"}'
@@ -5,6 +5,8 @@ from fastapi import HTTPException
 from main import app
 from fastapi_sqlalchemy import db
 from superagi.controllers.agent_execution_feed import get_agent_execution_feed
+from superagi.models.agent_execution_feed import AgentExecutionFeed
+from datetime import datetime
 
 @patch('superagi.controllers.agent_execution_feed.db')
 def test_get_agent_execution_feed(mock_query):
@@ -40,4 +42,44 @@ def test_get_agent_execution_feed(mock_query):
     mock_agent_execution = Mock() 
     mock_query.return_value.filter.return_value.first.return_value = mock_agent_execution
     mock_agent_execution_id = 1
-    assert get_agent_execution_feed(mock_agent_execution_id)
\ No newline at end of file
+    assert get_agent_execution_feed(mock_agent_execution_id)
+
+def _feed(feed_id, feed="Feed text", error_message=None):
+    return AgentExecutionFeed(id=feed_id, agent_execution_id=1, agent_id=1, role="user", feed=feed,
+                              error_message=error_message, updated_at=datetime(2023, 1, 1, 0, 0, 0, 1),
+                              created_at=datetime(2023, 1, 1, 0, 0, 0, 1))
+
+
+def test_get_agent_execution_feed_incremental_returns_page_after_cursor():
+    client = TestClient(app)
+    agent_execution = MagicMock(id=1, status="RUNNING", last_shown_error_id=None)
+    with patch('superagi.controllers.agent_execution_feed.db') as mock_db:
+        mock_db.session.query.return_value.filter.return_value.first.return_value = agent_execution
+        mock_db.session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all \
+            .return_value = [_feed(5), _feed(6), _feed(7)]
+        mock_db.session.query.return_value.filter_by.return_value.order_by.return_value.all.return_value = []
+
+        response = client.get("agentexecutionfeeds/get/execution/1/incremental?since_id=4&limit=2")
+
+    assert response.status_code == 200
+    assert [feed["feed"] for feed in response.json()["feeds"]] == ["Feed text", "Feed text"]
+    assert response.json()["last_feed_id"] == 6
+    assert response.json()["has_more"] is True
+    assert response.json()["status"] == "RUNNING"
+
+
+def test_get_agent_execution_feed_incremental_pauses_on_new_error():
+    client = TestClient(app)
+    agent_execution = MagicMock(id=1, status="RUNNING", last_shown_error_id=3)
+    with patch('superagi.controllers.agent_execution_feed.db') as mock_db:
+        mock_db.session.query.return_value.filter.return_value.first.return_value = agent_execution
+        mock_db.session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all \
+            .return_value = [_feed(5, error_message="Rate limited")]
+        mock_db.session.query.return_value.filter_by.return_value.order_by.return_value.all.return_value = []
+
+        response = client.get("agentexecutionfeeds/get/execution/1/incremental?since_id=4")
+
+    assert response.json()["errors"] == "Rate limited"
+    assert response.json()["status"] == "ERROR_PAUSED"
+    assert agent_execution.last_shown_error_id == 5
+    mock_db.session.commit.assert_called_once()
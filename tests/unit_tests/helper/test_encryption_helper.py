@@ -0,0 +1,10 @@
+from superagi.helper.encyption_helper import encrypt_data, decrypt_if_encrypted
+
+
+def test_decrypt_if_encrypted_decrypts_encrypted_values():
+    assert decrypt_if_encrypted(encrypt_data("secret")) == "secret"
+
+
+def test_decrypt_if_encrypted_returns_plain_values():
+    assert decrypt_if_encrypted("plain") == "plain"
+    assert decrypt_if_encrypted(None) is None
@@ -1,6 +1,7 @@
+from unittest.mock import patch
 import unittest
 from datetime import datetime
-from superagi.helper.feed_parser import parse_feed
+from superagi.helper.feed_parser import parse_feed, render_feed_display, is_feed_visible
 from superagi.models.agent_execution_feed import AgentExecutionFeed
 class TestParseFeed(unittest.TestCase):
     def test_parse_feed_system(self):
@@ -13,4 +14,28 @@ class TestParseFeed(unittest.TestCase):
         result = parse_feed(sample_feed)
         
         self.assertEqual(result['feed'], sample_feed.feed, "Incorrect output from parse_feed function for system role")
-        self.assertEqual(result['role'], sample_feed.role, "Incorrect output from parse_feed function for system role")
\ No newline at end of file
+        self.assertEqual(result['role'], sample_feed.role, "Incorrect output from parse_feed function for system role")
+    def test_parse_feed_uses_stored_display_feed(self):
+        sample_feed = AgentExecutionFeed(
+            id=3, agent_execution_id=100, agent_id=200, role="assistant",
+            feed='{"thoughts": {"reasoning": "Search first"}}', display_feed="Thoughts: Search first\n",
+            updated_at=datetime.now()
+        )
+
+        with patch("superagi.helper.feed_parser.json.loads") as loads:
+            result = parse_feed(sample_feed)
+
+        self.assertEqual(result['feed'], "Thoughts: Search first\n")
+        loads.assert_not_called()
+
+    def test_render_feed_display_assistant(self):
+        feed = '{"thoughts": {"reasoning": "Search first", "plan": "- search"}, "tool": {"name": "Search"}}'
+
+        self.assertEqual(render_feed_display("assistant", feed),
+                         "Thoughts: Search first\nPlan: - search\nTool: Search\n")
+        self.assertEqual(render_feed_display("assistant", "not json"), "not json")
+
+    def test_is_feed_visible(self):
+        self.assertFalse(is_feed_visible(""))
+        self.assertFalse(is_feed_visible("The current time and date is Mon Jul 10 12:00:00 2023"))
+        self.assertTrue(is_feed_visible("Tool Search returned: results"))
@@ -0,0 +1,96 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from superagi.helper.html_render_pool import HtmlRenderPool
+
+
+@pytest.fixture
+def renderers():
+    """Replaces the headless browsers with mocks serving the HTML in page["html"]."""
+    created = []
+    page = {"html": "", "status_code": 200}
+
+    def create_renderer():
+        renderer = MagicMock()
+        renderer.pages_rendered = 0
+
+        def get(url, headers=None, timeout=None):
+            response = MagicMock()
+            response.status_code = page["status_code"]
+            response.html.html = page["html"]
+            return response
+
+        def render(response, timeout):
+            renderer.pages_rendered += 1
+            response.html.html = "rendered page text"
+
+        renderer.session.get.side_effect = get
+        renderer.render.side_effect = render
+        created.append(renderer)
+        return renderer
+
+    with patch("superagi.helper.html_render_pool._Renderer", side_effect=create_renderer), \
+            patch("superagi.helper.html_render_pool.asyncio.set_event_loop"):
+        yield created, page
+
+
+def test_static_html_with_enough_text_is_not_rendered(renderers):
+    created, page = renderers
+    page["html"] = "one two three"
+    pool = HtmlRenderPool(size=1, min_static_words=3)
+
+    response, content = pool.fetch("https://example.com", lambda html: html)
+
+    assert content == "one two three"
+    created[0].render.assert_not_called()
+
+
+def test_short_static_html_is_rendered(renderers):
+    created, page = renderers
+    page["html"] = "loading"
+    pool = HtmlRenderPool(size=1, min_static_words=3)
+
+    response, content = pool.fetch("https://example.com", lambda html: html)
+
+    assert content == "rendered page text"
+    created[0].render.assert_called_once()
+
+
+def test_browser_is_reused_and_recycled_after_max_pages(renderers):
+    created, page = renderers
+    page["html"] = "loading"
+    pool = HtmlRenderPool(size=1, max_pages=2, min_static_words=3)
+
+    for _ in range(3):
+        pool.fetch("https://example.com", lambda html: html)
+
+    assert len(created) == 2
+    created[0].close.assert_called_once()
+    created[1].close.assert_not_called()
+
+
+def test_browser_is_replaced_after_a_failed_render(renderers):
+    created, page = renderers
+    page["html"] = "loading"
+    pool = HtmlRenderPool(size=1, min_static_words=3)
+
+    with pytest.raises(TimeoutError):
+        pool.fetch("https://example.com", MagicMock(side_effect=["loading", TimeoutError()]))
+    pool.fetch("https://example.com", lambda html: html)
+
+    assert len(created) == 2
+    created[0].close.assert_called_once()
+
+
+def test_non_200_response_is_not_extracted(renderers):
+    created, page = renderers
+    page["status_code"] = 304
+    extract = MagicMock()
+    pool = HtmlRenderPool(size=1)
+
+    response, content = pool.fetch("https://example.com", extract)
+
+    assert response.status_code == 304
+    assert content is None
+    extract.assert_not_called()
@@ -0,0 +1,29 @@
+import json
+
+import pytest
+
+from superagi.helper.json_stream import iter_json_object_items
+
+
+def _chunks(text, size):
+    data = text.encode("utf-8")
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+def test_items_are_decoded_across_chunk_boundaries(chunk_size):
+    document = {"a": {"id": "1", "embeds": [0.25, -1.5e-3], "text": "naïve — ☃"}, "b": 12345, "c": [], "d": None}
+
+    items = list(iter_json_object_items(_chunks(json.dumps(document, ensure_ascii=False), chunk_size)))
+
+    assert items == list(document.items())
+
+
+def test_empty_object_has_no_items():
+    assert list(iter_json_object_items([b" { } "])) == []
+
+
+@pytest.mark.parametrize("document", ['[1, 2]', '{"a": 1', '{"a" 1}', '{"a": 1 "b": 2}'])
+def test_malformed_documents_raise(document):
+    with pytest.raises(ValueError):
+        list(iter_json_object_items(_chunks(document, 3)))
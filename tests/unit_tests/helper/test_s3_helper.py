@@ -56,6 +56,17 @@ def test_get_json_file(s3helper_object, have_creds, raises):
 
         assert content == "content_of_json"  # Assert we got our mocked JSON content back
 
+def test_iter_json_object_items(s3helper_object):
+    body = MagicMock()
+    body.iter_chunks.return_value = iter([b'{"a": {"id": 1}, ', b'"b": {"id": 2}}'])
+    s3helper_object.s3.get_object = MagicMock(return_value={'Body': body})
+
+    items = list(s3helper_object.iter_json_object_items('path', chunk_size=16))
+
+    s3helper_object.s3.get_object.assert_called_with(Bucket=s3helper_object.bucket_name, Key='path')
+    body.iter_chunks.assert_called_with(16)
+    assert items == [("a", {"id": 1}), ("b", {"id": 2})]
+
 def test_check_file_exists_in_s3(s3helper_object):
     s3helper_object.s3.list_objects_v2 = MagicMock(return_value={})
     assert s3helper_object.check_file_exists_in_s3('path') == False
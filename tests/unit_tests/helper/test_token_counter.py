@@ -52,4 +52,41 @@ def test_count_text_tokens():
     assert TokenCounter.count_text_tokens(text) == 10
 
     text = "What is your name?"
-    assert TokenCounter.count_text_tokens(text) == 9
\ No newline at end of file
+    assert TokenCounter.count_text_tokens(text) == 9
+
+class FakeEncoding:
+    name = "fake_encoding"
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, text):
+        self.encoded.append(text)
+        return text.split()
+
+    def encode_batch(self, texts):
+        return [self.encode(text) for text in texts]
+
+
+def test_count_batch_returns_counts_per_message_and_caches_them():
+    encoding = FakeEncoding()
+    messages = [{'role': 'user', 'content': 'one two three'}, {'role': 'assistant', 'content': 'four five'}]
+
+    with patch('superagi.helper.token_counter._get_encoding', return_value=encoding):
+        assert TokenCounter.count_batch(messages, "gpt-4") == [6, 5]
+        assert TokenCounter.count_batch(messages + ['six'], "gpt-4") == [6, 5, 4]
+        assert TokenCounter.count_message_tokens(messages, "gpt-4") == 14
+
+    assert encoding.encoded == ['one two three', 'four five', 'six']
+
+
+def test_count_batch_uses_stored_token_counts():
+    encoding = FakeEncoding()
+    encoding.name = "cl100k_base"
+    messages = [{'role': 'user', 'content': 'one two three', 'token_count': 10},
+                {'role': 'assistant', 'content': 'four five six seven', 'token_count': None}]
+
+    with patch('superagi.helper.token_counter._get_encoding', return_value=encoding):
+        assert TokenCounter.count_batch(messages, "gpt-4") == [13, 7]
+
+    assert encoding.encoded == ['four five six seven']
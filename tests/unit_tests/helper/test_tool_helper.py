@@ -8,11 +8,14 @@ import pytest
 
 from superagi.helper.tool_helper import (
     parse_github_url,
-    load_module_from_file,
     extract_repo_name,
     get_readme_content_from_code_link, download_tool, handle_tools_import, compare_toolkit, compare_configs,
-    compare_tools
+    compare_tools, sync_toolkits
 )
+from superagi.helper.tool_manifest import load_module_from_file
+from superagi.models.tool import Tool
+from superagi.models.tool_config import ToolConfig
+from superagi.models.toolkit import Toolkit
 
 
 def setup_function():
@@ -186,3 +189,57 @@ def test_compare_toolkit():
         "configs": [{"key": "config_key_2"}]
     }
     assert compare_toolkit(toolkit1, toolkit2)
+
+
+def _manifest():
+    return {"toolkits": [{"name": "Sample Toolkit", "description": "A sample toolkit", "folder_name": "sample",
+                          "class_name": "SampleToolkit",
+                          "tools": [{"name": "Sample Tool", "description": "A sample tool"}],
+                          "configs": [{"key": "SAMPLE_API_KEY", "key_type": None, "is_required": False,
+                                       "is_secret": False}]}],
+            "tools": [{"name": "Sample Tool", "description": "A sample tool", "class_name": "SampleTool",
+                       "folder_name": "sample", "file_name": "sample_toolkit.py"}]}
+
+
+def _session(toolkits, tools, tool_configs):
+    rows = {Toolkit: toolkits, Tool: tools, ToolConfig: tool_configs}
+    session = Mock()
+    session.query.side_effect = lambda model: Mock(**{"filter.return_value.all.return_value": rows[model]})
+    return session
+
+
+def test_sync_toolkits_adds_new_rows():
+    session = _session([], [], [])
+
+    def flush():
+        for call in session.add.call_args_list:
+            call.args[0].id = 3
+    session.flush.side_effect = flush
+
+    with patch("superagi.helper.tool_helper.ToolConfig.invalidate_cache"):
+        sync_toolkits(session, Mock(id=1), _manifest())
+
+    added = [call.args[0] for call in session.add.call_args_list]
+    toolkit, tool, tool_config = added
+    assert (toolkit.name, toolkit.organisation_id, toolkit.show_toolkit) == ("Sample Toolkit", 1, False)
+    assert (tool.name, tool.toolkit_id, tool.class_name, tool.file_name) == \
+           ("Sample Tool", 3, "SampleTool", "sample_toolkit.py")
+    assert (tool_config.toolkit_id, tool_config.key, tool_config.key_type) == (3, "SAMPLE_API_KEY", "string")
+    session.commit.assert_called_once()
+
+
+def test_sync_toolkits_does_not_write_unchanged_rows():
+    toolkit = Toolkit(id=3, name="Sample Toolkit", description="A sample toolkit", show_toolkit=False,
+                      organisation_id=1, tool_code_link=None)
+    tool = Tool(toolkit_id=3, name="Sample Tool", description="A sample tool", folder_name="sample",
+                class_name="SampleTool", file_name="sample_toolkit.py")
+    tool_config = ToolConfig(toolkit_id=3, key="SAMPLE_API_KEY", key_type="string", is_required=False,
+                             is_secret=False)
+    session = _session([toolkit], [tool], [tool_config])
+
+    with patch("superagi.helper.tool_helper.ToolConfig.invalidate_cache") as invalidate_cache:
+        sync_toolkits(session, Mock(id=1), _manifest())
+
+    session.add.assert_not_called()
+    session.delete.assert_not_called()
+    invalidate_cache.assert_not_called()
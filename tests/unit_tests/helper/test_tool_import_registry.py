@@ -0,0 +1,44 @@
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from superagi.helper.tool_import_registry import ToolImportRegistry
+
+
+@pytest.fixture
+def tool_roots(tmp_path, monkeypatch):
+    ToolImportRegistry.reset()
+    builtin = tmp_path / "tools"
+    external = tmp_path / "tools" / "external_tools"
+    (builtin / "search").mkdir(parents=True)
+    (builtin / "search" / "search_tool.py").write_text("class SearchTool:\n    pass\n")
+    (external / "search").mkdir(parents=True)
+    monkeypatch.chdir(tmp_path)
+    with patch("superagi.helper.tool_import_registry.TOOL_PATHS", ["tools", "tools/external_tools"]):
+        yield tmp_path
+    ToolImportRegistry.reset()
+
+
+def test_initialize_adds_tool_folders_to_sys_path_once(tool_roots):
+    path_length = len(sys.path)
+    with patch("superagi.helper.tool_import_registry.importlib.import_module") as import_module:
+        ToolImportRegistry.initialize()
+        ToolImportRegistry.initialize()
+        ToolImportRegistry.reset()
+        ToolImportRegistry.initialize()
+
+    added_paths = sys.path[path_length:]
+    del sys.path[path_length:]
+    assert added_paths.count("tools/search") == 1
+    assert added_paths.count("tools/external_tools/search") == 1
+    import_module.assert_any_call("tools.search.search_tool")
+
+
+def test_get_tool_class_imports_module_once_from_first_root(tool_roots):
+    with patch("superagi.helper.tool_import_registry.importlib.import_module") as import_module:
+        first = ToolImportRegistry.get_tool_class("search", "search_tool", "SearchTool")
+        second = ToolImportRegistry.get_tool_class("search", "search_tool", "SearchTool")
+
+    import_module.assert_called_once_with("tools.search.search_tool")
+    assert first is second
@@ -0,0 +1,119 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from superagi.helper.tool_manifest import ToolManifest
+
+TOOLKIT_FILE = '''
+from superagi.tools.base_tool import BaseTool, BaseToolkit
+
+
+class SampleTool(BaseTool):
+    name: str = "Sample Tool"
+    description: str = "A sample tool"
+
+    def _execute(self):
+        return "done"
+
+
+class SampleToolkit(BaseToolkit):
+    name: str = "Sample Toolkit"
+    description: str = "A sample toolkit"
+
+    def get_tools(self):
+        return [SampleTool()]
+
+    def get_env_keys(self):
+        return ["SAMPLE_API_KEY"]
+'''
+
+
+@pytest.fixture
+def tool_folder(tmp_path):
+    folder = tmp_path / "tools" / "sample"
+    folder.mkdir(parents=True)
+    (folder / "sample_toolkit.py").write_text(TOOLKIT_FILE)
+    ToolManifest.reset()
+    with patch("superagi.helper.tool_manifest.get_config", return_value=str(tmp_path / "manifest.json")):
+        yield tmp_path
+    ToolManifest.reset()
+
+
+def test_scan_reads_toolkits_tools_and_configs(tool_folder):
+    manifest = ToolManifest.scan([str(tool_folder / "tools")])
+
+    toolkit, = manifest["toolkits"]
+    assert (toolkit["name"], toolkit["folder_name"]) == ("Sample Toolkit", "sample")
+    assert toolkit["tools"] == [{"name": "Sample Tool", "description": "A sample tool"}]
+    assert toolkit["configs"] == [{"key": "SAMPLE_API_KEY", "key_type": None, "is_required": False,
+                                   "is_secret": False}]
+    assert manifest["tools"] == [{"class_name": "SampleTool", "name": "Sample Tool", "description": "A sample tool",
+                                  "folder_name": "sample", "file_name": "sample_toolkit.py"}]
+
+
+def test_unchanged_files_are_not_executed_again(tool_folder):
+    manifest = ToolManifest.scan([str(tool_folder / "tools")])
+    # a new process starts from the manifest cached on disk
+    ToolManifest.reset()
+    with patch("superagi.helper.tool_manifest.load_module_from_file") as load_module:
+        assert ToolManifest.scan([str(tool_folder / "tools")]) == manifest
+        # a touched file whose content is the same is not executed either
+        os.utime(tool_folder / "tools" / "sample" / "sample_toolkit.py", ns=(0, 0))
+        assert ToolManifest.scan([str(tool_folder / "tools")]) == manifest
+    load_module.assert_not_called()
+
+
+def test_changed_files_are_read_again(tool_folder):
+    ToolManifest.scan([str(tool_folder / "tools")])
+    (tool_folder / "tools" / "sample" / "sample_toolkit.py").write_text(
+        TOOLKIT_FILE.replace("SAMPLE_API_KEY", "OTHER_API_KEY"))
+
+    manifest = ToolManifest.scan([str(tool_folder / "tools")])
+
+    assert manifest["toolkits"][0]["configs"][0]["key"] == "OTHER_API_KEY"
+
+
+SIBLING_TOOL_FILE = '''
+from superagi.tools.base_tool import BaseTool
+
+
+class SiblingTool(BaseTool):
+    name: str = "Sibling Tool"
+    description: str = "A tool in its own module"
+
+    def _execute(self):
+        return "done"
+'''
+
+SIBLING_TOOLKIT_FILE = '''
+from superagi.tools.base_tool import BaseToolkit
+from sibling_tool import SiblingTool
+
+
+class SiblingToolkit(BaseToolkit):
+    name: str = "Sibling Toolkit"
+    description: str = "A toolkit of a tool in a sibling module"
+
+    def get_tools(self):
+        return [SiblingTool()]
+
+    def get_env_keys(self):
+        return []
+'''
+
+
+def test_toolkit_is_read_again_when_a_sibling_tool_changes(tool_folder):
+    folder = tool_folder / "tools" / "sibling"
+    folder.mkdir()
+    (folder / "sibling_tool.py").write_text(SIBLING_TOOL_FILE)
+    (folder / "sibling_toolkit.py").write_text(SIBLING_TOOLKIT_FILE)
+    ToolManifest.scan([str(tool_folder / "tools")])
+
+    (folder / "sibling_tool.py").write_text(SIBLING_TOOL_FILE.replace("Sibling Tool", "Renamed Sibling Tool"))
+    # a new process starts from the manifest cached on disk
+    ToolManifest.reset()
+    manifest = ToolManifest.scan([str(tool_folder / "tools")])
+
+    toolkit, = [toolkit for toolkit in manifest["toolkits"] if toolkit["name"] == "Sibling Toolkit"]
+    assert toolkit["tools"] == [{"name": "Renamed Sibling Tool", "description": "A tool in its own module"}]
@@ -0,0 +1,95 @@
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from superagi.helper.webpage_cache import WebpageCache, WebpageCacheEntry, DiskWebpageCacheBackend, \
+    RedisWebpageCacheBackend
+from superagi.helper.webpage_extractor import WebpageExtractor
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    WebpageCache.reset()
+    config = {"WEBPAGE_CACHE_BACKEND": "disk", "WEBPAGE_CACHE_DIR": str(tmp_path), "WEBPAGE_CACHE_MAX_ENTRIES": 2,
+              "WEBPAGE_CACHE_TTL": 60}
+    with patch("superagi.helper.webpage_cache.get_config", side_effect=lambda key, default=None: config.get(key, default)):
+        yield config
+    WebpageCache.reset()
+
+
+def _response(status_code, text="", headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = text
+    response.headers = headers or {}
+    return response
+
+
+def test_put_and_get_fresh_entry(disk_cache):
+    WebpageCache.put("bs4", "https://example.com", "page text", {"ETag": '"v1"'})
+
+    entry = WebpageCache.get("bs4", "https://example.com")
+
+    assert entry.text == "page text"
+    assert entry.is_fresh(WebpageCache.ttl())
+    assert entry.conditional_headers() == {"If-None-Match": '"v1"'}
+    assert WebpageCache.get("lxml", "https://example.com") is None
+    assert WebpageCache.get_metrics()["hits"] == 1
+    assert WebpageCache.get_metrics()["misses"] == 1
+
+
+def test_empty_text_is_not_cached(disk_cache):
+    WebpageCache.put("bs4", "https://example.com", "")
+
+    assert WebpageCache.get("bs4", "https://example.com") is None
+
+
+def test_disk_backend_evicts_oldest_entries(tmp_path):
+    backend = DiskWebpageCacheBackend(str(tmp_path), max_entries=2)
+    for index in range(3):
+        backend.put(WebpageCacheEntry(f"webpage_cache:bs4:{index}", f"text {index}"))
+        time.sleep(0.01)
+
+    assert backend.get("webpage_cache:bs4:0") is None
+    assert backend.get("webpage_cache:bs4:2").text == "text 2"
+
+
+def test_redis_backend_evicts_beyond_max_entries():
+    client = MagicMock()
+    client.pipeline.return_value.execute.return_value = [True, 1, 3]
+    client.zpopmin.return_value = [("webpage_cache:bs4:old", 1.0)]
+    with patch("superagi.helper.webpage_cache.RedisPool.get_client", return_value=client):
+        RedisWebpageCacheBackend(max_entries=2).put(WebpageCacheEntry("webpage_cache:bs4:new", "text"))
+
+    client.zpopmin.assert_called_once_with(RedisWebpageCacheBackend.INDEX_KEY, 1)
+    client.delete.assert_called_once_with("webpage_cache:bs4:old")
+
+
+def test_extract_with_bs4_serves_fresh_entry_without_request(disk_cache):
+    html = "<html><body><p>Hello world</p></body></html>"
+    with patch("superagi.helper.webpage_extractor.requests.get", return_value=_response(200, html)) as get:
+        first = WebpageExtractor().extract_with_bs4("https://example.com")
+        second = WebpageExtractor().extract_with_bs4("https://example.com")
+
+    assert first == second == "Hello world"
+    assert get.call_count == 1
+
+
+def test_extract_with_bs4_revalidates_stale_entry(disk_cache):
+    WebpageCache.put("bs4", "https://example.com", "cached text", {"ETag": '"v1"'})
+    disk_cache["WEBPAGE_CACHE_TTL"] = 0
+
+    with patch("superagi.helper.webpage_extractor.requests.get", return_value=_response(304)) as get:
+        content = WebpageExtractor().extract_with_bs4("https://example.com")
+
+    assert content == "cached text"
+    assert get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert WebpageCache.get_metrics()["revalidations"] == 1
+
+
+def test_extract_with_bs4_does_not_cache_errors(disk_cache):
+    with patch("superagi.helper.webpage_extractor.requests.get", return_value=_response(500)):
+        WebpageExtractor().extract_with_bs4("https://example.com")
+
+    assert WebpageCache.get("bs4", "https://example.com") is None
@@ -0,0 +1,56 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from superagi.helper.webpage_fetcher import WebpageFetcher, _HostLimiter
+
+
+@pytest.fixture(autouse=True)
+def host_limiter():
+    limiter = _HostLimiter(max_concurrent=1, min_interval=0)
+    with patch.object(WebpageFetcher, 'host_limiter', limiter):
+        yield limiter
+
+
+def _extractor(pages):
+    extractor = MagicMock()
+    extractor.extract_with_bs4.side_effect = lambda url: pages[url]
+    return extractor
+
+
+def test_fetch_returns_pages_in_url_order():
+    pages = {"https://a.com": "page a", "https://b.com": "page b", "https://c.com": "page c"}
+
+    webpages = WebpageFetcher(_extractor(pages)).fetch(list(pages))
+
+    assert webpages == ["page a", "page b", "page c"]
+
+
+@patch('superagi.helper.webpage_fetcher.time.sleep')
+def test_fetch_retries_empty_pages_with_backoff(mock_sleep):
+    extractor = MagicMock()
+    extractor.extract_with_bs4.side_effect = ["", "", "page a"]
+
+    webpages = WebpageFetcher(extractor, backoff=1.0).fetch(["https://a.com"])
+
+    assert webpages == ["page a"]
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [1.0, 2.0]
+
+
+@patch('superagi.helper.webpage_fetcher.TokenCounter.count_content_tokens', side_effect=lambda text: len(text.split()))
+def test_fetch_stops_once_token_budget_is_filled(mock_count_tokens):
+    pages = {"https://a.com": "one two three", "https://b.com": "four five", "https://c.com": "six"}
+
+    webpages = WebpageFetcher(_extractor(pages)).fetch(list(pages), token_budget=4)
+
+    assert webpages == ["one two three", "four five"]
+
+
+def test_fetch_truncates_pages_to_max_words():
+    pages = {"https://a.com": "one two three four"}
+
+    assert WebpageFetcher(_extractor(pages), max_words=2).fetch(list(pages)) == ["one two"]
+
+
+def test_fetchers_share_the_host_limiter():
+    assert WebpageFetcher(MagicMock()).host_limiter is WebpageFetcher(MagicMock()).host_limiter
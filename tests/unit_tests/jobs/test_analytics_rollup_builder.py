@@ -0,0 +1,81 @@
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from superagi.jobs.analytics_rollup_builder import AnalyticsRollupBuilder
+from superagi.models.agent_analytics_rollup import AgentAnalyticsRollup
+from superagi.models.tool_analytics_rollup import ToolAnalyticsRollup
+
+
+@pytest.fixture
+def mock_session():
+    return MagicMock()
+
+
+@pytest.fixture
+def builder(mock_session):
+    with patch("superagi.jobs.analytics_rollup_builder.get_config", side_effect=lambda key, default=None: default):
+        return AnalyticsRollupBuilder(mock_session)
+
+
+def test_start_day_covers_the_window(builder, mock_session):
+    mock_session.query.return_value.scalar.return_value = date.today()
+
+    assert builder._start_day() == datetime.utcnow().date() - timedelta(days=1)
+
+
+def test_start_day_resumes_from_the_last_rolled_up_day(builder, mock_session):
+    mock_session.query.return_value.scalar.return_value = date(2023, 1, 1)
+
+    assert builder._start_day() == date(2023, 1, 1)
+
+
+def test_first_refresh_starts_from_the_first_event(builder, mock_session):
+    mock_session.query.return_value.scalar.side_effect = [None, datetime(2022, 5, 4, 10, 30)]
+
+    assert builder._start_day() == date(2022, 5, 4)
+
+
+def test_build_agent_rollups(builder, mock_session):
+    day = date(2023, 6, 1)
+    created = [MagicMock(org_id=1, agent_id=10, day=day, agents=1)]
+    runs = [MagicMock(org_id=1, agent_id=10, day=day, runs=2, tokens=150, calls=None),
+            MagicMock(org_id=1, agent_id=11, day=day, runs=1, tokens=20, calls=1)]
+    mock_session.query.return_value.filter.return_value.group_by.return_value.all.side_effect = [created, runs]
+
+    with patch.object(builder, "_fetch_run_times", return_value=[(1, 10, day, 30.0), (1, 10, day, 10.0)]), \
+            patch.object(builder, "_fetch_agents", return_value={10: {"agent_name": "agent", "model": "gpt-4"}}):
+        rollups = builder._build_agent_rollups(datetime(2023, 6, 1))
+
+    # agent 11 has no agent_created event and is left out
+    assert rollups == [{"org_id": 1, "agent_id": 10, "day": day, "agents_created": 1, "runs_completed": 2,
+                        "tokens_consumed": 150, "calls": 0, "run_time_total": 40.0, "timed_runs": 2,
+                        "agent_name": "agent", "model": "gpt-4"}]
+
+
+def test_fetch_run_times_skips_runs_without_run_created(builder, mock_session):
+    ends = [MagicMock(org_id=1, agent_id=10, agent_execution_id="5", end_time=datetime(2023, 6, 1, 12, 1)),
+            MagicMock(org_id=1, agent_id=10, agent_execution_id="6", end_time=datetime(2023, 6, 1, 13, 0))]
+    mock_session.query.return_value.filter.return_value.group_by.return_value.all.side_effect = [
+        ends, [("5", datetime(2023, 6, 1, 12, 0))]]
+
+    assert builder._fetch_run_times(datetime(2023, 6, 1)) == [(1, 10, date(2023, 6, 1), 60.0)]
+
+
+def test_refresh_replaces_the_rollups_since_the_start_day(builder, mock_session):
+    agent_rollup = {"org_id": 1, "agent_id": 10, "day": date(2023, 6, 1)}
+    tool_rollup = {"org_id": 1, "agent_id": 10, "tool_name": "Write File", "day": date(2023, 6, 1), "calls": 3}
+    with patch.object(builder, "_start_day", return_value=date(2023, 6, 1)), \
+            patch.object(builder, "_build_agent_rollups", return_value=[agent_rollup]) as build_agent_rollups, \
+            patch.object(builder, "_build_tool_rollups", return_value=[tool_rollup]):
+        builder.refresh()
+
+    build_agent_rollups.assert_called_once_with(datetime(2023, 6, 1))
+    deleted = [call.args[0] for call in mock_session.query.call_args_list]
+    assert deleted == [AgentAnalyticsRollup, ToolAnalyticsRollup]
+    assert mock_session.query.return_value.filter.return_value.delete.call_count == 2
+    inserted = mock_session.execute.call_args_list
+    assert inserted[0].args[0].table.name == "agent_analytics_rollups"
+    assert inserted[1].args[1][0]["tool_name"] == "Write File"
+    mock_session.commit.assert_called_once()
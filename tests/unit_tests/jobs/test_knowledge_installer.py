@@ -0,0 +1,84 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from superagi.jobs.knowledge_installer import KnowledgeInstaller
+
+
+def _chunk(index):
+    return f"chunk-{index}", {"id": f"id-{index}", "embeds": [0.1], "text": "text", "chunk": index,
+                              "knowledge_name": "knowledge"}
+
+
+@pytest.fixture
+def installer_env():
+    installation = MagicMock(status="PENDING", installed_chunks=0, vector_db_index_id=5, organisation_id=2)
+    installation.knowledge_name = "knowledge"
+    vector_db_storage = MagicMock()
+    with patch("superagi.jobs.knowledge_installer.KnowledgeInstallation") as installation_model, \
+            patch("superagi.jobs.knowledge_installer.Knowledges") as knowledges, \
+            patch("superagi.jobs.knowledge_installer.KnowledgeConfigs") as knowledge_configs, \
+            patch("superagi.jobs.knowledge_installer.VectordbIndices"), \
+            patch("superagi.jobs.knowledge_installer.Vectordbs") as vector_dbs, \
+            patch("superagi.jobs.knowledge_installer.VectordbConfigs"), \
+            patch("superagi.jobs.knowledge_installer.MarketPlaceStats") as marketplace_stats, \
+            patch("superagi.jobs.knowledge_installer.VectorFactory.build_vector_storage",
+                  return_value=vector_db_storage), \
+            patch("superagi.jobs.knowledge_installer.S3Helper") as s3_helper, \
+            patch("superagi.jobs.knowledge_installer.get_config", side_effect=lambda key, default=None: default):
+        installation_model.get_installation.return_value = installation
+        installation_model.claim.return_value = True
+        knowledges.fetch_knowledge_details_marketplace.return_value = {
+            "id": 9, "name": "knowledge", "description": "", "contributed_by": "team"}
+        knowledge_configs.fetch_knowledge_config_details_marketplace.return_value = {"file_path": "path",
+                                                                                     "model": "m"}
+        vector_dbs.get_vector_db_from_id.return_value = MagicMock(db_type="Qdrant")
+        marketplace_stats.get_knowledge_installation_number.return_value = 3
+        s3_helper.return_value.iter_json_object_items.return_value = iter([_chunk(i) for i in range(250)])
+        yield installation, installation_model, vector_db_storage, knowledge_configs
+
+
+def test_chunks_are_upserted_in_batches_and_checkpointed(installer_env):
+    installation, installation_model, vector_db_storage, knowledge_configs = installer_env
+
+    KnowledgeInstaller(MagicMock(), 1).install()
+
+    batch_sizes = sorted(len(call.args[0]["ids"]) for call in vector_db_storage.add_embeddings_to_vector_db.call_args_list)
+    assert batch_sizes == [50, 100, 100]
+    checkpoints = [call.kwargs.get("installed_chunks") for call in installation_model.update_status.call_args_list]
+    assert checkpoints == [100, 200, 250, 250]
+    assert installation_model.update_status.call_args.args[2] == "COMPLETED"
+    # the file path is internal to the marketplace and not stored with the knowledge
+    assert knowledge_configs.add_update_knowledge_config.call_args.args[2] == {"model": "m"}
+
+
+def test_installation_resumes_after_installed_chunks(installer_env):
+    installation, installation_model, vector_db_storage, _ = installer_env
+    installation.installed_chunks = 200
+
+    KnowledgeInstaller(MagicMock(), 1).install()
+
+    upserted_ids, = [call.args[0]["ids"] for call in vector_db_storage.add_embeddings_to_vector_db.call_args_list]
+    assert upserted_ids == [f"id-{i}" for i in range(200, 250)]
+
+
+def test_failed_installation_keeps_its_checkpoint(installer_env):
+    installation, installation_model, vector_db_storage, knowledge_configs = installer_env
+    vector_db_storage.add_embeddings_to_vector_db.side_effect = [None, RuntimeError("vector db down")] + [None] * 5
+
+    with pytest.raises(RuntimeError):
+        KnowledgeInstaller(MagicMock(), 1).install()
+
+    assert installation_model.update_status.call_args.args[2] == "FAILED"
+    assert installation_model.update_status.call_args.kwargs == {"error": "vector db down"}
+    knowledge_configs.add_update_knowledge_config.assert_not_called()
+
+
+def test_running_or_completed_installation_is_not_run_again(installer_env):
+    installation, installation_model, vector_db_storage, _ = installer_env
+    installation_model.claim.return_value = False
+
+    KnowledgeInstaller(MagicMock(), 1).install()
+
+    vector_db_storage.add_embeddings_to_vector_db.assert_not_called()
+    installation_model.update_status.assert_not_called()
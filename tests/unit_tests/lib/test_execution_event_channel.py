@@ -0,0 +1,143 @@
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import redis
+
+from superagi.lib.execution_event_channel import ExecutionEventChannel, SUBSCRIBER_QUEUE_SIZE
+
+
+def _recording_session(organisation_ids):
+    session = MagicMock(info={})
+    session.query.return_value.join.return_value.filter.return_value.all.return_value = organisation_ids
+    return session
+
+
+def test_publish():
+    client = MagicMock()
+    with patch("superagi.lib.execution_event_channel.RedisPool.get_client", return_value=client):
+        ExecutionEventChannel.publish({"event": "status", "organisation_id": 1, "agent_id": 3})
+
+    channel, message = client.publish.call_args.args
+    event = json.loads(message)
+    assert channel == ExecutionEventChannel.CHANNEL
+    assert (event["event"], event["organisation_id"], event["agent_id"]) == ("status", 1, 3)
+    assert "published_at" in event
+
+
+def test_publish_does_not_raise_when_redis_is_down():
+    client = MagicMock()
+    client.publish.side_effect = redis.ConnectionError("down")
+    with patch("superagi.lib.execution_event_channel.RedisPool.get_client", return_value=client):
+        ExecutionEventChannel.publish({"event": "feed", "agent_id": 1, "agent_execution_id": 2, "feed_id": 3})
+
+
+def test_subscribers_receive_dispatched_events():
+    async def listen():
+        await asyncio.sleep(3600)
+
+    async def receive():
+        subscription = ExecutionEventChannel.subscribe(1, keepalive_seconds=0.05)
+        keepalive = await subscription.__anext__()
+        ExecutionEventChannel._dispatch({"event": "status", "organisation_id": 1, "agent_id": 1})
+        event = await subscription.__anext__()
+        await subscription.aclose()
+        ExecutionEventChannel._listener_task.cancel()
+        return keepalive, event
+
+    with patch.object(ExecutionEventChannel, "_listen", side_effect=listen):
+        keepalive, event = asyncio.run(receive())
+
+    assert keepalive is None
+    assert event == {"event": "status", "organisation_id": 1, "agent_id": 1}
+    assert not ExecutionEventChannel._subscribers
+
+
+def test_subscribers_receive_only_their_organisation_and_agent_events():
+    organisation_queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    agent_queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    ExecutionEventChannel._subscribers[organisation_queue] = (1, None)
+    ExecutionEventChannel._subscribers[agent_queue] = (1, 3)
+    try:
+        # more events of other organisations than a queue holds never push out the subscriber's own
+        for _ in range(SUBSCRIBER_QUEUE_SIZE + 1):
+            ExecutionEventChannel._dispatch({"organisation_id": 2, "agent_id": 3})
+        ExecutionEventChannel._dispatch({"organisation_id": 1, "agent_id": 4})
+        ExecutionEventChannel._dispatch({"organisation_id": 1, "agent_id": 3})
+    finally:
+        ExecutionEventChannel._subscribers.pop(organisation_queue)
+        ExecutionEventChannel._subscribers.pop(agent_queue)
+
+    assert [organisation_queue.get_nowait()["agent_id"] for _ in range(organisation_queue.qsize())] == [4, 3]
+    assert agent_queue.qsize() == 1
+    assert agent_queue.get_nowait() == {"organisation_id": 1, "agent_id": 3}
+
+
+def test_slow_subscriber_drops_oldest_event():
+    queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    ExecutionEventChannel._subscribers[queue] = (1, None)
+    try:
+        for index in range(SUBSCRIBER_QUEUE_SIZE + 1):
+            ExecutionEventChannel._dispatch({"organisation_id": 1, "index": index})
+    finally:
+        ExecutionEventChannel._subscribers.pop(queue)
+
+    assert queue.qsize() == SUBSCRIBER_QUEUE_SIZE
+    assert queue.get_nowait() == {"organisation_id": 1, "index": 1}
+
+
+def test_recorded_events_are_published_after_commit():
+    session = _recording_session([(3, 1)])
+    agent_execution = MagicMock(id=None, agent_id=3)
+    with patch.object(ExecutionEventChannel, "publish") as publish:
+        ExecutionEventChannel.record_status_change(session, agent_execution, "RUNNING", "CREATED")
+        # the id of a new execution is assigned by the flush
+        agent_execution.id = 7
+        ExecutionEventChannel.resolve_recorded(session)
+        publish.assert_not_called()
+
+        ExecutionEventChannel.publish_recorded(session)
+
+    publish.assert_called_once_with({"event": "status", "agent_id": 3, "agent_execution_id": 7,
+                                     "status": "RUNNING", "old_status": "CREATED", "organisation_id": 1})
+    assert session.info == {}
+
+
+def test_recorded_events_are_discarded_on_rollback():
+    session = _recording_session([(3, 1)])
+    feed = MagicMock(id=5, agent_id=3, agent_execution_id=7)
+    with patch.object(ExecutionEventChannel, "publish") as publish:
+        ExecutionEventChannel.record_feed(session, feed)
+        ExecutionEventChannel.resolve_recorded(session)
+        ExecutionEventChannel.discard_recorded(session)
+        ExecutionEventChannel.publish_recorded(session)
+
+    publish.assert_not_called()
+
+
+def test_listener_skips_malformed_messages():
+    queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    feed_event = {"event": "feed", "organisation_id": 1, "feed_id": 1}
+    messages = [{"data": "not json"}, {"data": json.dumps(feed_event)}]
+
+    async def get_message(**kwargs):
+        if messages:
+            return messages.pop(0)
+        ExecutionEventChannel._subscribers.pop(queue, None)
+        return None
+
+    async def noop(*args, **kwargs):
+        return None
+
+    pubsub = MagicMock(subscribe=noop, reset=noop, get_message=get_message)
+    client = MagicMock(close=noop)
+    client.pubsub.return_value = pubsub
+    ExecutionEventChannel._subscribers[queue] = (1, None)
+    try:
+        with patch("superagi.lib.execution_event_channel.redis.asyncio.Redis.from_url", return_value=client):
+            asyncio.run(ExecutionEventChannel._listen())
+    finally:
+        ExecutionEventChannel._subscribers.pop(queue, None)
+
+    assert queue.get_nowait() == feed_event
+    assert queue.empty()
@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+import pytest
+
+from superagi.lib.redis_pool import RedisPool
+
+
+@pytest.fixture(autouse=True)
+def reset_pool():
+    RedisPool.reset()
+    yield
+    RedisPool.reset()
+
+
+@patch('superagi.lib.redis_pool.get_config')
+def test_clients_share_one_pool(mock_get_config):
+    mock_get_config.side_effect = lambda key, default=None: {"REDIS_URL": "localhost:6379",
+                                                             "REDIS_POOL_MAX_CONNECTIONS": 5}.get(key, default)
+
+    first_client = RedisPool.get_client()
+    second_client = RedisPool.get_client()
+
+    assert first_client.connection_pool is second_client.connection_pool
+    assert first_client.connection_pool.max_connections == 5
+
+
+@patch('redis.connection.Connection.can_read', return_value=False)
+@patch('redis.connection.Connection.connect')
+def test_get_metrics_counts_connections(mock_connect, mock_can_read):
+    pool = RedisPool.get_pool()
+    connection = pool.get_connection("PING")
+
+    metrics = RedisPool.get_metrics()
+    assert metrics["created_connections"] == 1
+    assert metrics["in_use_connections"] == 1
+
+    pool.release(connection)
+    metrics = RedisPool.get_metrics()
+    assert metrics["in_use_connections"] == 0
+    assert metrics["idle_connections"] == 1
+
+
+def test_get_metrics_without_pool_internals():
+    pool = RedisPool.get_pool()
+
+    with patch.object(pool, "pool", None):
+        metrics = RedisPool.get_metrics()
+
+    assert metrics["max_connections"] == pool.max_connections
+    assert metrics["created_connections"] is None
+    assert metrics["in_use_connections"] is None
@@ -1,9 +1,11 @@
 import pytest
 from unittest.mock import Mock
 
+from superagi.helper.cache_version import CacheVersion
 from superagi.llms.google_palm import GooglePalm
 from superagi.llms.hugging_face import HuggingFace
 from superagi.llms.llm_model_factory import get_model, build_model_with_api_key
+from superagi.llms.llm_registry import LlmRegistry
 from superagi.llms.openai import OpenAi
 from superagi.llms.replicate import Replicate
 
@@ -79,4 +81,48 @@ def test_build_model_with_unknown_provider(capsys):  # capsys is a built-in pyte
     model = build_model_with_api_key('Unknown', 'fake_key')
     assert model is None
     captured = capsys.readouterr()
-    assert "Unknown provider." in captured.out
\ No newline at end of file
+    assert "Unknown provider." in captured.out
+
+def test_get_model_reuses_registered_client(monkeypatch):
+    LlmRegistry.clear()
+    build_model = Mock(side_effect=lambda *args, **kwargs: Mock(spec=OpenAi))
+    monkeypatch.setattr('superagi.llms.llm_model_factory._build_model', build_model)
+    monkeypatch.setattr(CacheVersion, 'fetch', lambda keys: (0,))
+
+    first = get_model(organisation_id=1, api_key='fake_key', model='gpt-4', temperature=0.4)
+    second = get_model(organisation_id=1, api_key='fake_key', model='gpt-4', temperature=0.4)
+    other = get_model(organisation_id=1, api_key='other_key', model='gpt-4', temperature=0.4)
+
+    assert first is second
+    assert other is not first
+    assert build_model.call_count == 2
+    LlmRegistry.clear()
+
+
+def test_get_model_rebuilds_after_invalidation(monkeypatch):
+    LlmRegistry.clear()
+    build_model = Mock(side_effect=lambda *args, **kwargs: Mock(spec=OpenAi))
+    monkeypatch.setattr('superagi.llms.llm_model_factory._build_model', build_model)
+    monkeypatch.setattr(CacheVersion, 'fetch', lambda keys: (0,))
+    monkeypatch.setattr(CacheVersion, 'bump', Mock())
+
+    first = get_model(organisation_id=1, api_key='fake_key', model='gpt-4')
+    LlmRegistry.invalidate(1)
+    second = get_model(organisation_id=1, api_key='fake_key', model='gpt-4')
+
+    assert first is not second
+    CacheVersion.bump.assert_called_once_with(LlmRegistry.version_key(1))
+    LlmRegistry.clear()
+
+
+def test_get_model_does_not_register_without_version(monkeypatch):
+    LlmRegistry.clear()
+    build_model = Mock(side_effect=lambda *args, **kwargs: Mock(spec=OpenAi))
+    monkeypatch.setattr('superagi.llms.llm_model_factory._build_model', build_model)
+    monkeypatch.setattr(CacheVersion, 'fetch', lambda keys: None)
+
+    get_model(organisation_id=1, api_key='fake_key', model='gpt-4')
+    get_model(organisation_id=1, api_key='fake_key', model='gpt-4')
+
+    assert build_model.call_count == 2
+    LlmRegistry.clear()
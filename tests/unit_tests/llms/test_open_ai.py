@@ -24,6 +24,7 @@ def test_chat_completion(mock_openai):
     # Assert
     assert result == {"response": mock_chat_response, "content": "I'm here to help!"}
     mock_openai.ChatCompletion.create.assert_called_once_with(
+        api_key=api_key,
         n=openai_instance.number_of_results,
         model=model,
         messages=messages,
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock, create_autospec
+from unittest.mock import Mock, create_autospec, patch
 from sqlalchemy.orm import Session
 from superagi.models.agent_execution_feed import AgentExecutionFeed
 
@@ -25,3 +25,91 @@ def test_get_last_tool_response_with_tool_name():
 
     result = AgentExecutionFeed.get_last_tool_response(mock_session, 2, "test2")
     assert result == agent_execution_feed_2.feed
+
+
+def _feed_row(feed_id, token_count):
+    return Mock(id=feed_id, role='assistant', feed='feed', token_count=token_count)
+
+
+@patch('superagi.models.agent_execution_feed.AgentExecution.find_by_id')
+def test_fetch_agent_execution_feeds_window_stops_when_budget_is_full(mock_find_by_id):
+    mock_find_by_id.return_value = Mock(current_feed_group_id="GROUP_1")
+    mock_session = Mock()
+    query = mock_session.query.return_value
+    query.filter.return_value = query
+    query.order_by.return_value = query
+    query.limit.return_value = query
+    query.all.side_effect = [[_feed_row(6, 30), _feed_row(5, 30)],
+                             [_feed_row(4, 30), _feed_row(3, None)],
+                             [_feed_row(2, 30), _feed_row(1, 30)]]
+
+    result = AgentExecutionFeed.fetch_agent_execution_feeds_window(mock_session, 2, token_budget=80,
+                                                                   after_feed_id=0, page_size=2)
+
+    assert [agent_feed.id for agent_feed in result] == [3, 4, 5, 6]
+    assert query.all.call_count == 2
+
+
+@patch('superagi.models.agent_execution_feed.AgentExecution.find_by_id')
+def test_fetch_agent_execution_feeds_range_stops_when_budget_is_full(mock_find_by_id):
+    mock_find_by_id.return_value = Mock(current_feed_group_id="GROUP_1")
+    mock_session = Mock()
+    query = mock_session.query.return_value
+    query.filter.return_value = query
+    query.order_by.return_value = query
+    query.limit.return_value = query
+    query.all.side_effect = [[_feed_row(3, 30), _feed_row(4, None)],
+                             [_feed_row(5, 30), _feed_row(6, 30)],
+                             [_feed_row(7, 30)]]
+
+    result = AgentExecutionFeed.fetch_agent_execution_feeds_range(mock_session, 2, after_feed_id=2,
+                                                                  before_feed_id=10, token_budget=80, page_size=2)
+
+    assert [agent_feed.id for agent_feed in result] == [3, 4, 5]
+    assert query.all.call_count == 2
+
+
+@patch('superagi.models.agent_execution_feed.AgentExecution.find_by_id')
+def test_fetch_agent_execution_feeds_range_reads_one_feed_over_budget(mock_find_by_id):
+    mock_find_by_id.return_value = Mock(current_feed_group_id="GROUP_1")
+    mock_session = Mock()
+    query = mock_session.query.return_value
+    query.filter.return_value = query
+    query.order_by.return_value = query
+    query.limit.return_value = query
+    query.all.return_value = [_feed_row(3, 500), _feed_row(4, 30)]
+
+    result = AgentExecutionFeed.fetch_agent_execution_feeds_range(mock_session, 2, after_feed_id=2,
+                                                                  before_feed_id=10, token_budget=80)
+
+    assert [agent_feed.id for agent_feed in result] == [3]
+
+
+@patch('superagi.models.agent_execution_feed.AgentExecution.find_by_id')
+def test_has_agent_feeds_skips_the_prompt_feeds(mock_find_by_id):
+    mock_find_by_id.return_value = Mock(current_feed_group_id="DEFAULT")
+    mock_session = Mock()
+    query = mock_session.query.return_value
+    query.filter.return_value = query
+    query.order_by.return_value = query
+    query.limit.return_value = query
+    query.all.return_value = [Mock(id=1), Mock(id=2)]
+    query.first.return_value = None
+
+    assert AgentExecutionFeed.has_agent_feeds(mock_session, 2) is False
+
+    query.first.return_value = Mock(id=3)
+    assert AgentExecutionFeed.has_agent_feeds(mock_session, 2) is True
+
+
+def test_display_feed_is_rendered_when_written():
+    from superagi.models.agent_execution_feed import render_agent_execution_feed
+    assistant_feed = AgentExecutionFeed(role="assistant", feed='{"thoughts": {"reasoning": "Plan ahead"}}')
+    time_feed = AgentExecutionFeed(role="user", feed="The current time and date is Mon Jul 10 12:00:00 2023")
+
+    render_agent_execution_feed(None, None, assistant_feed)
+    render_agent_execution_feed(None, None, time_feed)
+
+    assert assistant_feed.display_feed == "Thoughts: Plan ahead\n"
+    assert assistant_feed.is_visible is True
+    assert time_feed.is_visible is False
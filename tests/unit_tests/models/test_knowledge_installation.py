@@ -0,0 +1,16 @@
+from unittest.mock import MagicMock
+
+from superagi.models.knowledge_installation import KnowledgeInstallation
+
+
+def test_claim_updates_only_pending_or_failed_installations():
+    session = MagicMock()
+    update = session.query.return_value.filter.return_value.update
+
+    update.return_value = 1
+    assert KnowledgeInstallation.claim(session, 1) is True
+    assert update.call_args.args[0] == {"status": "RUNNING", "error": None}
+
+    update.return_value = 0
+    assert KnowledgeInstallation.claim(session, 1) is False
+    assert session.commit.call_count == 2
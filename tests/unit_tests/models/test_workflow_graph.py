@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from superagi.models.workflows.agent_workflow_step import AgentWorkflowStep
+from superagi.models.workflows.iteration_workflow import IterationWorkflow
+from superagi.models.workflows.iteration_workflow_step import IterationWorkflowStep
+from superagi.models.workflows.workflow_graph import WorkflowGraph
+
+
+def _rows():
+    steps = [
+        AgentWorkflowStep(id=1, agent_workflow_id=7, unique_id="7_step1", action_type="ITERATION_WORKFLOW",
+                          action_reference_id=3, step_type="TRIGGER",
+                          next_steps=[{"step_response": "YES", "step_id": "7_step2"},
+                                      {"step_response": "COMPLETE", "step_id": "-1"},
+                                      {"step_response": "default", "step_id": "7_step1"}]),
+        AgentWorkflowStep(id=2, agent_workflow_id=7, unique_id="7_step2", action_type="TOOL", step_type="NORMAL",
+                          next_steps=[]),
+    ]
+    iteration_workflows = [IterationWorkflow(id=3, name="Goal Based Agent-I", has_task_queue=False)]
+    iteration_steps = [IterationWorkflowStep(id=4, iteration_workflow_id=3, unique_id="gb1", step_type="TRIGGER",
+                                             next_step_id=-1)]
+    return {AgentWorkflowStep: steps, IterationWorkflow: iteration_workflows, IterationWorkflowStep: iteration_steps}
+
+
+@pytest.fixture
+def session():
+    rows = _rows()
+    session = MagicMock()
+    session.query.side_effect = lambda model: MagicMock(**{"order_by.return_value.all.return_value": rows[model]})
+    WorkflowGraph.clear()
+    yield session
+    WorkflowGraph.clear()
+
+
+def test_transitions_follow_the_step_responses(session):
+    graph = WorkflowGraph._compile(session)
+
+    assert graph.next_step(1, "yes").unique_id == "7_step2"
+    assert graph.next_step(1, "COMPLETE") == "COMPLETE"
+    assert graph.next_step(1, "unknown").unique_id == "7_step1"
+    assert graph.next_step(2, "YES") is None
+    assert graph.default_next_step(1).unique_id == "7_step1"
+    assert graph.iteration_trigger_step(3).unique_id == "gb1"
+
+
+def test_lookups_return_copies(session):
+    graph = WorkflowGraph._compile(session)
+
+    step = graph.step(1)
+    step.next_steps.append({"step_response": "NO", "step_id": "7_step2"})
+
+    assert graph.step(1) is not step
+    assert len(graph.step(1).next_steps) == 3
+
+
+def test_graph_is_reused_until_invalidated(session):
+    with patch("superagi.models.workflows.workflow_graph.CacheVersion.fetch", return_value=(1,)) as fetch:
+        next_step = WorkflowGraph.fetch(session).next_step(1, "YES")
+        workflow_step = AgentWorkflowStep.find_by_id(session, 1)
+        iteration_workflow = IterationWorkflow.find_by_id(session, 3)
+        iteration_step = IterationWorkflowStep.find_by_id(session, 4)
+        queries = session.query.call_count
+        fetch.return_value = (2,)
+        AgentWorkflowStep.find_by_id(session, 2)
+
+    assert (next_step.id, workflow_step.id, iteration_workflow.id, iteration_step.id) == (2, 1, 3, 4)
+    assert queries == 3
+    assert session.query.call_count == 6
+
+
+def test_database_is_used_without_cache_version(session):
+    session.query.side_effect = None
+    session.query.return_value.filter.return_value.first.return_value = "db step"
+    with patch("superagi.models.workflows.workflow_graph.CacheVersion.fetch", return_value=None):
+        assert AgentWorkflowStep.find_by_id(session, 1) == "db step"
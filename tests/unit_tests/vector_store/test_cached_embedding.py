@@ -0,0 +1,68 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from superagi.vector_store.embedding.cached import CachedEmbedding
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    CachedEmbedding.clear()
+    yield
+    CachedEmbedding.clear()
+
+
+def test_get_embedding_is_cached_per_text():
+    embedding_model = MagicMock(model="test-model")
+    embedding_model.get_embedding.side_effect = lambda text: [float(len(text)), 0.5]
+    cached_embedding = CachedEmbedding(embedding_model)
+
+    assert cached_embedding.get_embedding("hello") == [5.0, 0.5]
+    assert CachedEmbedding.wrap(embedding_model).get_embedding("hello") == [5.0, 0.5]
+    assert cached_embedding.get_embedding("hi") == [2.0, 0.5]
+
+    assert embedding_model.get_embedding.call_count == 2
+
+
+def test_get_embedding_does_not_cache_errors():
+    embedding_model = MagicMock(model="test-model")
+    embedding_model.get_embedding.return_value = {"error": Exception("rate limited")}
+    cached_embedding = CachedEmbedding(embedding_model)
+
+    cached_embedding.get_embedding("hello")
+    cached_embedding.get_embedding("hello")
+
+    assert embedding_model.get_embedding.call_count == 2
+
+
+def test_get_dimension_is_memoized_per_model():
+    embedding_model = MagicMock(model="test-model")
+    embedding_model.get_embedding.return_value = [0.1, 0.2, 0.3]
+
+    assert CachedEmbedding(embedding_model).get_dimension() == 3
+    assert CachedEmbedding(embedding_model).get_dimension() == 3
+
+    embedding_model.get_embedding.assert_called_once_with("sample")
+
+
+@patch('superagi.vector_store.embedding.cached.get_config', return_value=60)
+def test_get_embedding_uses_redis_tier(mock_get_config):
+    embedding_model = MagicMock(model="test-model")
+    mock_db = MagicMock()
+    mock_db.get.return_value = "[0.1, 0.2]"
+
+    with patch.object(CachedEmbedding, '_get_db', return_value=mock_db):
+        assert CachedEmbedding(embedding_model).get_embedding("hello") == [0.1, 0.2]
+
+    embedding_model.get_embedding.assert_not_called()
+
+
+def test_get_embeddings_only_sends_uncached_texts():
+    embedding_model = MagicMock(model="test-model")
+    embedding_model.get_embedding.return_value = [1.0]
+    embedding_model.get_embeddings.side_effect = lambda texts, batch_size=None: [[float(len(text))] for text in texts]
+    cached_embedding = CachedEmbedding(embedding_model)
+    cached_embedding.get_embedding("hello")
+
+    assert cached_embedding.get_embeddings(["hello", "hi", "hey"]) == [[1.0], [2.0], [3.0]]
+    embedding_model.get_embeddings.assert_called_once_with(["hi", "hey"], batch_size=None)
@@ -0,0 +1,38 @@
+from unittest.mock import patch
+
+from superagi.vector_store.embedding import openai as openai_embedding
+from superagi.vector_store.embedding.openai import OpenAiEmbedding
+
+
+def _embedding_response(input, **kwargs):
+    # the endpoint does not guarantee the order of the returned items
+    return {'data': [{'index': index, 'embedding': [float(len(text))]}
+                     for index, text in reversed(list(enumerate(input)))]}
+
+
+@patch('superagi.vector_store.embedding.openai.TokenCounter.count_content_tokens', side_effect=lambda text: len(text))
+@patch('openai.Embedding.create', side_effect=_embedding_response)
+def test_get_embeddings_batches_requests(mock_create, mock_count_tokens):
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    embeddings = OpenAiEmbedding(api_key="key").get_embeddings(texts, batch_size=2)
+
+    assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert sorted(len(call.kwargs['input']) for call in mock_create.call_args_list) == [1, 2, 2]
+
+
+@patch('superagi.vector_store.embedding.openai.TokenCounter.count_content_tokens', side_effect=lambda text: len(text))
+@patch('openai.Embedding.create', side_effect=_embedding_response)
+def test_get_embeddings_splits_batches_by_tokens(mock_create, mock_count_tokens):
+    with patch.object(openai_embedding, 'EMBEDDING_BATCH_TOKEN_LIMIT', 5):
+        embeddings = OpenAiEmbedding(api_key="key").get_embeddings(["aaa", "bbb", "cc"])
+
+    assert embeddings == [[3.0], [3.0], [2.0]]
+    assert sorted(call.kwargs['input'] for call in mock_create.call_args_list) == [["aaa"], ["bbb", "cc"]]
+
+
+@patch('openai.Embedding.create', side_effect=Exception("rate limited"))
+def test_get_embeddings_returns_errors_for_failed_batches(mock_create):
+    embeddings = OpenAiEmbedding(api_key="key").get_embeddings(["text"])
+
+    assert "error" in embeddings[0]
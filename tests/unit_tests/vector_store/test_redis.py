@@ -14,6 +14,7 @@ def test_add_texts(redis_mock):
     # Arrange
     mock_index = "mock_index"
     mock_embedding_model = MagicMock()
+    mock_embedding_model.get_embeddings.return_value = [[0.1, 0.2], [0.3, 0.4]]
     redis_object = Redis(mock_index, mock_embedding_model)
     redis_object.build_redis_key = MagicMock(return_value="mock_key")
     texts = ["Hello", "World"]